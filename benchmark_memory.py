@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Report the peak RSS of each training pipeline stage, with the strategies copying their
+input (the default) and working in place (copy=False).
+
+Each mode runs in a fresh process. Before every stage the process' peak RSS (VmHWM) is
+reset through /proc/self/clear_refs, so the reported peak belongs to that stage alone.
+Linux only.
+"""
+
+import logging
+import multiprocessing
+
+import click
+import pandas as pd
+from src.ames_schema import AMES_DTYPES, MODEL_COLUMNS
+from src.feature_engineering import LogTransformation, StandardScaling
+from src.handle_missing_values import FillMissingValuesStrategy
+from src.ingest_data import ZipDataIngestor
+from src.outlier_detection import OutlierDetector, ZScoreOutlierDetection
+
+MB = 1024 * 1024
+
+
+def rss_kb(field: str) -> int:
+    """Reads a memory field (VmRSS or VmHWM) of this process from /proc/self/status, in kB."""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+    raise RuntimeError(f"{field} is not reported in /proc/self/status.")
+
+
+def reset_peak_rss():
+    """Resets VmHWM to the current RSS (Linux 4.0+)."""
+    with open("/proc/self/clear_refs", "w") as f:
+        f.write("5")
+
+
+def profile_stages(data: str, scale: int, copy: bool) -> list:
+    """
+    Runs the training pipeline's preprocessing stages on the Ames data scaled up `scale` times,
+    holding only the current stage's input like the pipeline does.
+
+    Returns:
+    list: (stage, frame MB, RSS MB before, peak RSS MB) per stage.
+    """
+    logging.disable(logging.INFO)
+    df = ZipDataIngestor(columns=MODEL_COLUMNS, schema=AMES_DTYPES).ingest(data)
+    df = pd.concat([df] * scale, ignore_index=True).copy()
+
+    def missing_values(df):
+        return FillMissingValuesStrategy(method="mean", copy=copy).handle(df)
+
+    def outliers(df):
+        return OutlierDetector(ZScoreOutlierDetection(threshold=3)).handle_outliers(
+            df, method="remove", copy=copy, columns=df.select_dtypes(include="number").columns
+        )
+
+    def log_transform(df):
+        return LogTransformation(["SalePrice"], copy=copy).apply_transformation(df)
+
+    def standard_scaling(df):
+        return StandardScaling(["Gr Liv Area", "Lot Area"], copy=copy).apply_transformation(df)
+
+    stages = [missing_values, outliers, log_transform, standard_scaling]
+    results = []
+    for stage in stages:
+        frame_mb = df.memory_usage(deep=True).sum() / MB
+        before = rss_kb("VmRSS")
+        reset_peak_rss()
+        df = stage(df)
+        results.append((stage.__name__, frame_mb, before / 1024, rss_kb("VmHWM") / 1024))
+    return results
+
+
+@click.command()
+@click.option("--data", default="data/AmesHousing.csv", help="CSV file to benchmark on.")
+@click.option("--scale", default=100, help="How many times to replicate the data.")
+def main(data: str, scale: int):
+    context = multiprocessing.get_context("spawn")
+    for copy in [True, False]:
+        with context.Pool(1) as pool:
+            results = pool.apply(profile_stages, (data, scale, copy))
+
+        print(f"\ncopy={copy}")
+        print(f"{'stage':<18}{'input (MB)':>12}{'RSS before (MB)':>17}{'peak (MB)':>11}{'growth (MB)':>13}")
+        for stage, frame_mb, before, peak in results:
+            print(f"{stage:<18}{frame_mb:>12.1f}{before:>17.1f}{peak:>11.1f}{peak - before:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+"""
+Compare the multivariate outlier strategies against the per-column z-score pass of
+outlier_detection_step: rows kept and runtime, on the numeric Ames columns scaled up.
+"""
+
+import logging
+import time
+
+import click
+import pandas as pd
+from src.ames_schema import AMES_DTYPES, MODEL_COLUMNS
+from src.handle_missing_values import FillMissingValuesStrategy
+from src.ingest_data import ZipDataIngestor
+from src.multivariate_outlier_detection import (
+    IsolationForestOutlierDetection,
+    RobustCovarianceOutlierDetection,
+)
+from src.outlier_detection import OutlierDetector, ZScoreOutlierDetection
+
+
+@click.command()
+@click.option("--data", default="data/AmesHousing.csv", help="CSV file to benchmark on.")
+@click.option("--scale", default=100, help="How many times to replicate the data.")
+@click.option("--n-jobs", default=-1, help="Worker processes of the multivariate strategies.")
+def main(data: str, scale: int, n_jobs: int):
+    logging.disable(logging.INFO)
+    df = ZipDataIngestor(columns=MODEL_COLUMNS, schema=AMES_DTYPES).ingest(data)
+    df = FillMissingValuesStrategy(method="mean").handle(df)
+    df = pd.concat([df] * scale, ignore_index=True).copy()
+    print(f"{df.shape[0]:,} rows x {df.shape[1]} columns")
+
+    strategies = [
+        ("zscore", ZScoreOutlierDetection(threshold=3)),
+        ("isolation_forest", IsolationForestOutlierDetection(n_jobs=n_jobs)),
+        ("robust_covariance", RobustCovarianceOutlierDetection(n_jobs=n_jobs)),
+    ]
+    print(f"{'strategy':<20}{'rows kept':>12}{'kept (%)':>10}{'time (s)':>10}")
+    for name, strategy in strategies:
+        start = time.perf_counter()
+        cleaned = OutlierDetector(strategy).handle_outliers(df, method="remove")
+        elapsed = time.perf_counter() - start
+        print(f"{name:<20}{len(cleaned):>12,}{100 * len(cleaned) / len(df):>10.1f}{elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+import click
+from src.ingest_data import convert_to_parquet
+
+
+@click.command()
+@click.option("--input", "input_path", default="data/archive.zip", help="ZIP or CSV file to convert.")
+@click.option("--output", "output_dir", default="data/ames_parquet", help="Output dataset directory.")
+@click.option(
+    "--partition-col",
+    "partition_cols",
+    multiple=True,
+    default=["Yr Sold"],
+    help="Column to partition the dataset by (repeatable).",
+)
+def main(input_path: str, output_dir: str, partition_cols: tuple):
+    """
+    Convert the Ames CSV/ZIP into a partitioned Parquet dataset, once.
+
+    Point the training pipeline at the output directory to skip CSV parsing on every run.
+    """
+    convert_to_parquet(input_path, output_dir, partition_cols=list(partition_cols))
+    print(f"✓ Parquet dataset written to {output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# Import necessary libraries
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+from src.model_building import IncrementalSGDStrategy
+
+# Load the dataset
+data_path = "data/AmesHousing.csv"
+df = pd.read_csv(data_path)
+X, y = df.drop(columns=["SalePrice"]), np.log(df["SalePrice"])
+
+
+def stream(chunksize=250, interrupt_after=None):
+    """Yields (X, y) chunks, raising like a killed job after `interrupt_after` chunks."""
+    for n_chunks, start in enumerate(range(0, len(X), chunksize), start=1):
+        if n_chunks == interrupt_after:
+            raise KeyboardInterrupt
+        yield X.iloc[start : start + chunksize], y.iloc[start : start + chunksize]
+
+
+def coefficients(pipeline):
+    model = pipeline.named_steps["model"]
+    return np.append(model.coef_, model.intercept_)
+
+
+with tempfile.TemporaryDirectory() as checkpoint_dir:
+    checkpoint_path = os.path.join(checkpoint_dir, "checkpoint.joblib")
+
+    # Step 1: An uninterrupted run
+    uninterrupted = IncrementalSGDStrategy(checkpoint_path=None).train_chunks(stream())
+
+    # Step 2: A run killed between checkpoints, then resumed on the replayed stream
+    # The chunk after the last checkpoint is trained again, so the result is identical
+    strategy = IncrementalSGDStrategy(checkpoint_path=checkpoint_path, checkpoint_every=3)
+    try:
+        strategy.train_chunks(stream(interrupt_after=8))
+    except KeyboardInterrupt:
+        pass
+    resumed = strategy.train_chunks(stream())
+    assert np.abs(coefficients(resumed) - coefficients(uninterrupted)).max() == 0.0
+
+    # Step 3: A completed checkpoint is the start of the next run, which trains on every chunk
+    continued = strategy.train_chunks(stream())
+    assert np.abs(coefficients(continued) - coefficients(resumed)).max() > 0.0
+    restarted = strategy.train_chunks(stream(), resume=False)
+    assert np.abs(coefficients(restarted) - coefficients(uninterrupted)).max() == 0.0
+print("Resumed incremental training matches an uninterrupted run.")
@@ -0,0 +1,40 @@
+# Import necessary libraries
+import glob
+import json
+import os
+import tempfile
+
+import pandas as pd
+from src.ingest_data import ZipDataIngestor
+from src.ingestion_cache import CachedDataIngestor, IngestionCache
+
+# Load the dataset
+data_path = "data/AmesHousing.csv"
+
+with tempfile.TemporaryDirectory() as cache_dir:
+    cache = IngestionCache(cache_dir)
+
+    # Step 1: Parallelism settings change how the file is read, not what comes out, so they share one entry
+    serial = CachedDataIngestor(ZipDataIngestor(), cache).ingest(data_path)
+    for options in ({"max_workers": 2, "use_mmap": True}, {"max_workers": 4}):
+        pd.testing.assert_frame_equal(CachedDataIngestor(ZipDataIngestor(**options), cache).ingest(data_path), serial)
+    assert len(glob.glob(os.path.join(cache_dir, "*.feather"))) == 1
+
+    # Step 2: Options that change the result get their own entry
+    CachedDataIngestor(ZipDataIngestor(columns=["SalePrice"]), cache).ingest(data_path)
+    assert len(glob.glob(os.path.join(cache_dir, "*.feather"))) == 2
+
+with tempfile.TemporaryDirectory() as data_dir:
+    # Step 3: Evicted entries are pruned from the hash index along with their inputs' digests
+    cache = IngestionCache(os.path.join(data_dir, "cache"), max_bytes=1)
+    for year in (2006, 2007, 2008):
+        shard_path = os.path.join(data_dir, f"sales_{year}.csv")
+        df = pd.read_csv(data_path)
+        df[df["Yr Sold"] == year].to_csv(shard_path, index=False)
+        CachedDataIngestor(ZipDataIngestor(), cache).ingest(shard_path)
+    with open(os.path.join(cache.cache_dir, IngestionCache.HASH_INDEX)) as f:
+        index = json.load(f)
+    assert len(glob.glob(os.path.join(cache.cache_dir, "*.feather"))) == 1
+    assert len(index["entries"]) == 1 and len(index["digests"]) == 1
+    assert next(iter(index["digests"])).startswith(os.path.abspath(shard_path))
+print("The ingestion cache keys on the parsed result and prunes evicted entries.")
@@ -0,0 +1,24 @@
+# Import necessary libraries
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import HistGradientBoostingRegressor
+from src.model_building import CrossValidatedSearchStrategy
+
+# Load the dataset with all of its numerical and categorical columns
+data_path = "data/AmesHousing.csv"
+df = pd.read_csv(data_path)
+X, y = df.drop(columns=["SalePrice", "Order", "PID"]), np.log(df["SalePrice"])
+
+# Step 1: The default search runs end to end, and its refitted winner predicts
+strategy = CrossValidatedSearchStrategy(n_jobs=2)
+pipeline = strategy.build_and_train_model(X, y)
+assert len(strategy.cv_results_) == 11
+assert np.isfinite(pipeline.predict(X)).all()
+
+# Step 2: A winner without sparse support is refitted on the dense preprocessor output
+# The one-hot encoded Ames frame is sparse enough for the preprocessor to return CSR by default
+candidates = [("hist_gradient_boosting", HistGradientBoostingRegressor(max_iter=20, random_state=42), {})]
+pipeline = CrossValidatedSearchStrategy(candidates=candidates, n_jobs=2).build_and_train_model(X, y)
+assert pipeline.named_steps["preprocessor"].sparse_threshold == 0
+assert np.isfinite(pipeline.predict(X)).all()
+print("Cross-validated search refits its best model on the full Ames frame.")
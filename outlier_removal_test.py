@@ -0,0 +1,44 @@
+# Import necessary libraries
+import os
+import tempfile
+
+import pandas as pd
+from src.ames_schema import AMES_DTYPES
+from src.outlier_detection import OutlierDetector, ZScoreOutlierDetection
+
+# Load the dataset with its categorical columns, as a caller passing extra columns would
+data_path = "data/AmesHousing.csv"
+df = pd.read_csv(data_path, dtype=AMES_DTYPES)
+numeric_columns = df.select_dtypes(include="number").columns
+other_columns = df.columns.difference(numeric_columns, sort=False)
+outlier_detector = OutlierDetector(ZScoreOutlierDetection(threshold=3))
+
+# Step 1: Removal keeps every column and drops the same rows as detection on the numeric frame
+numeric_only = outlier_detector.handle_outliers(df[numeric_columns], method="remove")
+for copy in (True, False):
+    cleaned = outlier_detector.handle_outliers(df.copy(), method="remove", copy=copy, columns=numeric_columns)
+    assert list(cleaned.columns) == list(df.columns)
+    pd.testing.assert_index_equal(cleaned.index, numeric_only.index)
+    pd.testing.assert_frame_equal(cleaned[numeric_columns], numeric_only)
+    pd.testing.assert_series_equal(cleaned.dtypes, df.dtypes)
+    pd.testing.assert_frame_equal(cleaned[other_columns], df.loc[cleaned.index, other_columns])
+
+# Step 2: Removal selects rows by position, so an outlier never takes an inlier sharing its label along
+duplicated = df.set_index(df.index % 100)
+expected = duplicated[~outlier_detector.detect_outlier_rows(duplicated[numeric_columns])]
+assert len(expected) < len(df)
+for copy in (True, False):
+    cleaned = outlier_detector.handle_outliers(duplicated.copy(), method="remove", copy=copy, columns=numeric_columns)
+    pd.testing.assert_frame_equal(cleaned, expected)
+
+# Step 3: Capping clips the numeric columns only and leaves the others untouched
+capped = outlier_detector.handle_outliers(df, method="cap", columns=numeric_columns)
+assert len(capped) == len(df)
+pd.testing.assert_frame_equal(capped[other_columns], df[other_columns])
+
+# Step 4: Visualization renders the boxplots headless to PNG files instead of showing them
+with tempfile.TemporaryDirectory() as output_dir:
+    paths = outlier_detector.visualize_outliers(df, ["SalePrice", "Gr Liv Area"], output_dir=output_dir, plots_per_file=1)
+    assert [os.path.basename(path) for path in paths] == ["SalePrice_boxplot.png", "Gr Liv Area_boxplot.png"]
+    assert all(os.path.getsize(path) for path in paths)
+print("Outlier handling keeps the non-numeric columns.")
@@ -3,7 +3,7 @@ import os
 from pipelines.training_pipeline import ml_pipeline
 from zenml import Model
 from steps.dynamic_importer import dynamic_importer
-from steps.model_loader import model_loader
+from steps.model_loader import model_artifact_loader, model_loader
 from steps.prediction_service_loader import prediction_service_loader
 from steps.predictor import predictor
 from zenml import pipeline
@@ -42,5 +42,20 @@ def inference_pipeline():
         step_name="mlflow_model_deployer_step",
     )
 
+    # Load the imputer fill values fitted during training
+    fill_values = model_artifact_loader(
+        model_name="price_predictor", artifact_name="imputer_fill_values"
+    )
+
+    # Load the feature engineering state fitted during training
+    feature_engineering_state = model_artifact_loader(
+        model_name="price_predictor", artifact_name="feature_engineering_state"
+    )
+
     # Run predictions on the batch data
-    predictor(service=model_deployment_service, input_data=batch_data)
+    predictor(
+        service=model_deployment_service,
+        input_data=batch_data,
+        fill_values=fill_values,
+        feature_engineering_state=feature_engineering_state,
+    )
@@ -1,9 +1,10 @@
 from zenml import Model, pipeline
+from src.ames_schema import AMES_DTYPES, CATEGORICAL_COLUMNS, MODEL_COLUMNS
 from steps.data_ingestion_step import data_ingestion_step
 from steps.handle_misssing_values_step import handle_missing_values_step
 from steps.outlier_detection_step import outlier_detection_step
 from steps.feature_engineering_step import feature_engineering_step
-from steps.data_splitter_step import data_splitter_step
+from steps.data_splitter_step import data_index_splitter_step
 from steps.model_building_step import model_building_step
 from steps.model_evaluator_step import model_evaluator_step
 
@@ -12,36 +13,57 @@ from steps.model_evaluator_step import model_evaluator_step
         name="price_predictor"
     )
 )
-def ml_pipeline(file_path: str):
+def ml_pipeline(
+    file_path: str, warm_start: bool = False, compare_with_cold: bool = False, categorical_features: bool = False
+):
     """
     ZenML pipeline for training a price predictor model.
 
     This pipeline ingests data, preprocesses it, trains a model, and evaluates it.
 
     Parameters:
-    file_path (str): Path to the data file.
+    file_path (str): Path to the data file (ZIP/CSV, Parquet/Feather, or a Parquet dataset directory).
+    warm_start (bool): Whether to retrain the production model instead of training from scratch.
+    compare_with_cold (bool): With warm_start, also train from scratch and log the time saved.
+    categorical_features (bool): Also train on the categorical columns. Outlier removal keeps
+        them, and the model one-hot encodes them; the prediction service only sends the
+        numeric columns, so such a model is for offline evaluation until it sends them too.
     """
-    raw_data = data_ingestion_step(file_path=file_path)
+    # Only load the columns the model is trained on, parsed with compact dtypes. By default these
+    # are the numeric columns the prediction service receives
+    columns = MODEL_COLUMNS + CATEGORICAL_COLUMNS if categorical_features else MODEL_COLUMNS
+    raw_data = data_ingestion_step(file_path=file_path, columns=columns, schema=AMES_DTYPES)
     
-    # Handle missing values
-    cleaned_data = handle_missing_values_step(df=raw_data, strategy="mean")
+    # Handle missing values; the fitted fill values are kept for the serving path
+    # Every step gets its own materialized copy of its input, so steps can work in place
+    cleaned_data, imputer_fill_values = handle_missing_values_step(df=raw_data, strategy="mean", copy=False)
 
     # Detect and handle outliers
     # Note: The outlier detection step seems to have a bug, as it takes a column name but then processes all numeric columns.
     # For now, we will pass 'SalePrice' as the column name.
     outlier_free_data = outlier_detection_step(df=cleaned_data, column_name="SalePrice")
 
-    # Feature engineering
+    # Feature engineering; the fitted transformation state is kept for the serving path
     # Note: The feature engineering step is very basic. We will use log transformation for now.
-    featured_data = feature_engineering_step(df=outlier_free_data, strategy="log", features=["SalePrice"])
+    featured_data, feature_engineering_state = feature_engineering_step(
+        df=outlier_free_data, strategy="log", features=["SalePrice"], copy=False
+    )
 
-    # Split the data
-    X_train, X_test, y_train, y_test = data_splitter_step(df=featured_data, target_column="SalePrice")
+    # Split the data into row indices; the train and test rows are gathered from featured_data where used
+    train_indices, test_indices = data_index_splitter_step(df=featured_data, target_column="SalePrice")
 
     # Build and train the model
-    trained_model = model_building_step(X_train=X_train, y_train=y_train)
+    trained_model = model_building_step(
+        df=featured_data,
+        train_indices=train_indices,
+        target_column="SalePrice",
+        warm_start=warm_start,
+        compare_with_cold=compare_with_cold,
+    )
 
     # Evaluate the model
-    evaluation_metrics, mse = model_evaluator_step(trained_model=trained_model, X_test=X_test, y_test=y_test)
+    evaluation_metrics, mse = model_evaluator_step(
+        trained_model=trained_model, df=featured_data, test_indices=test_indices, target_column="SalePrice"
+    )
     
     return evaluation_metrics, mse
\ No newline at end of file
@@ -3,14 +3,30 @@ from pipelines.training_pipeline import ml_pipeline
 
 
 @click.command()
-def main():
+@click.option("--warm-start", is_flag=True, help="Retrain the production model instead of starting from scratch.")
+@click.option(
+    "--compare-with-cold",
+    is_flag=True,
+    help="With --warm-start, also train from scratch and log the time saved to MLflow.",
+)
+@click.option(
+    "--categorical-features",
+    is_flag=True,
+    help="Also train on the categorical columns (not sent by the prediction service).",
+)
+def main(warm_start: bool, compare_with_cold: bool, categorical_features: bool):
     """
     Run the ML pipeline and start the MLflow UI for experiment tracking.
     """
     # Run the pipeline
     ml_pipeline.configure(enable_cache=False)
 
-    result = ml_pipeline(file_path="/home/sanjaylinux/hpp/data/AmesHousing.csv")
+    result = ml_pipeline(
+        file_path="/home/sanjaylinux/hpp/data/AmesHousing.csv",
+        warm_start=warm_start,
+        compare_with_cold=compare_with_cold,
+        categorical_features=categorical_features,
+    )
 
     # The pipeline call may return either the step outputs or a pipeline
     # run response depending on the ZenML version. Handle both cases.
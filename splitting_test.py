@@ -0,0 +1,52 @@
+# Import necessary libraries
+import numpy as np
+import pandas as pd
+from src.data_splitter import (
+    KFoldSplitStrategy,
+    SimpleTrainTestSplitStrategy,
+    StratifiedKFoldSplitStrategy,
+    TimeOrderedSplitStrategy,
+)
+
+# Load the dataset
+data_path = "data/AmesHousing.csv"
+df = pd.read_csv(data_path)
+rows = np.arange(len(df))
+
+# Step 1: Cross-validation folds
+# Every row is tested exactly once, and a fold never trains on a row it tests
+for strategy in (KFoldSplitStrategy(), KFoldSplitStrategy(shuffle=False), StratifiedKFoldSplitStrategy()):
+    folds = strategy.split_indices(df, "SalePrice")
+    assert len(folds) == strategy.n_splits
+    np.testing.assert_array_equal(np.sort(np.concatenate([test for _, test in folds])), rows)
+    for train, test in folds:
+        assert len(np.intersect1d(train, test)) == 0
+        np.testing.assert_array_equal(np.sort(np.concatenate([train, test])), rows)
+
+# Step 2: Stratified folds keep the target distribution
+# Every fold's median sale price is within a few percent of the overall median
+median = df["SalePrice"].median()
+for _, test in StratifiedKFoldSplitStrategy().split_indices(df, "SalePrice"):
+    assert abs(df["SalePrice"].iloc[test].median() / median - 1) < 0.05
+
+# Step 3: Time-ordered folds
+# Training months all precede the tested months, no month is split, and the test blocks are
+# consecutive and end with the most recent sale
+periods = df["Yr Sold"].to_numpy() * 12 + df["Mo Sold"].to_numpy()
+folds = TimeOrderedSplitStrategy().split_indices(df, "SalePrice")
+tested = np.concatenate([test for _, test in folds])
+assert len(np.unique(tested)) == len(tested)
+assert periods[folds[-1][1]].max() == periods.max()
+for train, test in folds:
+    assert periods[train].max() < periods[test].min()
+    np.testing.assert_array_equal(np.sort(np.concatenate([train, test])), np.flatnonzero(periods <= periods[test].max()))
+for (_, test), (next_train, _) in zip(folds, folds[1:]):
+    assert np.isin(test, next_train).all()
+
+# Step 4: Index splits select the same rows as the frame splits
+strategy = SimpleTrainTestSplitStrategy()
+X_train, X_test, y_train, y_test = strategy.split_data(df, "SalePrice")
+((train, test),) = strategy.split_indices(df, "SalePrice")
+np.testing.assert_array_equal(X_train.index, df.index[train])
+np.testing.assert_array_equal(X_test.index, df.index[test])
+print("Split invariants hold for every splitting strategy.")
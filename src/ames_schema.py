@@ -0,0 +1,153 @@
+# Column definitions for the Ames housing dataset
+# ------------------------------------------------
+# Shared by the ingestion step (to project only the needed columns and parse them with compact
+# dtypes) and the training pipeline.
+
+# The regression target
+TARGET_COLUMN = "SalePrice"
+
+# Numeric features the model is trained on; these are also the columns the prediction service receives.
+NUMERIC_FEATURES = [
+    "Order",
+    "PID",
+    "MS SubClass",
+    "Lot Frontage",
+    "Lot Area",
+    "Overall Qual",
+    "Overall Cond",
+    "Year Built",
+    "Year Remod/Add",
+    "Mas Vnr Area",
+    "BsmtFin SF 1",
+    "BsmtFin SF 2",
+    "Bsmt Unf SF",
+    "Total Bsmt SF",
+    "1st Flr SF",
+    "2nd Flr SF",
+    "Low Qual Fin SF",
+    "Gr Liv Area",
+    "Bsmt Full Bath",
+    "Bsmt Half Bath",
+    "Full Bath",
+    "Half Bath",
+    "Bedroom AbvGr",
+    "Kitchen AbvGr",
+    "TotRms AbvGrd",
+    "Fireplaces",
+    "Garage Yr Blt",
+    "Garage Cars",
+    "Garage Area",
+    "Wood Deck SF",
+    "Open Porch SF",
+    "Enclosed Porch",
+    "3Ssn Porch",
+    "Screen Porch",
+    "Pool Area",
+    "Misc Val",
+    "Mo Sold",
+    "Yr Sold",
+]
+
+# The columns model_building_step actually uses (features plus target)
+MODEL_COLUMNS = NUMERIC_FEATURES + [TARGET_COLUMN]
+
+# Text columns, stored as pandas categoricals (one small integer code per row instead of a Python string)
+CATEGORICAL_COLUMNS = [
+    "MS Zoning",
+    "Street",
+    "Alley",
+    "Lot Shape",
+    "Land Contour",
+    "Utilities",
+    "Lot Config",
+    "Land Slope",
+    "Neighborhood",
+    "Condition 1",
+    "Condition 2",
+    "Bldg Type",
+    "House Style",
+    "Roof Style",
+    "Roof Matl",
+    "Exterior 1st",
+    "Exterior 2nd",
+    "Mas Vnr Type",
+    "Exter Qual",
+    "Exter Cond",
+    "Foundation",
+    "Bsmt Qual",
+    "Bsmt Cond",
+    "Bsmt Exposure",
+    "BsmtFin Type 1",
+    "BsmtFin Type 2",
+    "Heating",
+    "Heating QC",
+    "Central Air",
+    "Electrical",
+    "Kitchen Qual",
+    "Functional",
+    "Fireplace Qu",
+    "Garage Type",
+    "Garage Finish",
+    "Garage Qual",
+    "Garage Cond",
+    "Paved Drive",
+    "Pool QC",
+    "Fence",
+    "Misc Feature",
+    "Sale Type",
+    "Sale Condition",
+]
+
+# Integer columns that are never missing, with the smallest dtype that holds their range
+SMALL_INT_COLUMNS = {
+    "Order": "int32",
+    "PID": "int32",
+    "MS SubClass": "int16",
+    "Lot Area": "int32",
+    "Overall Qual": "int8",
+    "Overall Cond": "int8",
+    "Year Built": "int16",
+    "Year Remod/Add": "int16",
+    "1st Flr SF": "int16",
+    "2nd Flr SF": "int16",
+    "Low Qual Fin SF": "int16",
+    "Gr Liv Area": "int16",
+    "Full Bath": "int8",
+    "Half Bath": "int8",
+    "Bedroom AbvGr": "int8",
+    "Kitchen AbvGr": "int8",
+    "TotRms AbvGrd": "int8",
+    "Fireplaces": "int8",
+    "Wood Deck SF": "int16",
+    "Open Porch SF": "int16",
+    "Enclosed Porch": "int16",
+    "3Ssn Porch": "int16",
+    "Screen Porch": "int16",
+    "Pool Area": "int16",
+    "Misc Val": "int32",
+    "Mo Sold": "int8",
+    "Yr Sold": "int16",
+    "SalePrice": "int32",
+}
+
+# Numeric columns with missing values (integers cannot hold NaN), stored as float32
+FLOAT32_COLUMNS = [
+    "Lot Frontage",
+    "Mas Vnr Area",
+    "BsmtFin SF 1",
+    "BsmtFin SF 2",
+    "Bsmt Unf SF",
+    "Total Bsmt SF",
+    "Bsmt Full Bath",
+    "Bsmt Half Bath",
+    "Garage Yr Blt",
+    "Garage Cars",
+    "Garage Area",
+]
+
+# The full dtype schema, in the form accepted by pd.read_csv(dtype=...)
+AMES_DTYPES = {
+    **{column: "category" for column in CATEGORICAL_COLUMNS},
+    **SMALL_INT_COLUMNS,
+    **{column: "float32" for column in FLOAT32_COLUMNS},
+}
@@ -1,8 +1,10 @@
 import logging
 from abc import ABC, abstractmethod
+from typing import List, Tuple
 
+import numpy as np
 import pandas as pd
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import KFold, StratifiedKFold, TimeSeriesSplit, train_test_split
 
 # Setup logging configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -27,10 +29,47 @@ class DataSplittingStrategy(ABC):
         pass
 
 
+# Abstract Base Class for Index-Based Splitting Strategies
+# -------------------------------------------------------
+# These strategies return row positions into the one shared DataFrame instead of copies of it, so
+# a split costs a couple of integer vectors; rows are only gathered where they are used (see select_rows).
+# Subclasses must implement the split_indices method.
+class IndexSplittingStrategy(DataSplittingStrategy):
+    @abstractmethod
+    def split_indices(self, df: pd.DataFrame, target_column: str) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Abstract method to split the rows into training and testing positions.
+
+        Parameters:
+        df (pd.DataFrame): The input DataFrame to be split.
+        target_column (str): The name of the target column.
+
+        Returns:
+        list: One (train_indices, test_indices) pair of positional row indices per fold.
+        """
+        pass
+
+    def split_data(self, df: pd.DataFrame, target_column: str):
+        """
+        Splits the data into training and testing sets using the last fold of `split_indices`.
+
+        Parameters:
+        df (pd.DataFrame): The input DataFrame to be split.
+        target_column (str): The name of the target column.
+
+        Returns:
+        X_train, X_test, y_train, y_test: The training and testing splits for features and target.
+        """
+        train_indices, test_indices = self.split_indices(df, target_column)[-1]
+        X_train, y_train = select_rows(df, train_indices, target_column)
+        X_test, y_test = select_rows(df, test_indices, target_column)
+        return X_train, X_test, y_train, y_test
+
+
 # Concrete Strategy for Simple Train-Test Split
 # ---------------------------------------------
 # This strategy implements a simple train-test split.
-class SimpleTrainTestSplitStrategy(DataSplittingStrategy):
+class SimpleTrainTestSplitStrategy(IndexSplittingStrategy):
     def __init__(self, test_size=0.2, random_state=42):
         """
         Initializes the SimpleTrainTestSplitStrategy with specific parameters.
@@ -64,6 +103,128 @@ class SimpleTrainTestSplitStrategy(DataSplittingStrategy):
         logging.info("Train-test split completed.")
         return X_train, X_test, y_train, y_test
 
+    def split_indices(self, df: pd.DataFrame, target_column: str) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Returns the positions of the rows `split_data` would put in the training and testing sets.
+
+        Parameters:
+        df (pd.DataFrame): The input DataFrame to be split.
+        target_column (str): The name of the target column.
+
+        Returns:
+        list: A single (train_indices, test_indices) pair.
+        """
+        logging.info("Performing simple train-test split of row indices.")
+        train_indices, test_indices = train_test_split(
+            np.arange(len(df)), test_size=self.test_size, random_state=self.random_state
+        )
+        return [(train_indices, test_indices)]
+
+
+# Concrete Strategy for K-Fold Splits
+# -----------------------------------
+# This strategy splits the rows into K folds; each fold is the test set once.
+class KFoldSplitStrategy(IndexSplittingStrategy):
+    def __init__(self, n_splits=5, shuffle=True, random_state=42):
+        """
+        Initializes the KFoldSplitStrategy with specific parameters.
+
+        Parameters:
+        n_splits (int): The number of folds.
+        shuffle (bool): Whether to shuffle the rows before assigning them to folds.
+        random_state (int): The seed used by the random number generator when shuffling.
+        """
+        self.n_splits = n_splits
+        self.shuffle = shuffle
+        self.random_state = random_state
+
+    def split_indices(self, df: pd.DataFrame, target_column: str) -> List[Tuple[np.ndarray, np.ndarray]]:
+        logging.info(f"Performing {self.n_splits}-fold split of row indices.")
+        splitter = KFold(
+            n_splits=self.n_splits, shuffle=self.shuffle, random_state=self.random_state if self.shuffle else None
+        )
+        return list(splitter.split(np.empty((len(df), 0))))
+
+
+# Concrete Strategy for K-Fold Splits Stratified by the Binned Target
+# -------------------------------------------------------------------
+# This strategy keeps the target distribution (e.g. the share of expensive houses) the same in every fold.
+class StratifiedKFoldSplitStrategy(IndexSplittingStrategy):
+    def __init__(self, n_splits=5, n_bins=10, random_state=42):
+        """
+        Initializes the StratifiedKFoldSplitStrategy with specific parameters.
+
+        The continuous target is cut into `n_bins` quantile bins, and the folds are stratified
+        on the bin of each row.
+
+        Parameters:
+        n_splits (int): The number of folds.
+        n_bins (int): The number of target quantile bins; each must hold at least `n_splits` rows.
+        random_state (int): The seed used by the random number generator when shuffling.
+        """
+        self.n_splits = n_splits
+        self.n_bins = n_bins
+        self.random_state = random_state
+
+    def split_indices(self, df: pd.DataFrame, target_column: str) -> List[Tuple[np.ndarray, np.ndarray]]:
+        logging.info(f"Performing {self.n_splits}-fold split of row indices stratified by binned {target_column}.")
+        target = df[target_column].to_numpy(dtype=np.float64, na_value=np.nan)
+        edges = np.nanquantile(target, np.linspace(0, 1, self.n_bins + 1)[1:-1])
+        bins = np.searchsorted(edges, target, side="right")  # Missing targets fall into the last bin
+        splitter = StratifiedKFold(n_splits=self.n_splits, shuffle=True, random_state=self.random_state)
+        return list(splitter.split(np.empty((len(df), 0)), bins))
+
+
+# Concrete Strategy for Time-Ordered Splits
+# -----------------------------------------
+# This strategy trains on the sales before a point in time and tests on the ones after it, like production.
+class TimeOrderedSplitStrategy(IndexSplittingStrategy):
+    def __init__(self, n_splits=5, year_column="Yr Sold", month_column="Mo Sold"):
+        """
+        Initializes the TimeOrderedSplitStrategy with specific parameters.
+
+        The sale months are ordered and cut into `n_splits + 1` consecutive blocks; fold k
+        tests on block k + 1 and trains on all months before it (an expanding window, as
+        scikit-learn's TimeSeriesSplit). A month is never split between training and testing,
+        and the last fold tests on the most recent sales.
+
+        Parameters:
+        n_splits (int): The number of folds.
+        year_column (str): The column holding the year of sale.
+        month_column (str): The column holding the month of sale.
+        """
+        self.n_splits = n_splits
+        self.year_column = year_column
+        self.month_column = month_column
+
+    def split_indices(self, df: pd.DataFrame, target_column: str) -> List[Tuple[np.ndarray, np.ndarray]]:
+        logging.info(f"Performing {self.n_splits}-fold time-ordered split of row indices.")
+        periods = df[self.year_column].to_numpy(dtype=np.int64) * 12 + df[self.month_column].to_numpy(dtype=np.int64)
+        unique_periods, period_codes = np.unique(periods, return_inverse=True)
+        folds = []
+        for train_periods, test_periods in TimeSeriesSplit(n_splits=self.n_splits).split(unique_periods):
+            # Periods are sorted, so a fold's periods are one contiguous range of codes
+            train_indices = np.flatnonzero(period_codes <= train_periods[-1])
+            test_indices = np.flatnonzero((period_codes >= test_periods[0]) & (period_codes <= test_periods[-1]))
+            folds.append((train_indices, test_indices))
+        return folds
+
+
+def select_rows(df: pd.DataFrame, indices: np.ndarray, target_column: str):
+    """
+    Gathers the rows at the given positions and separates features from the target.
+
+    Parameters:
+    df (pd.DataFrame): The DataFrame the indices point into.
+    indices (np.ndarray): Positional row indices, e.g. from `split_indices`.
+    target_column (str): The name of the target column.
+
+    Returns:
+    X, y: The features and target of the selected rows.
+    """
+    rows = df.take(indices)
+    return rows.drop(columns=[target_column]), rows[target_column]
+
 
 # Context Class for Data Splitting
 # --------------------------------
@@ -102,6 +263,22 @@ class DataSplitter:
         logging.info("Splitting data using the selected strategy.")
         return self._strategy.split_data(df, target_column)
 
+    def split_indices(self, df: pd.DataFrame, target_column: str) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Executes the index splitting using the current strategy, which must be an IndexSplittingStrategy.
+
+        Parameters:
+        df (pd.DataFrame): The input DataFrame to be split.
+        target_column (str): The name of the target column.
+
+        Returns:
+        list: One (train_indices, test_indices) pair of positional row indices per fold.
+        """
+        if not isinstance(self._strategy, IndexSplittingStrategy):
+            raise TypeError(f"{type(self._strategy).__name__} does not split by row indices.")
+        logging.info("Splitting row indices using the selected strategy.")
+        return self._strategy.split_indices(df, target_column)
+
 
 # Example usage
 if __name__ == "__main__":
@@ -1,9 +1,15 @@
+import json
 import logging
 from abc import ABC, abstractmethod
+from copy import deepcopy
 
 import numpy as np
 import pandas as pd
+import scipy.sparse as sp
+from sklearn.model_selection import KFold
 from sklearn.preprocessing import MinMaxScaler, OneHotEncoder, StandardScaler
+from sklearn.utils import murmurhash3_32
+from src.handle_missing_values import _to_builtin
 
 # Setup logging configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -11,12 +17,52 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(
 # Abstract Base Class for Feature Engineering Strategy
 # ----------------------------------------------------
 # This class defines a common interface for different feature engineering strategies.
-# Subclasses must implement the apply_transformation method.
+# Subclasses must implement the transform and get_params methods; strategies that learn from
+# the data (scalers, encoders) also override fit, get_state and set_state.
 class FeatureEngineeringStrategy(ABC):
+    def fit(self, df: pd.DataFrame) -> "FeatureEngineeringStrategy":
+        """
+        Learns the transformation from the training data; stateless strategies learn nothing.
+
+        Parameters:
+        df (pd.DataFrame): The training dataframe.
+
+        Returns:
+        FeatureEngineeringStrategy: The fitted strategy.
+        """
+        return self
+
     @abstractmethod
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Abstract method to apply the fitted transformation to the DataFrame.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to transform.
+
+        Returns:
+        pd.DataFrame: A dataframe with the applied transformations.
+        """
+        pass
+
+    @abstractmethod
+    def get_params(self) -> dict:
+        """Returns the JSON-serializable constructor parameters, so the strategy can be rebuilt."""
+        pass
+
+    def get_state(self) -> dict:
+        """Returns the JSON-serializable fitted state; empty for stateless strategies."""
+        return {}
+
+    def set_state(self, state: dict):
+        """Restores the fitted state returned by `get_state`."""
+        pass
+
     def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Abstract method to apply feature engineering transformation to the DataFrame.
+        Fits the transformation on the DataFrame and applies it.
+
+        Equivalent to `fit(df).transform(df)`.
 
         Parameters:
         df (pd.DataFrame): The dataframe containing features to transform.
@@ -24,23 +70,106 @@ class FeatureEngineeringStrategy(ABC):
         Returns:
         pd.DataFrame: A dataframe with the applied transformations.
         """
+        return self.fit(df).transform(df)
+
+    def to_dict(self) -> dict:
+        """
+        Returns the strategy and its fitted state as a JSON-serializable dictionary.
+
+        Returns:
+        dict: The strategy class name, its parameters and its fitted state.
+        """
+        return {"strategy": type(self).__name__, "params": self.get_params(), "state": self.get_state()}
+
+    @staticmethod
+    def from_dict(state: dict) -> "FeatureEngineeringStrategy":
+        """
+        Rebuilds a fitted strategy from the output of `to_dict`, so serving can run
+        `transform` without refitting on the request batch.
+
+        Parameters:
+        state (dict): The serialized strategy.
+
+        Returns:
+        FeatureEngineeringStrategy: A fitted strategy of the serialized class.
+        """
+        strategy_classes = _strategy_classes()
+        if state["strategy"] not in strategy_classes:
+            raise ValueError(f"Unknown feature engineering strategy: {state['strategy']}")
+        strategy = strategy_classes[state["strategy"]](**state["params"])
+        strategy.set_state(state["state"])
+        return strategy
+
+    def save(self, path: str):
+        """
+        Saves the strategy and its fitted state as JSON, e.g. next to the model artifact.
+
+        Parameters:
+        path (str): The JSON file to write.
+        """
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        logging.info(f"Saved {type(self).__name__} state to {path}")
+
+    @staticmethod
+    def load(path: str) -> "FeatureEngineeringStrategy":
+        """
+        Loads a strategy saved with `save`.
+
+        Parameters:
+        path (str): The JSON file to read.
+
+        Returns:
+        FeatureEngineeringStrategy: A fitted strategy, ready for `transform`.
+        """
+        with open(path) as f:
+            return FeatureEngineeringStrategy.from_dict(json.load(f))
+
+
+# Abstract Base Class for Column-wise Feature Engineering Strategies
+# -----------------------------------------------------------------
+# A column-wise strategy transforms each of its features independently with a NumPy kernel, so
+# several of them can be fused into one pass over a shared float block (see CompositeFeatureEngineering).
+# Its transform pulls all features into one contiguous float64 block, transforms the block and
+# writes it back to the frame once.
+class ColumnWiseFeatureEngineeringStrategy(FeatureEngineeringStrategy):
+    @abstractmethod
+    def transform_values(self, values: np.ndarray) -> np.ndarray:
+        """
+        Abstract method to apply the fitted transformation to a float block of the features.
+
+        Parameters:
+        values (np.ndarray): A float64 array with one column per feature, in `features` order;
+            it may be modified in place.
+
+        Returns:
+        np.ndarray: The transformed values.
+        """
         pass
 
 
 # Concrete Strategy for Log Transformation
 # ----------------------------------------
 # This strategy applies a logarithmic transformation to skewed features to normalize the distribution.
-class LogTransformation(FeatureEngineeringStrategy):
-    def __init__(self, features):
+class LogTransformation(ColumnWiseFeatureEngineeringStrategy):
+    def __init__(self, features, copy=True):
         """
         Initializes the LogTransformation with the specific features to transform.
 
         Parameters:
         features (list): The list of features to apply the log transformation to.
+        copy (bool): If False, transform the input DataFrame in place instead of a copy.
         """
         self.features = features
+        self.copy = copy
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def get_params(self) -> dict:
+        return {"features": list(self.features)}
+
+    def transform_values(self, values: np.ndarray) -> np.ndarray:
+        return np.log1p(values, out=values)  # log1p handles log(0) by calculating log(1+x)
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Applies a log transformation to the specified features in the DataFrame.
 
@@ -51,11 +180,7 @@ class LogTransformation(FeatureEngineeringStrategy):
         pd.DataFrame: The dataframe with log-transformed features.
         """
         logging.info(f"Applying log transformation to features: {self.features}")
-        df_transformed = df.copy()
-        for feature in self.features:
-            df_transformed[feature] = np.log1p(
-                df[feature]
-            )  # log1p handles log(0) by calculating log(1+x)
+        df_transformed = _apply_fused(df, [self], fit=False, copy=self.copy)
         logging.info("Log transformation completed.")
         return df_transformed
 
@@ -63,20 +188,50 @@ class LogTransformation(FeatureEngineeringStrategy):
 # Concrete Strategy for Standard Scaling
 # --------------------------------------
 # This strategy applies standard scaling (z-score normalization) to features, centering them around zero with unit variance.
-class StandardScaling(FeatureEngineeringStrategy):
-    def __init__(self, features):
+class StandardScaling(ColumnWiseFeatureEngineeringStrategy):
+    def __init__(self, features, copy=True):
         """
         Initializes the StandardScaling with the specific features to scale.
 
         Parameters:
         features (list): The list of features to apply the standard scaling to.
+        copy (bool): If False, transform the input DataFrame in place instead of a copy.
         """
         self.features = features
+        self.copy = copy
         self.scaler = StandardScaler()
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def get_params(self) -> dict:
+        return {"features": list(self.features)}
+
+    def fit(self, df: pd.DataFrame) -> "StandardScaling":
         """
-        Applies standard scaling to the specified features in the DataFrame.
+        Learns the mean and standard deviation of the features.
+
+        Parameters:
+        df (pd.DataFrame): The training dataframe.
+
+        Returns:
+        StandardScaling: The fitted strategy.
+        """
+        self.scaler.fit(df[self.features])
+        return self
+
+    def get_state(self) -> dict:
+        return _fitted_attributes(self.scaler)
+
+    def set_state(self, state: dict):
+        _restore_attributes(self.scaler, state)
+
+    def transform_values(self, values: np.ndarray) -> np.ndarray:
+        # The same arithmetic as StandardScaler.transform, without its DataFrame round trip
+        values -= self.scaler.mean_
+        values /= self.scaler.scale_
+        return values
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Applies the fitted standard scaling to the specified features in the DataFrame.
 
         Parameters:
         df (pd.DataFrame): The dataframe containing features to transform.
@@ -85,8 +240,7 @@ class StandardScaling(FeatureEngineeringStrategy):
         pd.DataFrame: The dataframe with scaled features.
         """
         logging.info(f"Applying standard scaling to features: {self.features}")
-        df_transformed = df.copy()
-        df_transformed[self.features] = self.scaler.fit_transform(df[self.features])
+        df_transformed = _apply_fused(df, [self], fit=False, copy=self.copy)
         logging.info("Standard scaling completed.")
         return df_transformed
 
@@ -94,21 +248,51 @@ class StandardScaling(FeatureEngineeringStrategy):
 # Concrete Strategy for Min-Max Scaling
 # -------------------------------------
 # This strategy applies Min-Max scaling to features, scaling them to a specified range, typically [0, 1].
-class MinMaxScaling(FeatureEngineeringStrategy):
-    def __init__(self, features, feature_range=(0, 1)):
+class MinMaxScaling(ColumnWiseFeatureEngineeringStrategy):
+    def __init__(self, features, feature_range=(0, 1), copy=True):
         """
         Initializes the MinMaxScaling with the specific features to scale and the target range.
 
         Parameters:
         features (list): The list of features to apply the Min-Max scaling to.
         feature_range (tuple): The target range for scaling, default is (0, 1).
+        copy (bool): If False, transform the input DataFrame in place instead of a copy.
         """
         self.features = features
-        self.scaler = MinMaxScaler(feature_range=feature_range)
+        self.copy = copy
+        self.scaler = MinMaxScaler(feature_range=tuple(feature_range))
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def get_params(self) -> dict:
+        return {"features": list(self.features), "feature_range": list(self.scaler.feature_range)}
+
+    def fit(self, df: pd.DataFrame) -> "MinMaxScaling":
         """
-        Applies Min-Max scaling to the specified features in the DataFrame.
+        Learns the minimum and maximum of the features.
+
+        Parameters:
+        df (pd.DataFrame): The training dataframe.
+
+        Returns:
+        MinMaxScaling: The fitted strategy.
+        """
+        self.scaler.fit(df[self.features])
+        return self
+
+    def get_state(self) -> dict:
+        return _fitted_attributes(self.scaler)
+
+    def set_state(self, state: dict):
+        _restore_attributes(self.scaler, state)
+
+    def transform_values(self, values: np.ndarray) -> np.ndarray:
+        # The same arithmetic as MinMaxScaler.transform, without its DataFrame round trip
+        values *= self.scaler.scale_
+        values += self.scaler.min_
+        return values
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Applies the fitted Min-Max scaling to the specified features in the DataFrame.
 
         Parameters:
         df (pd.DataFrame): The dataframe containing features to transform.
@@ -119,8 +303,7 @@ class MinMaxScaling(FeatureEngineeringStrategy):
         logging.info(
             f"Applying Min-Max scaling to features: {self.features} with range {self.scaler.feature_range}"
         )
-        df_transformed = df.copy()
-        df_transformed[self.features] = self.scaler.fit_transform(df[self.features])
+        df_transformed = _apply_fused(df, [self], fit=False, copy=self.copy)
         logging.info("Min-Max scaling completed.")
         return df_transformed
 
@@ -129,19 +312,60 @@ class MinMaxScaling(FeatureEngineeringStrategy):
 # --------------------------------------
 # This strategy applies one-hot encoding to categorical features, converting them into binary vectors.
 class OneHotEncoding(FeatureEngineeringStrategy):
-    def __init__(self, features):
+    def __init__(self, features, copy=True, sparse=False):
         """
         Initializes the OneHotEncoding with the specific features to encode.
 
         Parameters:
         features (list): The list of categorical features to apply the one-hot encoding to.
+        copy (bool): If False, replace the features by their encodings in the input DataFrame
+            in place (keeping its index) instead of building a new, re-indexed one.
+        sparse (bool): If True, the encoded features are pandas sparse columns built from the
+            encoder's CSR output, so high-cardinality features (e.g. Neighborhood) never
+            materialize their zeros.
         """
         self.features = features
-        self.encoder = OneHotEncoder(sparse=False, drop="first")
+        self.copy = copy
+        self.sparse = sparse
+        self.encoder = OneHotEncoder(sparse_output=sparse, drop="first")
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def get_params(self) -> dict:
+        return {"features": list(self.features), "sparse": self.sparse}
+
+    def fit(self, df: pd.DataFrame) -> "OneHotEncoding":
+        """
+        Learns the categories of the features.
+
+        Parameters:
+        df (pd.DataFrame): The training dataframe.
+
+        Returns:
+        OneHotEncoding: The fitted strategy.
+        """
+        self.encoder.fit(df[self.features])
+        return self
+
+    def get_state(self) -> dict:
+        if not hasattr(self.encoder, "categories_"):
+            raise ValueError("OneHotEncoding must be fitted before it can be serialized.")
+        return {"categories": [[_to_builtin(value) for value in categories] for categories in self.encoder.categories_]}
+
+    def set_state(self, state: dict):
+        # Fitting on the vocabulary alone (one row per category) rebuilds the same encoder
+        categories = state["categories"]
+        n_rows = max(len(feature_categories) for feature_categories in categories)
+        vocabulary = pd.DataFrame(
+            {
+                feature: feature_categories + feature_categories[:1] * (n_rows - len(feature_categories))
+                for feature, feature_categories in zip(self.features, categories)
+            }
+        )
+        self.encoder.set_params(categories=categories)
+        self.encoder.fit(vocabulary)
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Applies one-hot encoding to the specified categorical features in the DataFrame.
+        Applies the fitted one-hot encoding to the specified categorical features in the DataFrame.
 
         Parameters:
         df (pd.DataFrame): The dataframe containing features to transform.
@@ -150,17 +374,506 @@ class OneHotEncoding(FeatureEngineeringStrategy):
         pd.DataFrame: The dataframe with one-hot encoded features.
         """
         logging.info(f"Applying one-hot encoding to features: {self.features}")
-        df_transformed = df.copy()
-        encoded_df = pd.DataFrame(
-            self.encoder.fit_transform(df[self.features]),
-            columns=self.encoder.get_feature_names_out(self.features),
-        )
-        df_transformed = df_transformed.drop(columns=self.features).reset_index(drop=True)
-        df_transformed = pd.concat([df_transformed, encoded_df], axis=1)
+        encoded = self.encoder.transform(df[self.features])
+        encoded_columns = self.encoder.get_feature_names_out(self.features)
+        if self.copy:
+            df_transformed = df.drop(columns=self.features).reset_index(drop=True)
+            encoded_df = _encoded_frame(encoded, encoded_columns, df_transformed.index)
+            df_transformed = pd.concat([df_transformed, encoded_df], axis=1)
+        else:
+            df_transformed = df
+            df_transformed.drop(columns=self.features, inplace=True)
+            df_transformed[encoded_columns] = _encoded_frame(encoded, encoded_columns, df_transformed.index)
         logging.info("One-hot encoding completed.")
         return df_transformed
 
 
+# Concrete Strategy for Feature Hashing
+# -------------------------------------
+# This strategy hashes categorical values into a fixed number of sparse columns, for vocabularies that are unbounded.
+class FeatureHashing(FeatureEngineeringStrategy):
+    def __init__(self, features, n_features=1024, copy=True):
+        """
+        Initializes the FeatureHashing with the specific features to hash.
+
+        Every 'feature=value' pair is hashed (signed 32-bit MurmurHash3, as scikit-learn's
+        FeatureHasher does) into one of `n_features` shared sparse columns, with a +1/-1 sign
+        that keeps collisions unbiased. Nothing is learnt, so categories unseen in training
+        are encoded at serve time too, and the width never grows with the vocabulary.
+
+        Parameters:
+        features (list): The list of categorical features to hash.
+        n_features (int): The number of hashed columns.
+        copy (bool): If False, replace the features by their hashes in the input DataFrame
+            in place instead of a copy.
+        """
+        self.features = features
+        self.n_features = n_features
+        self.copy = copy
+
+    def get_params(self) -> dict:
+        return {"features": list(self.features), "n_features": self.n_features}
+
+    def hash_matrix(self, df: pd.DataFrame) -> sp.csr_matrix:
+        """
+        Hashes the specified categorical features into a sparse matrix.
+
+        Only the distinct values of each feature are hashed; rows are then mapped to their
+        value's column and sign with vectorized lookups. Missing values are not encoded.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to hash.
+
+        Returns:
+        sp.csr_matrix: One row per row of `df` and `n_features` columns.
+        """
+        rows, columns, signs = [np.zeros(0, dtype=np.intp)], [np.zeros(0, dtype=np.int64)], [np.zeros(0)]
+        for feature in self.features:
+            codes, uniques = pd.factorize(df[feature])
+            hashes = np.array(
+                [murmurhash3_32(f"{feature}={value}", positive=False) for value in uniques], dtype=np.int64
+            )
+            present = np.flatnonzero(codes >= 0)
+            rows.append(present)
+            columns.append((np.abs(hashes) % self.n_features)[codes[present]])
+            signs.append(np.where(hashes >= 0, 1.0, -1.0)[codes[present]])
+        return sp.csr_matrix(
+            (np.concatenate(signs), (np.concatenate(rows), np.concatenate(columns))),
+            shape=(len(df), self.n_features),
+        )  # Duplicate (row, column) entries from colliding features are summed
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replaces the specified categorical features by their hashed sparse columns.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to hash.
+
+        Returns:
+        pd.DataFrame: The dataframe with the features replaced by 'hashed_<i>' sparse columns.
+        """
+        logging.info(f"Applying feature hashing to features: {self.features} with {self.n_features} columns")
+        matrix = self.hash_matrix(df)
+        hashed_columns = [f"hashed_{i}" for i in range(self.n_features)]
+        df_transformed = df.copy() if self.copy else df
+        df_transformed.drop(columns=self.features, inplace=True)
+        df_transformed[hashed_columns] = sparse_frame(matrix, hashed_columns, df_transformed.index)
+        logging.info("Feature hashing completed.")
+        return df_transformed
+
+
+# Abstract Base Class for Lookup-Table Encoding Strategies
+# --------------------------------------------------------
+# These strategies replace each category by one learnt number, kept in a per-feature lookup table,
+# so a categorical feature stays one compact float column instead of one column per category.
+class CategoryEncodingStrategy(FeatureEngineeringStrategy):
+    def __init__(self, features, copy=True):
+        """
+        Parameters:
+        features (list): The list of categorical features to encode.
+        copy (bool): If False, replace the features by their encodings in the input DataFrame
+            in place instead of a copy.
+        """
+        self.features = features
+        self.copy = copy
+        self.tables_ = None
+        self.default_ = None
+
+    @abstractmethod
+    def _fit_tables(self, df: pd.DataFrame):
+        """Learns `tables_` ({feature: (category Index, encoded values)}) and the `default_`
+        encoding of missing and unseen categories."""
+        pass
+
+    def fit(self, df: pd.DataFrame) -> "CategoryEncodingStrategy":
+        """
+        Learns the lookup table of every feature.
+
+        Parameters:
+        df (pd.DataFrame): The training dataframe.
+
+        Returns:
+        CategoryEncodingStrategy: The fitted strategy.
+        """
+        self._fit_tables(df)
+        return self
+
+    def get_state(self) -> dict:
+        if self.tables_ is None:
+            raise ValueError(f"{type(self).__name__} must be fitted before it can be serialized.")
+        return {
+            "default": self.default_,
+            "tables": {
+                feature: {
+                    "categories": [_to_builtin(category) for category in categories],
+                    "values": values.tolist(),
+                }
+                for feature, (categories, values) in self.tables_.items()
+            },
+        }
+
+    def set_state(self, state: dict):
+        self.default_ = state["default"]
+        self.tables_ = {
+            feature: (pd.Index(table["categories"]), np.asarray(table["values"], dtype=np.float64))
+            for feature, table in state["tables"].items()
+        }
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replaces every category by its value in the fitted lookup table.
+
+        Rows are encoded with one hashed index lookup per feature; missing values and
+        categories unseen in training get the default encoding.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to encode.
+
+        Returns:
+        pd.DataFrame: The dataframe with the features replaced by float encodings.
+        """
+        logging.info(f"Applying {type(self).__name__} to features: {self.features}")
+        df_transformed = df.copy() if self.copy else df
+        for feature in self.features:
+            categories, values = self.tables_[feature]
+            positions = categories.get_indexer(df_transformed[feature])
+            df_transformed[feature] = np.where(positions >= 0, values[positions], self.default_)
+        logging.info(f"{type(self).__name__} completed.")
+        return df_transformed
+
+
+# Concrete Strategy for Target (Mean) Encoding
+# --------------------------------------------
+# This strategy encodes each category by the smoothed mean of the target over its training rows.
+class TargetEncoding(CategoryEncodingStrategy):
+    def __init__(self, features, target, smoothing=10.0, n_splits=5, random_state=42, copy=True):
+        """
+        Initializes the TargetEncoding with the specific features to encode.
+
+        A category's encoding is its target mean shrunk towards the global mean,
+        (sum + smoothing * mean) / (count + smoothing), so rare categories are not encoded
+        by a handful of prices. Missing and unseen categories get the global mean.
+
+        Encoding the training rows with statistics that include their own target would leak
+        it into the feature, so `apply_transformation` cross-fits: rows are split into
+        `n_splits` folds and each fold is encoded with statistics of the other folds only.
+        The lookup table kept for `transform` (and serving) is fitted on all rows.
+
+        Parameters:
+        features (list): The list of categorical features to encode.
+        target (str): The target column; it must be present when fitting only.
+        smoothing (float): The weight of the global mean, in rows.
+        n_splits (int): The number of cross-fitting folds.
+        random_state (int): Seed of the fold assignment.
+        copy (bool): If False, replace the features by their encodings in the input DataFrame
+            in place instead of a copy.
+        """
+        super().__init__(features, copy=copy)
+        self.target = target
+        self.smoothing = smoothing
+        self.n_splits = n_splits
+        self.random_state = random_state
+
+    def get_params(self) -> dict:
+        return {
+            "features": list(self.features),
+            "target": self.target,
+            "smoothing": self.smoothing,
+            "n_splits": self.n_splits,
+            "random_state": self.random_state,
+        }
+
+    def _fit_tables(self, df: pd.DataFrame):
+        y, labelled = self._target_values(df)
+        self.default_ = float(y[labelled].mean())
+        self.tables_ = {}
+        for feature in self.features:
+            codes, categories = pd.factorize(df[feature])
+            rows = labelled & (codes >= 0)
+            sums = np.bincount(codes[rows], weights=y[rows], minlength=len(categories))
+            counts = np.bincount(codes[rows], minlength=len(categories))
+            values = (sums + self.smoothing * self.default_) / (counts + self.smoothing)
+            self.tables_[feature] = (pd.Index(categories), values)
+
+    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fits the lookup tables on the DataFrame and encodes its rows out of fold.
+
+        The per-category sums and counts of all folds come from one bincount over
+        (fold, category) pairs per feature; the out-of-fold statistics of a fold are the
+        totals minus its own, so the cost does not grow with `n_splits`.
+
+        Parameters:
+        df (pd.DataFrame): The training dataframe, including the target column.
+
+        Returns:
+        pd.DataFrame: The dataframe with the features replaced by cross-fitted encodings.
+        """
+        self.fit(df)
+        logging.info(f"Applying {self.n_splits}-fold cross-fitted target encoding to features: {self.features}")
+        y, labelled = self._target_values(df)
+        folds = np.empty(len(df), dtype=np.intp)
+        for fold, (_, fold_rows) in enumerate(
+            KFold(n_splits=self.n_splits, shuffle=True, random_state=self.random_state).split(folds)
+        ):
+            folds[fold_rows] = fold
+
+        fold_sums = np.bincount(folds[labelled], weights=y[labelled], minlength=self.n_splits)
+        fold_counts = np.bincount(folds[labelled], minlength=self.n_splits)
+        priors = (fold_sums.sum() - fold_sums) / (fold_counts.sum() - fold_counts)
+
+        df_transformed = df.copy() if self.copy else df
+        for feature in self.features:
+            codes, categories = pd.factorize(df[feature])
+            n_categories = len(categories)
+            rows = labelled & (codes >= 0)
+            cells = folds[rows] * n_categories + codes[rows]
+            sums = np.bincount(cells, weights=y[rows], minlength=self.n_splits * n_categories)
+            counts = np.bincount(cells, minlength=self.n_splits * n_categories)
+            sums = sums.reshape(self.n_splits, n_categories)
+            counts = counts.reshape(self.n_splits, n_categories)
+            out_of_fold = (sums.sum(axis=0) - sums + self.smoothing * priors[:, None]) / (
+                counts.sum(axis=0) - counts + self.smoothing
+            )
+            encoded = priors[folds]
+            present = codes >= 0
+            encoded[present] = out_of_fold[folds[present], codes[present]]
+            df_transformed[feature] = encoded
+        logging.info("Cross-fitted target encoding completed.")
+        return df_transformed
+
+    def _target_values(self, df: pd.DataFrame):
+        """Returns the target as floats and the mask of rows where it is known."""
+        if self.target not in df.columns:
+            raise ValueError(f"Target column '{self.target}' is required to fit TargetEncoding.")
+        y = df[self.target].to_numpy(dtype=np.float64, na_value=np.nan)
+        return y, ~np.isnan(y)
+
+
+# Concrete Strategy for Frequency Encoding
+# ----------------------------------------
+# This strategy encodes each category by how often it occurs in the training data.
+class FrequencyEncoding(CategoryEncodingStrategy):
+    def __init__(self, features, normalize=True, copy=True):
+        """
+        Initializes the FrequencyEncoding with the specific features to encode.
+
+        The target is not used, so there is nothing to leak and no cross-fitting is needed.
+        Missing and unseen categories are encoded as 0.
+
+        Parameters:
+        features (list): The list of categorical features to encode.
+        normalize (bool): If True, encode the share of training rows in the category rather
+            than its row count.
+        copy (bool): If False, replace the features by their encodings in the input DataFrame
+            in place instead of a copy.
+        """
+        super().__init__(features, copy=copy)
+        self.normalize = normalize
+
+    def get_params(self) -> dict:
+        return {"features": list(self.features), "normalize": self.normalize}
+
+    def _fit_tables(self, df: pd.DataFrame):
+        self.default_ = 0.0
+        self.tables_ = {}
+        for feature in self.features:
+            codes, categories = pd.factorize(df[feature])
+            counts = np.bincount(codes[codes >= 0], minlength=len(categories)).astype(np.float64)
+            self.tables_[feature] = (pd.Index(categories), counts / len(df) if self.normalize else counts)
+
+
+# Composite Strategy for applying several strategies in one pass
+# --------------------------------------------------------------
+# This strategy applies an ordered list of strategies, materializing only the final frame.
+class CompositeFeatureEngineering(FeatureEngineeringStrategy):
+    def __init__(self, strategies, copy=True):
+        """
+        Initializes the CompositeFeatureEngineering with an ordered list of strategies.
+
+        The input is copied at most once and every strategy then works in place on that one
+        frame. Consecutive column-wise strategies (log, scaling) are fused: the union of their
+        features is pulled into one float block, each transformation runs on the block in
+        turn, and the block is written back to the frame once.
+
+        The composite works on its own copies of the strategies, so the instances passed in are
+        neither fitted nor switched to in-place mode, and behave the same when used on their own.
+
+        Parameters:
+        strategies (list): The strategies to apply in order, as instances or as `to_dict` output.
+        copy (bool): If False, transform the input DataFrame in place instead of a copy.
+        """
+        self.strategies = [
+            FeatureEngineeringStrategy.from_dict(strategy) if isinstance(strategy, dict) else deepcopy(strategy)
+            for strategy in strategies
+        ]
+        for strategy in self.strategies:
+            strategy.copy = False  # The composite owns the only copy
+        self.copy = copy
+
+    @property
+    def features(self) -> list:
+        """The features of all strategies, in order of first use."""
+        return list(dict.fromkeys(feature for strategy in self.strategies for feature in strategy.features))
+
+    def get_params(self) -> dict:
+        return {"strategies": [strategy.to_dict() for strategy in self.strategies]}
+
+    def fit(self, df: pd.DataFrame) -> "CompositeFeatureEngineering":
+        """
+        Fits every strategy on the output of the strategies before it.
+
+        Parameters:
+        df (pd.DataFrame): The training dataframe; it is not modified.
+
+        Returns:
+        CompositeFeatureEngineering: The fitted strategy.
+        """
+        self._run(df.copy(), fit=True)
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Applies the fitted strategies in order.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to transform.
+
+        Returns:
+        pd.DataFrame: The dataframe with all transformations applied.
+        """
+        return self._run(df.copy() if self.copy else df, fit=False)
+
+    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fits and applies every strategy in a single pass over the data.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to transform.
+
+        Returns:
+        pd.DataFrame: The dataframe with all transformations applied.
+        """
+        return self._run(df.copy() if self.copy else df, fit=True)
+
+    def _run(self, df: pd.DataFrame, fit: bool) -> pd.DataFrame:
+        """Applies (and with fit=True, first fits) the strategies in order, in place on `df`."""
+        logging.info(f"Applying {len(self.strategies)} feature engineering strategies in one pass.")
+        run = []
+        for strategy in self.strategies + [None]:
+            if isinstance(strategy, ColumnWiseFeatureEngineeringStrategy):
+                run.append(strategy)
+                continue
+            if run:
+                _apply_fused(df, run, fit)
+                run = []
+            if strategy is not None:
+                # apply_transformation, so that e.g. target encoding is cross-fitted in training
+                df = strategy.apply_transformation(df) if fit else strategy.transform(df)
+        logging.info("Composite feature engineering completed.")
+        return df
+
+
+def _apply_fused(df: pd.DataFrame, strategies: list, fit: bool, copy: bool = False) -> pd.DataFrame:
+    """
+    Applies consecutive column-wise strategies to `df` through one shared float block, fitting
+    each on the output of the ones before it when `fit` is True.
+
+    The block is written back to `df` in place, or with copy=True into a new frame that shares
+    the untouched columns with `df` copy-on-write instead of copying them.
+    """
+    columns = list(dict.fromkeys(feature for strategy in strategies for feature in strategy.features))
+    block = df[columns].to_numpy(dtype=np.float64, copy=True)
+    positions = {column: i for i, column in enumerate(columns)}
+    for strategy in strategies:
+        indices = [positions[feature] for feature in strategy.features]
+        # A strategy over the whole block transforms it directly instead of a gathered copy
+        whole_block = indices == list(range(len(columns)))
+        values = block if whole_block else block[:, indices]
+        if fit:
+            strategy.fit(pd.DataFrame(values, columns=strategy.features, copy=False))
+        values = strategy.transform_values(values)
+        if not whole_block:
+            block[:, indices] = values
+    if copy:
+        transformed = pd.DataFrame(block, columns=columns, index=df.index, copy=False)
+        return pd.concat([df.drop(columns=columns), transformed], axis=1)[df.columns]
+    df[columns] = block
+    return df
+
+
+def sparse_frame(matrix, columns, index) -> pd.DataFrame:
+    """
+    Wraps a scipy sparse matrix as pandas sparse columns with a fill value of 0, one column
+    slice at a time; only the stored entries of each column are kept.
+
+    Parameters:
+    matrix: The scipy sparse matrix.
+    columns (list): The column names.
+    index (pd.Index): The row index.
+
+    Returns:
+    pd.DataFrame: A frame of Sparse[float64, 0] columns.
+    """
+    matrix = sp.csc_matrix(matrix, dtype=np.float64)
+    return pd.DataFrame(
+        {column: pd.arrays.SparseArray.from_spmatrix(matrix[:, [i]]) for i, column in enumerate(columns)},
+        index=index,
+    )
+
+
+def sparse_frame_to_csr(df: pd.DataFrame) -> sp.csr_matrix:
+    """
+    Converts a frame of pandas sparse columns to a CSR matrix without densifying it, e.g. as a
+    FunctionTransformer in front of a model that accepts sparse input.
+
+    Parameters:
+    df (pd.DataFrame): A frame whose columns are all sparse.
+
+    Returns:
+    sp.csr_matrix: The same values as a CSR matrix.
+    """
+    return df.sparse.to_coo().tocsr()
+
+
+def _encoded_frame(encoded, columns, index) -> pd.DataFrame:
+    """Wraps an encoder's dense or sparse output as a DataFrame."""
+    if sp.issparse(encoded):
+        return sparse_frame(encoded, columns, index)
+    return pd.DataFrame(encoded, columns=columns, index=index)
+
+
+def _fitted_attributes(estimator) -> dict:
+    """Returns the fitted attributes of a scikit-learn estimator (those ending in '_') as JSON types."""
+    attributes = {name: value for name, value in vars(estimator).items() if name.endswith("_")}
+    if not attributes:
+        raise ValueError(f"{type(estimator).__name__} must be fitted before it can be serialized.")
+    return {
+        name: value.tolist() if isinstance(value, np.ndarray) else _to_builtin(value)
+        for name, value in attributes.items()
+    }
+
+
+def _restore_attributes(estimator, state: dict):
+    """Sets fitted attributes returned by `_fitted_attributes` back on a scikit-learn estimator."""
+    for name, value in state.items():
+        if name == "feature_names_in_":
+            value = np.asarray(value, dtype=object)
+        elif isinstance(value, list):
+            value = np.asarray(value, dtype=np.float64)
+        setattr(estimator, name, value)
+
+
+def _strategy_classes() -> dict:
+    """Returns every FeatureEngineeringStrategy subclass by name, for `from_dict`."""
+    classes, pending = {}, [FeatureEngineeringStrategy]
+    while pending:
+        for subclass in pending.pop().__subclasses__():
+            classes[subclass.__name__] = subclass
+            pending.append(subclass)
+    return classes
+
+
 # Context Class for Feature Engineering
 # -------------------------------------
 # This class uses a FeatureEngineeringStrategy to apply transformations to a dataset.
@@ -184,6 +897,15 @@ class FeatureEngineer:
         logging.info("Switching feature engineering strategy.")
         self._strategy = strategy
 
+    def get_strategy(self) -> FeatureEngineeringStrategy:
+        """
+        Returns the current strategy, e.g. to serialize its fitted state after training.
+
+        Returns:
+        FeatureEngineeringStrategy: The strategy used for feature engineering.
+        """
+        return self._strategy
+
     def apply_feature_engineering(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Executes the feature engineering transformation using the current strategy.
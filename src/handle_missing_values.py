@@ -1,7 +1,11 @@
+import json
 import logging
 from abc import ABC, abstractmethod
+from typing import Iterable, Iterator
 
+import numpy as np
 import pandas as pd
+from src.quantile_sketch import QuantileSketch
 
 # Setup logging configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -54,21 +58,117 @@ class DropMissingValuesStrategy(MissingValueHandlingStrategy):
 
 # Concrete Strategy for Filling Missing Values
 class FillMissingValuesStrategy(MissingValueHandlingStrategy):
-    def __init__(self, method="mean", fill_value=None):
+    def __init__(self, method="mean", fill_value=None, copy=True):
         """
         Initializes the FillMissingValuesStrategy with a specific method or fill value.
 
         Parameters:
         method (str): The method to fill missing values ('mean', 'median', 'mode', or 'constant').
         fill_value (any): The constant value to fill missing values when method='constant'.
+        copy (bool): If False, fill the input DataFrame in place instead of a copy.
         """
         self.method = method
         self.fill_value = fill_value
+        self.copy = copy
+        self.fill_values_ = None
+
+    def fit(self, df: pd.DataFrame) -> "FillMissingValuesStrategy":
+        """
+        Records the fill value of every column once, so that `transform` never recomputes
+        statistics (e.g. from a two-row inference request).
+
+        All fill values are computed up front (see `compute_fill_statistics`).
+        'mean' and 'median' only cover numeric columns; 'mode' and 'constant' cover all columns.
+
+        Parameters:
+        df (pd.DataFrame): The training DataFrame to learn the fill values from.
+
+        Returns:
+        FillMissingValuesStrategy: The fitted strategy.
+        """
+        logging.info(f"Fitting fill values using method: {self.method}")
+        if self.method == "constant":
+            fill_values = {column: self.fill_value for column in df.columns}
+        elif self.method in ("mean", "median", "mode"):
+            statistics = compute_fill_statistics(df, [self.method]).loc[self.method]
+            fill_values = {column: _to_builtin(value) for column, value in statistics.dropna().items()}
+        else:
+            logging.warning(f"Unknown method '{self.method}'. No fill values recorded.")
+            fill_values = {}
+
+        self.fill_values_ = fill_values
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fills missing values with the fitted fill values.
+
+        This is a single O(n) apply that only touches columns with missing values: numeric
+        gaps are filled with one masked copy over a float block (or column by column when
+        copy=False, to keep memory flat) and the remaining columns with their own array's
+        fillna; no statistics are computed. Columns without a fitted fill value are left
+        untouched.
+
+        Parameters:
+        df (pd.DataFrame): The input DataFrame containing missing values.
+
+        Returns:
+        pd.DataFrame: The DataFrame with missing values filled.
+        """
+        if self.fill_values_ is None:
+            raise ValueError("FillMissingValuesStrategy must be fitted before calling transform.")
+
+        fill_values = pd.Series(
+            {column: value for column, value in self.fill_values_.items() if column in df.columns},
+            dtype=object,
+        )
+        return self._fill(df, fill_values[_incomplete_columns(df, fill_values.index)])
+
+    def _fill(self, df: pd.DataFrame, fill_values: pd.Series) -> pd.DataFrame:
+        """Fills the columns of `fill_values`, which must all have missing values, with their values."""
+        # Filled columns are replaced, never written into, so a shallow copy is enough: it
+        # shares the untouched columns with the input
+        df_cleaned = df.copy(deep=False) if self.copy else df
+        # A non-numeric fill value (e.g. a constant string) goes through fillna instead
+        numeric_columns = fill_values.index[
+            [
+                pd.api.types.is_numeric_dtype(df[column]) and isinstance(value, (int, float, np.number))
+                for column, value in fill_values.items()
+            ]
+        ]
+        if self.copy:
+            # One float block for all numeric gaps: fastest, but it needs a temporary block
+            _fill_numeric_block(df_cleaned, fill_values[numeric_columns])
+            fillna_columns = fill_values.index.difference(numeric_columns, sort=False)
+        else:
+            # Column by column, so at most one extra column is alive at a time
+            fillna_columns = fill_values.index
+
+        for column in fillna_columns:
+            value = fill_values[column]
+            dtype = df_cleaned[column].dtype
+            # A categorical column only accepts fill values among its categories
+            if isinstance(dtype, pd.CategoricalDtype) and value not in dtype.categories:
+                df_cleaned[column] = df_cleaned[column].cat.add_categories([value])
+            if pd.api.types.is_numeric_dtype(dtype):
+                df_cleaned[column] = df_cleaned[column].fillna(value)
+            else:
+                # The array's own fillna fills Arrow-backed strings several times faster than
+                # Series.fillna, which goes through a masked replace
+                df_cleaned[column] = df_cleaned[column].array.fillna(value)
+
+        logging.info("Missing values filled.")
+        return df_cleaned
 
     def handle(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Fills missing values using the specified method or constant value.
 
+        Equivalent to `fit(df).transform(df)`, except that fill values are only computed for
+        the columns of `df` that have missing values (and, for 'mean' and 'median', are
+        numeric), which are found once; use `fit` to record fill values for every column
+        (e.g. for serving, where any column can have gaps).
+
         Parameters:
         df (pd.DataFrame): The input DataFrame containing missing values.
 
@@ -76,28 +176,336 @@ class FillMissingValuesStrategy(MissingValueHandlingStrategy):
         pd.DataFrame: The DataFrame with missing values filled.
         """
         logging.info(f"Filling missing values using method: {self.method}")
+        if self.method in ("mean", "median"):
+            columns = df.select_dtypes(include="number").columns
+        else:
+            columns = df.columns
+        self.fit(df[_incomplete_columns(df, columns)])
+        return self._fill(df, pd.Series(self.fill_values_, dtype=object))
 
-        df_cleaned = df.copy()
-        if self.method == "mean":
-            numeric_columns = df_cleaned.select_dtypes(include="number").columns
-            df_cleaned[numeric_columns] = df_cleaned[numeric_columns].fillna(
-                df[numeric_columns].mean()
-            )
-        elif self.method == "median":
-            numeric_columns = df_cleaned.select_dtypes(include="number").columns
-            df_cleaned[numeric_columns] = df_cleaned[numeric_columns].fillna(
-                df[numeric_columns].median()
-            )
-        elif self.method == "mode":
-            for column in df_cleaned.columns:
-                df_cleaned[column].fillna(df[column].mode().iloc[0], inplace=True)
+    def to_dict(self) -> dict:
+        """
+        Returns the fitted state as a JSON-serializable dictionary.
+
+        Returns:
+        dict: The method, the constant fill value and the per-column fill values.
+        """
+        if self.fill_values_ is None:
+            raise ValueError("FillMissingValuesStrategy must be fitted before it can be serialized.")
+        return {
+            "method": self.method,
+            "fill_value": _to_builtin(self.fill_value),
+            "fill_values": dict(self.fill_values_),
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "FillMissingValuesStrategy":
+        """
+        Rebuilds a fitted strategy from the output of `to_dict`.
+
+        Parameters:
+        state (dict): The serialized fitted state.
+
+        Returns:
+        FillMissingValuesStrategy: A fitted strategy, ready for `transform`.
+        """
+        strategy = cls(method=state["method"], fill_value=state.get("fill_value"))
+        strategy.fill_values_ = dict(state["fill_values"])
+        return strategy
+
+    def save(self, path: str):
+        """
+        Saves the fitted fill values as JSON, e.g. next to the model artifact.
+
+        Parameters:
+        path (str): The JSON file to write.
+        """
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        logging.info(f"Saved {len(self.fill_values_)} fill values to {path}")
+
+    @classmethod
+    def load(cls, path: str) -> "FillMissingValuesStrategy":
+        """
+        Loads fill values saved with `save`.
+
+        Parameters:
+        path (str): The JSON file to read.
+
+        Returns:
+        FillMissingValuesStrategy: A fitted strategy, ready for `transform`.
+        """
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+
+# Concrete Strategy for Filling Missing Values of data that does not fit in memory
+class StreamingFillMissingValuesStrategy(FillMissingValuesStrategy):
+    def __init__(self, method="mean", fill_value=None, relative_accuracy=0.01, copy=True):
+        """
+        Initializes the StreamingFillMissingValuesStrategy.
+
+        Fill values are learnt in one pass over an iterator of chunks and applied in a
+        second one, so only one chunk is in memory at a time. Means and modes are exact;
+        medians come from a QuantileSketch and are within `relative_accuracy` of the
+        true median.
+
+        Parameters:
+        method (str): The method to fill missing values ('mean', 'median', 'mode', or 'constant').
+        fill_value (any): The constant value to fill missing values when method='constant'.
+        relative_accuracy (float): The relative error bound of the median estimates.
+        copy (bool): If False, fill each chunk in place instead of a copy.
+        """
+        super().__init__(method=method, fill_value=fill_value, copy=copy)
+        self.relative_accuracy = relative_accuracy
+
+    def fit(self, df: pd.DataFrame) -> "StreamingFillMissingValuesStrategy":
+        """
+        Fits on a single in-memory DataFrame, treated as one chunk.
+
+        Parameters:
+        df (pd.DataFrame): The training DataFrame to learn the fill values from.
+
+        Returns:
+        StreamingFillMissingValuesStrategy: The fitted strategy.
+        """
+        return self.fit_chunks([df])
+
+    def fit_chunks(self, chunks: Iterable[pd.DataFrame]) -> "StreamingFillMissingValuesStrategy":
+        """
+        Learns the fill values in a single pass over DataFrame chunks with the same columns.
+
+        Per-column running state is kept instead of the data: sums and counts for 'mean',
+        one QuantileSketch per column for 'median', and value counts for 'mode'.
+
+        Parameters:
+        chunks (Iterable[pd.DataFrame]): The training data, chunk by chunk.
+
+        Returns:
+        StreamingFillMissingValuesStrategy: The fitted strategy.
+        """
+        logging.info(f"Fitting fill values over chunks using method: {self.method}")
+        if self.method not in ("mean", "median", "mode", "constant"):
+            logging.warning(f"Unknown method '{self.method}'. No fill values recorded.")
+            self.fill_values_ = {}
+            return self
+
+        columns, sums, counts, sketches, value_counts = None, None, None, {}, {}
+        n_rows = 0
+        for chunk in chunks:
+            if columns is None:
+                columns = chunk.columns
+                numeric_columns = chunk.select_dtypes(include="number").columns
+                sums = pd.Series(0.0, index=numeric_columns)
+                counts = pd.Series(0, index=numeric_columns)
+                sketches = {column: QuantileSketch(self.relative_accuracy) for column in numeric_columns}
+            n_rows += len(chunk)
+
+            if self.method == "mean":
+                numeric_chunk = chunk[numeric_columns]
+                sums += numeric_chunk.sum().astype(np.float64)
+                counts += numeric_chunk.count()
+            elif self.method == "median":
+                for column in numeric_columns:
+                    sketches[column].add(chunk[column].to_numpy(dtype=np.float64, na_value=np.nan))
+            elif self.method == "mode":
+                for column in columns:
+                    chunk_counts = chunk[column].value_counts(sort=False)
+                    if column in value_counts:
+                        chunk_counts = value_counts[column].add(chunk_counts, fill_value=0)
+                    value_counts[column] = chunk_counts
+
+        if columns is None:
+            fill_values = {}
         elif self.method == "constant":
-            df_cleaned = df_cleaned.fillna(self.fill_value)
+            fill_values = {column: self.fill_value for column in columns}
+        elif self.method == "mean":
+            fill_values = (sums / counts.where(counts > 0)).dropna().to_dict()
+        elif self.method == "median":
+            fill_values = {
+                column: sketch.quantile(0.5) for column, sketch in sketches.items() if sketch.count
+            }
         else:
-            logging.warning(f"Unknown method '{self.method}'. No missing values handled.")
+            fill_values = {
+                column: _count_mode(column_counts)
+                for column, column_counts in value_counts.items()
+                if len(column_counts)
+            }
 
-        logging.info("Missing values filled.")
-        return df_cleaned
+        self.fill_values_ = {column: _to_builtin(value) for column, value in fill_values.items()}
+        logging.info(f"Fitted {len(self.fill_values_)} fill values over {n_rows} rows.")
+        return self
+
+    def transform_chunks(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """
+        Fills missing values chunk by chunk with the fitted fill values.
+
+        Parameters:
+        chunks (Iterable[pd.DataFrame]): The data to fill, chunk by chunk.
+
+        Returns:
+        Iterator[pd.DataFrame]: The filled chunks.
+        """
+        for chunk in chunks:
+            yield self.transform(chunk)
+
+
+def compute_fill_statistics(df: pd.DataFrame, statistics=("mean", "median", "mode")) -> pd.DataFrame:
+    """
+    Computes per-column fill statistics for every column of a DataFrame.
+
+    Means are one block-wise reduction. Numeric columns are stacked into one float block that
+    is sorted once, column-wise, and every median and numeric mode is read off that sorted
+    block (a mode is the longest run of equal values). Categorical modes are one bincount over
+    the stacked codes of all categorical columns, and the other columns are stacked by dtype
+    and counted with one factorize per dtype. Ties go to the smallest value (the first
+    category), like pandas' Series.mode().iloc[0]. The sort is skipped when only means are
+    asked for.
+
+    Parameters:
+    df (pd.DataFrame): The input DataFrame.
+    statistics (list): Which of 'mean', 'median' and 'mode' to compute; mean and median are
+        only computed for numeric columns.
+
+    Returns:
+    pd.DataFrame: One row per statistic and one column per input column; NaN where a statistic
+        is undefined (all values missing, or mean/median of a non-numeric column).
+    """
+    result = pd.DataFrame(np.nan, index=list(statistics), columns=df.columns, dtype=object)
+    numeric_columns = df.select_dtypes(include="number").columns
+
+    if len(numeric_columns):
+        if "mean" in statistics:
+            # A block-wise reduction already; pandas sums each same-dtype block in one call
+            means = df.mean(numeric_only=True)
+            result.loc["mean", numeric_columns] = means[numeric_columns].to_numpy()
+        if "median" in statistics or "mode" in statistics:
+            numeric_block = df[numeric_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+            sorted_block = np.sort(numeric_block, axis=0)  # NaN sorts last
+            del numeric_block
+            if "median" in statistics:
+                result.loc["median", numeric_columns] = _sorted_medians(sorted_block)
+            if "mode" in statistics:
+                modes = _sorted_modes(sorted_block)
+                # Integer columns keep integer modes, as Series.mode returns them
+                result.loc["mode", numeric_columns] = [
+                    dtype.type(mode) if pd.api.types.is_integer_dtype(dtype) and not np.isnan(mode) else mode
+                    for dtype, mode in zip(df.dtypes[numeric_columns], modes)
+                ]
+
+    if "mode" in statistics:
+        other_columns = df.columns.difference(numeric_columns, sort=False)
+        categorical = [isinstance(dtype, pd.CategoricalDtype) for dtype in df.dtypes[other_columns]]
+        categorical_columns = other_columns[categorical]
+        if len(categorical_columns):
+            result.loc["mode", categorical_columns] = _categorical_modes(df[categorical_columns])
+        other_dtypes = df.dtypes[other_columns[~np.array(categorical, dtype=bool)]]
+        for _, dtypes in other_dtypes.groupby(other_dtypes.astype(str), sort=False):
+            result.loc["mode", dtypes.index] = _stacked_modes(df[dtypes.index])
+
+    return result
+
+
+def _to_builtin(value):
+    """Converts numpy scalars to the equivalent Python scalars, so they serialize as JSON."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _count_mode(value_counts: pd.Series):
+    """Returns the most frequent value of a value-count Series; ties go to the smallest value."""
+    top = value_counts[value_counts == value_counts.max()]
+    return top.index.sort_values()[0]
+
+
+def _sorted_modes(sorted_block: np.ndarray) -> np.ndarray:
+    """
+    Returns the mode of each column of a column-wise sorted block with NaN last: the longest
+    run of equal values, the first (smallest) one on ties, or NaN if all values are missing.
+    """
+    n_rows, n_columns = sorted_block.shape
+    modes = np.full(n_columns, np.nan)
+    if not n_rows:
+        return modes
+    values = sorted_block.T.ravel()  # Column after column, each sorted
+    run_starts = np.ones(len(values), dtype=bool)
+    run_starts[1:] = values[1:] != values[:-1]
+    run_starts[::n_rows] = True  # A run never continues into the next column
+    starts = np.flatnonzero(run_starts)
+    lengths = np.diff(starts, append=len(values))
+    starts, lengths = starts[~np.isnan(values[starts])], lengths[~np.isnan(values[starts])]
+    columns = starts // n_rows
+    # Longest run first within each column, the earliest (smallest value) on ties
+    order = np.lexsort((starts, -lengths, columns))
+    first = order[np.r_[True, columns[order][1:] != columns[order][:-1]]]
+    modes[columns[first]] = values[starts[first]]
+    return modes
+
+
+def _categorical_modes(df: pd.DataFrame) -> list:
+    """
+    Returns the mode of each categorical column (the first category on ties, NaN if all values
+    are missing), counting the codes of all columns with one bincount.
+    """
+    sizes = np.array([len(dtype.categories) + 1 for dtype in df.dtypes])  # + 1 for missing (-1)
+    offsets = np.cumsum(sizes) - sizes + 1
+    codes = np.concatenate([df[column].array.codes.astype(np.intp) + offset for column, offset in zip(df.columns, offsets)])
+    counts = np.bincount(codes, minlength=sizes.sum())
+    modes = []
+    for dtype, offset, size in zip(df.dtypes, offsets, sizes):
+        column_counts = counts[offset : offset + size - 1]
+        best = column_counts.argmax() if len(column_counts) else 0
+        modes.append(dtype.categories[best] if len(column_counts) and column_counts[best] else np.nan)
+    return modes
+
+
+def _stacked_modes(df: pd.DataFrame) -> list:
+    """
+    Returns the mode of each column of a frame whose columns share one dtype (the smallest
+    value on ties, NaN if all values are missing), factorizing all columns at once and
+    counting the codes with one bincount.
+    """
+    n_rows, n_columns = df.shape
+    codes, uniques = pd.factorize(pd.concat([df[column] for column in df.columns], ignore_index=True), sort=True)
+    size = len(uniques) + 1  # + 1 for missing (-1)
+    keys = codes.reshape(n_columns, n_rows) + (np.arange(n_columns) * size + 1)[:, None]
+    counts = np.bincount(keys.ravel(), minlength=n_columns * size).reshape(n_columns, size)[:, 1:]
+    best = counts.argmax(axis=1) if len(uniques) else np.zeros(n_columns, dtype=np.intp)
+    return [
+        uniques[code] if len(uniques) and counts[column, code] else np.nan
+        for column, code in enumerate(best)
+    ]
+
+
+def _incomplete_columns(df: pd.DataFrame, columns: pd.Index) -> pd.Index:
+    """Returns the `columns` of `df` that contain at least one missing value, without copying them."""
+    return columns[[df[column].hasnans for column in columns]]
+
+
+def _sorted_medians(sorted_block: np.ndarray) -> np.ndarray:
+    """Returns the median of each column of a column-wise sorted block with NaN last."""
+    counts = np.count_nonzero(~np.isnan(sorted_block), axis=0)
+    columns = np.arange(sorted_block.shape[1])
+    low = np.maximum((counts - 1) // 2, 0)
+    high = np.maximum(counts // 2 - (counts == 0), 0)
+    medians = (sorted_block[low, columns] + sorted_block[high, columns]) / 2
+    return np.where(counts > 0, medians, np.nan)
+
+
+def _fill_numeric_block(df: pd.DataFrame, fill_values: pd.Series):
+    """
+    Fills missing values of numeric columns in place with a single masked copy over one float
+    block, instead of one fillna per column. Columns without a fill value are left untouched.
+    """
+    columns = fill_values.dropna().index
+    if not len(columns):
+        return
+    block = df[columns].to_numpy(dtype=np.float64, copy=True)
+    values = np.broadcast_to(fill_values[columns].to_numpy(dtype=np.float64), block.shape)
+    # Fill the block itself rather than allocating a second one for the result
+    np.copyto(block, values, where=np.isnan(block))
+    df[columns] = pd.DataFrame(block, index=df.index, columns=columns, copy=False).astype(
+        df.dtypes[columns].to_dict(), copy=False
+    )
 
 
 # Context Class for Handling Missing Values
@@ -1,13 +1,32 @@
+import io
+import logging
+import mmap
 import os
+import time
 import zipfile
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
 class DataIngestor(ABC):
     """
     Abstract base class for data ingestion strategies.
     """
+    # Attributes that only change how the data is read, not the result (e.g. parallelism);
+    # CachedDataIngestor leaves them out of its cache key
+    execution_options = ()
+
     @abstractmethod
     def ingest(self, file_path: str) -> pd.DataFrame:
         """
@@ -21,70 +40,654 @@ class DataIngestor(ABC):
         """
         pass
 
+    def ingest_chunks(self, file_path: str, chunksize: int = 100_000) -> Iterator[pd.DataFrame]:
+        """
+        Ingest data from a file as an iterator of DataFrame chunks.
+
+        Ingestors that cannot stream fall back to yielding the whole frame as a single chunk.
+
+        Parameters:
+        file_path (str): Path to the file to ingest.
+        chunksize (int): The number of rows per chunk.
+
+        Returns:
+        Iterator[pd.DataFrame]: The ingested data, chunk by chunk.
+        """
+        yield self.ingest(file_path)
+
 class ZipDataIngestor(DataIngestor):
     """
-    Strategy for ingesting data from ZIP files containing CSV.
+    Strategy for ingesting CSV data: a ZIP of one or more CSV members, a CSV file, or a
+    directory of CSV shards.
     """
+    execution_options = ("max_workers", "use_mmap")
+
+    def __init__(
+        self,
+        columns: Optional[List[str]] = None,
+        schema: Optional[Dict[str, str]] = None,
+        max_workers: Optional[int] = None,
+        use_mmap: bool = False,
+    ):
+        """
+        Initializes the ZipDataIngestor.
+
+        Parameters:
+        columns (list): The columns to parse; all columns are parsed if None.
+        schema (dict): Column name to dtype (e.g. src.ames_schema.AMES_DTYPES), applied while
+            parsing. Columns not in the schema have their dtype inferred.
+        max_workers (int): Processes used to parse multiple shards; defaults to the CPU count.
+        use_mmap (bool): Parse a plain (uncompressed) CSV file by memory-mapping it and parsing
+            line-aligned byte ranges in parallel worker processes (see `_read_csv_mmap`).
+        """
+        self.columns = columns
+        self.schema = schema
+        self.max_workers = max_workers
+        self.use_mmap = use_mmap
+
     def ingest(self, file_path: str) -> pd.DataFrame:
         """
-        Ingest data from a ZIP file, extract CSV, and return DataFrame.
+        Ingest data from a ZIP file, CSV file or directory of CSV shards and return a DataFrame.
+
+        CSV members are read straight out of the ZIP without extracting it. Multiple shards
+        (ZIP members or files in a directory) are parsed concurrently in a process pool and
+        concatenated in sorted name order, so the result does not depend on scheduling.
 
         Parameters:
-        file_path (str): Path to the ZIP file.
+        file_path (str): Path to the ZIP file, CSV file or directory.
 
         Returns:
         pd.DataFrame: The ingested data.
 
         Raises:
-        ValueError: If the file is not a ZIP file or multiple CSV files are found.
-        FileNotFoundError: If no CSV file is found in the ZIP.
-        """
-        # Support both ZIP archives and direct CSV paths.
-        if file_path.endswith(".zip"):
-            # Extract from the zipfile
-            with zipfile.ZipFile(file_path, "r") as zip_ref:
-                zip_ref.extractall("extracted_data")
-            # Find the extracted CSV file (assuming there is one CSV)
-            extracted_files = os.listdir("extracted_data")
-            csv_files = [f for f in extracted_files if f.endswith(".csv")]
-            if len(csv_files) == 0:
-                raise FileNotFoundError("No CSV file found in the ZIP archive")
-            if len(csv_files) > 1:
-                raise ValueError("More than one CSV file found in the ZIP archive")
-            csv_file_path = os.path.join("extracted_data", csv_files[0])
-        elif file_path.endswith(".csv"):
-            csv_file_path = file_path
+        ValueError: If the file type is unsupported or a shard's columns differ from the first shard's.
+        FileNotFoundError: If no CSV file is found in the ZIP or directory.
+        """
+        sources = _csv_sources(file_path)
+        read_kwargs = {"usecols": self.columns, "dtype": self.schema}
+
+        start = time.perf_counter()
+        max_workers = min(self.max_workers or os.cpu_count() or 1, len(sources))
+        if self.use_mmap and len(sources) == 1 and sources[0][1] is None:
+            mmap_workers = self.max_workers or os.cpu_count() or 1
+            shards = [_read_csv_mmap(sources[0][0], read_kwargs, mmap_workers)]
+        elif max_workers == 1:
+            shards = [_read_csv_source(source, read_kwargs) for source in sources]
         else:
-            raise ValueError("Unsupported file type for ingestion; expected .zip or .csv")
+            logging.info(f"Parsing {len(sources)} CSV shards with {max_workers} worker processes.")
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                shards = list(executor.map(_read_csv_source, sources, repeat(read_kwargs)))
+        _check_shard_schemas(sources, shards)
+        df = _concat_shards(shards)
+        elapsed = time.perf_counter() - start
 
-        df = pd.read_csv(csv_file_path)
+        megabytes = sum(_source_size(source) for source in sources) / 1024**2
+        logging.info(
+            f"Ingested {len(df)} rows from {len(sources)} shard(s) in {elapsed:.2f}s "
+            f"({len(df) / elapsed:,.0f} rows/s, {megabytes / elapsed:,.1f} MB/s)."
+        )
         return df
 
+    def ingest_chunks(self, file_path: str, chunksize: int = 100_000) -> Iterator[pd.DataFrame]:
+        """
+        Stream a ZIP, CSV file or directory of CSV shards as DataFrame chunks of at most `chunksize` rows.
+
+        The CSV is read straight out of the ZIP member, so nothing is extracted to disk and
+        only one chunk is held in memory at a time. Shards are streamed one after another in
+        sorted name order. Every chunk has the same dtypes: those in the schema, with the rest
+        fixed from the first chunk (see `_stream_dtypes`), or for a column that is empty in the
+        first chunk, from the first chunk it has values in (found by a scan of just those
+        columns, see `_first_valued_dtypes`). Categorical schema columns are
+        streamed as object, since their categories are only known once all data has been read.
+
+        Parameters:
+        file_path (str): Path to the ZIP file, CSV file or directory.
+        chunksize (int): The number of rows per chunk.
+
+        Returns:
+        Iterator[pd.DataFrame]: The ingested data, chunk by chunk.
+
+        Raises:
+        ValueError: If the file type is unsupported, a shard's columns differ from the first
+            shard's, or a chunk's values do not fit the dtypes fixed from the first chunk.
+        FileNotFoundError: If no CSV file is found in the ZIP or directory.
+        """
+        schema = {
+            column: (object if dtype == "category" else dtype)
+            for column, dtype in (self.schema or {}).items()
+        }
+        dtypes = None
+        sources = _csv_sources(file_path)
+        for source in sources:
+            with _open_csv_source(source) as csv_file:
+                reader = pd.read_csv(csv_file, usecols=self.columns, dtype=schema, chunksize=chunksize)
+                for chunk in reader:
+                    if dtypes is None:
+                        dtypes = _stream_dtypes(chunk)
+                        empty_columns = [c for c in chunk.columns if c not in schema and chunk[c].isna().all()]
+                        if empty_columns:
+                            dtypes.update(_first_valued_dtypes(sources, empty_columns, chunksize))
+                        dtypes.update({c: t for c, t in schema.items() if c in dtypes})
+                    elif list(chunk.columns) != list(dtypes):
+                        raise ValueError(
+                            f"CSV shard {_source_name(source)} has columns {list(chunk.columns)}, "
+                            f"expected {list(dtypes)}"
+                        )
+                    try:
+                        chunk = chunk.astype(dtypes, copy=False)
+                    except (TypeError, ValueError) as e:
+                        raise ValueError(
+                            f"A chunk of {_source_name(source)} does not fit the dtypes of the first "
+                            f"chunk ({e}); pass the column's dtype in the schema."
+                        ) from e
+                    yield chunk
+
+
+class ArrowDatasetIngestor(DataIngestor):
+    """
+    Strategy for ingesting columnar files (or partitioned directories of them) with pyarrow.
+
+    Only the requested columns are read, and the filters are pushed down to the scan, so
+    Parquet row groups (and hive partitions) whose statistics rule them out are skipped.
+    """
+    file_format = None
+
+    def __init__(
+        self,
+        columns: Optional[List[str]] = None,
+        filters: Optional[list] = None,
+        schema: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initializes the ArrowDatasetIngestor.
+
+        Parameters:
+        columns (list): The columns to read; all columns are read if None.
+        filters (list): Row filters in pyarrow's DNF form, e.g. [("Yr Sold", ">=", 2008)].
+        schema (dict): Column name to dtype, applied to columns whose stored type differs.
+        """
+        self.columns = columns
+        self.filters = filters
+        self.schema = schema
+
+    def _scan_options(self) -> dict:
+        """Return the projection and predicate passed to every dataset scan."""
+        return {
+            "columns": self.columns,
+            "filter": pq.filters_to_expression(self.filters) if self.filters else None,
+        }
+
+    def _dataset(self, file_path: str) -> ds.Dataset:
+        """Open a file or a hive-partitioned directory as a pyarrow dataset."""
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"No such file or directory: {file_path}")
+        return ds.dataset(file_path, format=self.file_format, partitioning="hive")
+
+    def ingest(self, file_path: str) -> pd.DataFrame:
+        """
+        Read the projected columns of the rows matching the filters into a DataFrame.
+
+        Parameters:
+        file_path (str): Path to the file or partitioned dataset directory.
+
+        Returns:
+        pd.DataFrame: The ingested data.
+        """
+        table = self._dataset(file_path).to_table(**self._scan_options())
+        return self._apply_schema(table.to_pandas())
+
+    def ingest_chunks(self, file_path: str, chunksize: int = 100_000) -> Iterator[pd.DataFrame]:
+        """
+        Stream the projected columns of the rows matching the filters as DataFrame chunks.
+
+        Parameters:
+        file_path (str): Path to the file or partitioned dataset directory.
+        chunksize (int): The maximum number of rows per chunk.
+
+        Returns:
+        Iterator[pd.DataFrame]: The ingested data, chunk by chunk.
+        """
+        batches = self._dataset(file_path).to_batches(batch_size=chunksize, **self._scan_options())
+        for batch in batches:
+            if batch.num_rows:
+                yield self._apply_schema(batch.to_pandas())
+
+    def _apply_schema(self, df: pd.DataFrame) -> pd.DataFrame:
+        if not self.schema:
+            return df
+        return df.astype(
+            {column: dtype for column, dtype in self.schema.items() if column in df.columns},
+            copy=False,
+        )
+
+
+class ParquetDataIngestor(ArrowDatasetIngestor):
+    """
+    Strategy for ingesting Parquet files or partitioned Parquet datasets.
+    """
+    file_format = "parquet"
+
+
+class FeatherDataIngestor(ArrowDatasetIngestor):
+    """
+    Strategy for ingesting Arrow IPC (Feather v2) files.
+    """
+    file_format = "ipc"
+
+
+def convert_to_parquet(
+    file_path: str,
+    output_dir: str,
+    partition_cols: Optional[List[str]] = None,
+    max_rows_per_group: int = 1024 * 1024,
+    schema: Optional[Dict[str, str]] = None,
+) -> str:
+    """
+    Convert a CSV (or a ZIP containing one) into a hive-partitioned Parquet dataset.
+
+    Parameters:
+    file_path (str): Path to the ZIP or CSV file.
+    output_dir (str): Directory to write the dataset to.
+    partition_cols (list): Columns to partition by, e.g. ["Yr Sold"].
+    max_rows_per_group (int): The maximum number of rows per Parquet row group.
+    schema (dict): Column dtypes applied while parsing; they are kept in the Parquet files.
+
+    Returns:
+    str: The dataset directory, ready for ParquetDataIngestor.
+    """
+    df = ZipDataIngestor(schema=schema).ingest(file_path)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_to_dataset(
+        table,
+        output_dir,
+        partition_cols=partition_cols,
+        max_rows_per_group=max_rows_per_group,
+        existing_data_behavior="delete_matching",
+    )
+    return output_dir
+
+
+def write_parquet_chunks(chunks: Iterable[pd.DataFrame], output_path: str) -> str:
+    """
+    Write DataFrame chunks with the same columns to a single Parquet file, one chunk at a time.
+
+    The file schema is taken from the first chunk; text columns that are entirely missing in
+    it are stored as strings, so later chunks that do have values still fit the schema.
+
+    Parameters:
+    chunks (Iterable[pd.DataFrame]): The data to write, chunk by chunk.
+    output_path (str): The Parquet file to write.
+
+    Returns:
+    str: The written file, ready for ParquetDataIngestor.
+    """
+    writer = None
+    try:
+        for chunk in chunks:
+            if writer is None:
+                schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+                for i, field in enumerate(schema):
+                    if pa.types.is_null(field.type):
+                        schema = schema.set(i, field.with_type(pa.string()))
+                writer = pq.ParquetWriter(output_path, schema)
+            writer.write_table(pa.Table.from_pandas(chunk, schema=writer.schema, preserve_index=False))
+    finally:
+        if writer is not None:
+            writer.close()
+    return output_path
+
+
+def memory_usage_report(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compare the per-column memory of the same data parsed two ways (e.g. inferred vs. schema dtypes).
+
+    Parameters:
+    before (pd.DataFrame): The data as originally parsed.
+    after (pd.DataFrame): The same data with compact dtypes.
+
+    Returns:
+    pd.DataFrame: Per-column dtypes and bytes before and after, with a TOTAL row, largest first.
+    """
+    report = pd.DataFrame(
+        {
+            "dtype_before": before.dtypes.astype(str),
+            "bytes_before": before.memory_usage(index=False, deep=True),
+            "dtype_after": after.dtypes.astype(str),
+            "bytes_after": after.memory_usage(index=False, deep=True),
+        }
+    )
+    report = report.sort_values("bytes_before", ascending=False)
+    report.loc["TOTAL"] = ["", report["bytes_before"].sum(), "", report["bytes_after"].sum()]
+    report["ratio"] = report["bytes_before"] / report["bytes_after"]
+    return report
+
+
+def _csv_members(zip_ref: zipfile.ZipFile) -> List[str]:
+    """Return the names of the CSV members of a ZIP archive, skipping macOS metadata."""
+    return sorted(
+        name
+        for name in zip_ref.namelist()
+        if name.endswith(".csv") and not name.startswith("__MACOSX/")
+    )
+
+
+def _csv_sources(file_path: str) -> List[Tuple[str, Optional[str]]]:
+    """
+    List the CSV shards behind a path as (file path, ZIP member or None) pairs, in sorted order.
+    """
+    if os.path.isdir(file_path):
+        csv_files = sorted(f for f in os.listdir(file_path) if f.endswith(".csv"))
+        if len(csv_files) == 0:
+            raise FileNotFoundError(f"No CSV file found in the directory {file_path}")
+        return [(os.path.join(file_path, f), None) for f in csv_files]
+    if file_path.endswith(".zip"):
+        with zipfile.ZipFile(file_path, "r") as zip_ref:
+            csv_members = _csv_members(zip_ref)
+        if len(csv_members) == 0:
+            raise FileNotFoundError("No CSV file found in the ZIP archive")
+        return [(file_path, member) for member in csv_members]
+    if file_path.endswith(".csv"):
+        return [(file_path, None)]
+    raise ValueError("Unsupported file type for ingestion; expected .zip, .csv or a directory")
+
+
+@contextmanager
+def _open_csv_source(source: Tuple[str, Optional[str]]) -> Iterator[IO[bytes]]:
+    """Open a CSV shard as a binary file, reading ZIP members without extracting them."""
+    file_path, member = source
+    if member is None:
+        with open(file_path, "rb") as csv_file:
+            yield csv_file
+    else:
+        with zipfile.ZipFile(file_path, "r") as zip_ref, zip_ref.open(member) as csv_file:
+            yield csv_file
+
+
+def _read_csv_source(source: Tuple[str, Optional[str]], read_kwargs: dict) -> pd.DataFrame:
+    """Parse one CSV shard; a module-level function so process pool workers can run it."""
+    with _open_csv_source(source) as csv_file:
+        return pd.read_csv(csv_file, **read_kwargs)
+
+
+def _source_name(source: Tuple[str, Optional[str]]) -> str:
+    file_path, member = source
+    return file_path if member is None else f"{file_path}:{member}"
+
+
+def _source_size(source: Tuple[str, Optional[str]]) -> int:
+    """Return the uncompressed size of a CSV shard in bytes."""
+    file_path, member = source
+    if member is None:
+        return os.path.getsize(file_path)
+    with zipfile.ZipFile(file_path, "r") as zip_ref:
+        return zip_ref.getinfo(member).file_size
+
+
+def _check_shard_schemas(sources: List[Tuple[str, Optional[str]]], shards: List[pd.DataFrame]):
+    """
+    Check every shard against the first one: columns must match exactly, and dtypes that differ
+    (e.g. int64 in one shard, float64 in another) are logged, since concatenation widens them.
+    """
+    expected = shards[0].dtypes
+    for source, shard in zip(sources[1:], shards[1:]):
+        if list(shard.columns) != list(expected.index):
+            raise ValueError(
+                f"CSV shard {_source_name(source)} has columns {list(shard.columns)}, "
+                f"expected {list(expected.index)}"
+            )
+        mismatched = shard.dtypes[shard.dtypes != expected]
+        for column, dtype in mismatched.items():
+            if isinstance(dtype, pd.CategoricalDtype) and isinstance(expected[column], pd.CategoricalDtype):
+                continue  # Categories are unified in _concat_shards
+            if shard[column].isna().all() or shards[0][column].isna().all():
+                continue  # An all-missing column has no dtype of its own
+            logging.warning(
+                f"CSV shard {_source_name(source)}: column '{column}' parsed as {dtype}, "
+                f"first shard has {expected[column]}."
+            )
+
+
+def _concat_shards(shards: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate shards in order with a fresh index, keeping categorical columns categorical by
+    giving every shard the union of their categories, and text columns text in shards where
+    they are entirely missing (which parse them as float64, widening the result to object).
+    """
+    if len(shards) == 1:
+        return shards[0]
+    for column in shards[0].columns:
+        present = [shard for shard in shards if shard[column].notna().any()]
+        if len(present) in (0, len(shards)) or isinstance(present[0][column].dtype, pd.CategoricalDtype):
+            continue
+        dtype = present[0][column].dtype
+        if _is_text(present[0][column]) and all(shard[column].dtype == dtype for shard in present):
+            for shard in shards:
+                if not shard[column].notna().any():
+                    shard[column] = shard[column].astype(dtype)
+    categorical_columns = [
+        column
+        for column, dtype in shards[0].dtypes.items()
+        if isinstance(dtype, pd.CategoricalDtype)
+    ]
+    for column in categorical_columns:
+        # A shard where the column is entirely missing infers empty object categories, so
+        # cast every shard's categories to the dtype of those that have any before the union
+        categories = [shard[column].cat.categories for shard in shards]
+        dtypes = {c.dtype for c in categories if len(c)}
+        dtype = dtypes.pop() if len(dtypes) == 1 else object
+        # Sorted, like the categories pd.read_csv infers for a single file
+        categories = pd.api.types.union_categoricals(
+            [
+                shard[column].cat.set_categories(c.astype(dtype))
+                for shard, c in zip(shards, categories)
+            ],
+            sort_categories=True,
+        ).categories
+        for shard in shards:
+            shard[column] = shard[column].cat.set_categories(categories)
+    return pd.concat(shards, ignore_index=True)
+
+
+def _read_csv_mmap(file_path: str, read_kwargs: dict, max_workers: int) -> pd.DataFrame:
+    """
+    Parse a plain CSV file in parallel by splitting it into line-aligned byte ranges.
+
+    The parent memory-maps the file only to find split points: each split is moved forward to
+    the next newline that is not inside a quoted field. Every worker maps the file itself and
+    parses just its own range (prefixed with the header line), so no process holds a copy of
+    the whole file. If the ranges infer types that concatenation cannot reproduce exactly
+    (e.g. a column numeric in one range and text in another), the file is re-read serially, so
+    the result always equals `pd.read_csv(file_path, **read_kwargs)`.
+    """
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        header_end = mm.find(b"\n") + 1
+        if header_end == 0 or max_workers == 1:
+            return pd.read_csv(file_path, **read_kwargs)
+        header = mm[:header_end]
+        offsets = _line_aligned_offsets(mm, header_end, max_workers)
+
+    ranges = list(zip(offsets[:-1], offsets[1:]))
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(ranges))) as executor:
+        parts = list(
+            executor.map(
+                _read_csv_range, repeat(file_path), ranges, repeat(header), repeat(read_kwargs)
+            )
+        )
+
+    for column in parts[0].columns:
+        present = [part for part in parts if part[column].notna().any()]
+        is_text = {_is_text(part[column]) for part in present}
+        if len(is_text) > 1:
+            logging.info(
+                f"Column '{column}' parsed as text in some byte ranges only; re-reading {file_path} serially."
+            )
+            return pd.read_csv(file_path, **read_kwargs)
+    return _concat_shards(parts)
+
+
+def _is_text(series: pd.Series) -> bool:
+    """Return whether a parsed column holds text: str, object, or categories of either."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.cat.categories
+    return pd.api.types.is_string_dtype(series.dtype) or pd.api.types.is_object_dtype(series.dtype)
+
+
+def _line_aligned_offsets(mm: mmap.mmap, start: int, n_parts: int) -> List[int]:
+    """Split mm[start:] into up to n_parts ranges that begin at the start of a record."""
+    size = len(mm)
+    target = max((size - start) // n_parts, 1)
+    offsets = [start]
+    quotes = 0  # Quote characters between start and offsets[-1]; odd means inside a quoted field
+    while offsets[-1] + target < size:
+        position = offsets[-1] + target
+        quotes += _count_quotes(mm, offsets[-1], position)
+        newline = mm.find(b"\n", position)
+        while newline != -1:
+            quotes += _count_quotes(mm, position, newline)
+            position = newline
+            if quotes % 2 == 0:
+                break
+            newline = mm.find(b"\n", newline + 1)
+        if newline == -1 or newline + 1 >= size:
+            break
+        quotes += _count_quotes(mm, newline, newline + 1)
+        offsets.append(newline + 1)
+    offsets.append(size)
+    return offsets
+
+
+def _count_quotes(mm: mmap.mmap, start: int, end: int) -> int:
+    """Count the double-quote bytes in mm[start:end] without copying the range."""
+    view = np.frombuffer(mm, dtype=np.uint8, count=end - start, offset=start)
+    return int(np.count_nonzero(view == ord('"')))
+
+
+def _read_csv_range(
+    file_path: str, byte_range: Tuple[int, int], header: bytes, read_kwargs: dict
+) -> pd.DataFrame:
+    """Parse one byte range of a memory-mapped CSV; runs in a process pool worker."""
+    start, end = byte_range
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return pd.read_csv(io.BytesIO(header + mm[start:end]), **read_kwargs)
+
+
+def _stream_dtypes(first_chunk: pd.DataFrame) -> Dict[str, object]:
+    """
+    Derive the dtypes applied to every chunk of a stream from its first chunk.
+
+    A later chunk may contain values the first one did not, so the inferred dtypes are
+    widened to ones that can hold them: integer columns become float64 (to allow NaN), and
+    boolean columns become object. All-missing columns become float64, the dtype of NaN.
+    """
+    dtypes = {}
+    for column, dtype in first_chunk.dtypes.items():
+        if first_chunk[column].isna().all() or pd.api.types.is_integer_dtype(dtype):
+            dtypes[column] = "float64"
+        elif pd.api.types.is_bool_dtype(dtype):
+            dtypes[column] = object
+        else:
+            dtypes[column] = dtype
+    return dtypes
+
+
+def _first_valued_dtypes(
+    sources: List[Tuple[str, Optional[str]]], columns: List[str], chunksize: int
+) -> Dict[str, object]:
+    """
+    Derive the stream dtypes of columns that are empty in the first chunk from the first chunk
+    each one has values in, reading only those columns. Columns without any value stay float64.
+    """
+    dtypes = {column: "float64" for column in columns}
+    pending = set(columns)
+    for source in sources:
+        with _open_csv_source(source) as csv_file:
+            for chunk in pd.read_csv(csv_file, usecols=columns, chunksize=chunksize):
+                valued = [column for column in pending if chunk[column].notna().any()]
+                dtypes.update(_stream_dtypes(chunk[valued]))
+                pending.difference_update(valued)
+                if not pending:
+                    return dtypes
+    return dtypes
+
+
 class DataIngestorFactory:
     """
     Factory class to create appropriate data ingestors based on file extension.
     """
     @staticmethod
-    def get_data_ingestor(file_extension: str) -> DataIngestor:
+    def get_data_ingestor(file_extension: str, **kwargs) -> DataIngestor:
         """
         Get the appropriate data ingestor for the file extension.
 
         Parameters:
         file_extension (str): The file extension (e.g., '.zip').
+        **kwargs: Options passed to the ingestor (e.g. columns, filters).
 
         Returns:
         DataIngestor: The corresponding ingestor instance.
 
         Raises:
-        ValueError: If no ingestor is available for the extension.
+        ValueError: If no ingestor is available for the extension, or filters are given for
+            CSV data, which has no scan to push them down to.
         """
-        if file_extension == ".zip":
-            return ZipDataIngestor()
+        if file_extension in (".zip", ".csv"):
+            if kwargs.pop("filters", None):
+                raise ValueError(
+                    "Row filters are only supported for Parquet/Feather data; filter the DataFrame of a "
+                    f"{file_extension} file after ingesting it."
+                )
+            return ZipDataIngestor(**kwargs)
+        elif file_extension == ".parquet":
+            return ParquetDataIngestor(**kwargs)
+        elif file_extension in (".feather", ".arrow", ".ipc"):
+            return FeatherDataIngestor(**kwargs)
         else:
             raise ValueError(f"No ingestor available for file extension: {file_extension}")
 
+    @staticmethod
+    def get_data_ingestor_for_path(file_path: str, **kwargs) -> DataIngestor:
+        """
+        Get the appropriate data ingestor for a file or directory.
+
+        A directory holds either CSV shards or a partitioned Parquet dataset; a file is matched
+        by its extension, as in `get_data_ingestor`.
+
+        Parameters:
+        file_path (str): Path to the file or directory to ingest.
+        **kwargs: Options passed to the ingestor (e.g. columns, filters).
+
+        Returns:
+        DataIngestor: The corresponding ingestor instance.
+
+        Raises:
+        ValueError: If no ingestor is available for the extension, or filters are given for
+            CSV data.
+        """
+        if os.path.isdir(file_path):
+            has_csv = any(name.endswith(".csv") for name in os.listdir(file_path))
+            file_extension = ".csv" if has_csv else ".parquet"
+        else:
+            file_extension = os.path.splitext(file_path)[1]
+        return DataIngestorFactory.get_data_ingestor(file_extension, **kwargs)
+
 if __name__ == "__main__":
     file_path = "data/archive.zip"
     data_ingestor = DataIngestorFactory.get_data_ingestor(file_extension=".zip")
     df = data_ingestor.ingest(file_path=file_path)
     print(df.head())
+
+    # Parse with the declarative Ames schema and compare memory per column
+    # from src.ames_schema import AMES_DTYPES
+    # typed_df = DataIngestorFactory.get_data_ingestor(".zip", schema=AMES_DTYPES).ingest(file_path)
+    # print(memory_usage_report(df, typed_df))
+
+    # Convert the archive to a Parquet dataset once, then read only what is needed
+    # convert_to_parquet(file_path, "data/ames_parquet", partition_cols=["Yr Sold"])
+    # parquet_ingestor = DataIngestorFactory.get_data_ingestor(
+    #     ".parquet", columns=["Gr Liv Area", "SalePrice"], filters=[("Yr Sold", ">=", 2008)]
+    # )
+    # df = parquet_ingestor.ingest("data/ames_parquet")
+
+    # Stream the same archive in chunks instead of loading it all at once
+    # for chunk in data_ingestor.ingest_chunks(file_path=file_path, chunksize=1000):
+    #     print(chunk.shape)
@@ -0,0 +1,250 @@
+import hashlib
+import json
+import logging
+import os
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow.feather as feather
+from src.ingest_data import DataIngestor
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+# Content-Addressed Ingestion Cache
+# ---------------------------------
+# Parsed DataFrames are stored as Arrow IPC (Feather) files named after the SHA-256 of the input
+# data plus the parse options, so an unchanged input is never parsed twice. Entries are evicted
+# least-recently-used first once the cache grows past max_bytes.
+class IngestionCache:
+    HASH_INDEX = "hashes.json"
+    BLOCK_SIZE = 1024 * 1024
+
+    def __init__(self, cache_dir: str = ".ingestion_cache", max_bytes: int = 2 * 1024**3):
+        """
+        Initializes the IngestionCache.
+
+        Parameters:
+        cache_dir (str): Directory the cached frames are stored in.
+        max_bytes (int): The total size the cache is trimmed to after every write.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def content_hash(self, file_path: str, signatures: Optional[list] = None) -> str:
+        """
+        Returns the SHA-256 of a file, or of every file under a directory.
+
+        Digests are remembered per (path, size, mtime), so an unchanged input is only read once.
+
+        Parameters:
+        file_path (str): Path to the file or directory.
+        signatures (list): If given, the (path, size, mtime) signature of every file hashed is
+            appended to it, so the cache entry built from them can be linked to their digests.
+
+        Returns:
+        str: The hex digest of the content.
+        """
+        if os.path.isdir(file_path):
+            digest = hashlib.sha256()
+            for root, dirs, files in os.walk(file_path):
+                dirs.sort()
+                for name in sorted(files):
+                    path = os.path.join(root, name)
+                    digest.update(os.path.relpath(path, file_path).encode())
+                    digest.update(self.content_hash(path, signatures).encode())
+            return digest.hexdigest()
+
+        stat = os.stat(file_path)
+        index = self._load_index()
+        signature = f"{os.path.abspath(file_path)}:{stat.st_size}:{stat.st_mtime_ns}"
+        if signatures is not None:
+            signatures.append(signature)
+        if signature in index["digests"]:
+            return index["digests"][signature]
+
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(self.BLOCK_SIZE), b""):
+                digest.update(block)
+        index["digests"][signature] = digest.hexdigest()
+        self._save_index(index)
+        return index["digests"][signature]
+
+    def key(self, file_path: str, options: dict) -> str:
+        """
+        Returns the cache key for an input file and the options it is parsed with.
+
+        The key is recorded in the hash index together with the signatures of the files it was
+        computed from, so their digests are dropped once its entry is evicted.
+
+        Parameters:
+        file_path (str): Path to the input file or directory.
+        options (dict): The parse options; any JSON-serializable description of them.
+
+        Returns:
+        str: The cache key.
+        """
+        signatures = []
+        payload = json.dumps(
+            {"content": self.content_hash(file_path, signatures), "options": options},
+            sort_keys=True,
+            default=str,
+        )
+        key = hashlib.sha256(payload.encode()).hexdigest()
+        index = self._load_index()
+        if index["entries"].get(key) != signatures:
+            index["entries"][key] = signatures
+            self._save_index(index)
+        return key
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Returns the cached DataFrame for a key, or None on a miss.
+
+        Parameters:
+        key (str): The cache key.
+
+        Returns:
+        pd.DataFrame: The cached data, or None if it is not cached.
+        """
+        path = self._entry_path(key)
+        if not os.path.exists(path):
+            return None
+        os.utime(path)  # Mark as recently used
+        df = feather.read_table(path, memory_map=True).to_pandas()
+        # Arrow nulls come back as None in object columns; restore the NaN the parser produced
+        object_columns = df.select_dtypes(include="object").columns
+        df[object_columns] = df[object_columns].fillna(np.nan)
+        return df
+
+    def put(self, key: str, df: pd.DataFrame):
+        """
+        Stores a DataFrame under a key and evicts least-recently-used entries over the size limit.
+
+        Parameters:
+        key (str): The cache key.
+        df (pd.DataFrame): The data to cache.
+        """
+        path = self._entry_path(key)
+        tmp_path = f"{path}.tmp"
+        feather.write_feather(df, tmp_path, compression="lz4")
+        os.replace(tmp_path, path)
+        self._evict(keep=path)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.feather")
+
+    def _evict(self, keep: str):
+        entries = [
+            os.path.join(self.cache_dir, name)
+            for name in os.listdir(self.cache_dir)
+            if name.endswith(".feather")
+        ]
+        entries.sort(key=os.path.getmtime)
+        total = sum(os.path.getsize(path) for path in entries)
+        for path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            total -= os.path.getsize(path)
+            os.remove(path)
+            logging.info(f"Evicted ingestion cache entry {os.path.basename(path)}.")
+        if total > self.max_bytes:
+            logging.warning(
+                f"Ingestion cache entry {os.path.basename(keep)} alone exceeds max_bytes={self.max_bytes}."
+            )
+        self._prune_index()
+
+    def _prune_index(self):
+        """Drops index entries without a cached file, and digests no remaining entry was built from."""
+        index = self._load_index()
+        entries = {
+            key: signatures
+            for key, signatures in index["entries"].items()
+            if os.path.exists(self._entry_path(key))
+        }
+        live_signatures = {signature for signatures in entries.values() for signature in signatures}
+        digests = {
+            signature: digest
+            for signature, digest in index["digests"].items()
+            if signature in live_signatures
+        }
+        if len(entries) < len(index["entries"]) or len(digests) < len(index["digests"]):
+            self._save_index({"digests": digests, "entries": entries})
+
+    def _load_index(self) -> dict:
+        """Returns the hash index: file signature -> digest, and cache key -> file signatures."""
+        index_path = os.path.join(self.cache_dir, self.HASH_INDEX)
+        index = {}
+        if os.path.exists(index_path):
+            with open(index_path) as f:
+                index = json.load(f)
+        if "digests" not in index:
+            # An index from before entries were tracked; the digests are only a memo, so start over
+            index = {}
+        return {"digests": index.get("digests", {}), "entries": index.get("entries", {})}
+
+    def _save_index(self, index: dict):
+        self._atomic_write_json(os.path.join(self.cache_dir, self.HASH_INDEX), index)
+
+    @staticmethod
+    def _atomic_write_json(path: str, data: dict):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+
+# Caching Decorator for Data Ingestors
+# ------------------------------------
+# Wraps any DataIngestor; the wrapped ingestor only runs when the cache has no entry for the input.
+class CachedDataIngestor(DataIngestor):
+    def __init__(self, ingestor: DataIngestor, cache: Optional[IngestionCache] = None):
+        """
+        Initializes the CachedDataIngestor.
+
+        Parameters:
+        ingestor (DataIngestor): The ingestor used on a cache miss.
+        cache (IngestionCache): The cache to use; a default-configured one if None.
+        """
+        self.ingestor = ingestor
+        self.cache = cache if cache is not None else IngestionCache()
+
+    def ingest(self, file_path: str) -> pd.DataFrame:
+        """
+        Returns the cached frame for the input and the ingestor's options, parsing it on a miss.
+
+        Options that do not change the result (the ingestor's `execution_options`, e.g. the
+        number of parsing processes) are not part of the key, so changing them still hits.
+
+        Parameters:
+        file_path (str): Path to the file to ingest.
+
+        Returns:
+        pd.DataFrame: The ingested data.
+        """
+        options = {
+            name: value
+            for name, value in vars(self.ingestor).items()
+            if name not in self.ingestor.execution_options
+        }
+        options["ingestor"] = type(self.ingestor).__name__
+        key = self.cache.key(file_path, options)
+        df = self.cache.get(key)
+        if df is not None:
+            logging.info(f"Ingestion cache hit for {file_path}.")
+            return df
+
+        logging.info(f"Ingestion cache miss for {file_path}; parsing.")
+        df = self.ingestor.ingest(file_path)
+        self.cache.put(key, df)
+        return df
+
+    def ingest_chunks(self, file_path: str, chunksize: int = 100_000):
+        """Streams straight from the wrapped ingestor; chunked reads bypass the cache."""
+        return self.ingestor.ingest_chunks(file_path, chunksize=chunksize)
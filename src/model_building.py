@@ -1,12 +1,27 @@
+import copy
 import logging
+import os
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
-from sklearn.base import RegressorMixin
-from sklearn.linear_model import LinearRegression
-from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import StandardScaler
+import joblib
+import scipy.sparse as sp
+from joblib import Parallel, delayed
+from sklearn.base import BaseEstimator, RegressorMixin, TransformerMixin, clone
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import HistGradientBoostingRegressor
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import Lasso, LinearRegression, Ridge, SGDRegressor
+from sklearn.metrics import mean_squared_error
+from sklearn.model_selection import ParameterGrid
+from sklearn.pipeline import Pipeline, make_pipeline
+from sklearn.preprocessing import FunctionTransformer, OneHotEncoder, OrdinalEncoder, StandardScaler
+from sklearn.utils import get_tags
+from src.data_splitter import IndexSplittingStrategy, KFoldSplitStrategy
+from src.feature_engineering import FeatureHashing, sparse_frame_to_csr
 
 # Setup logging configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -31,6 +46,16 @@ class ModelBuildingStrategy(ABC):
 
 # Concrete Strategy for Linear Regression using scikit-learn
 class LinearRegressionStrategy(ModelBuildingStrategy):
+    def __init__(self, preprocessor: Optional[ColumnTransformer] = None):
+        """
+        Initializes the LinearRegressionStrategy.
+
+        Parameters:
+        preprocessor (ColumnTransformer): The unfitted preprocessing in front of the model,
+            e.g. from `build_preprocessor`; None uses standard scaling of all features.
+        """
+        self.preprocessor = preprocessor
+
     def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
         """
         Builds and trains a linear regression model using scikit-learn.
@@ -48,15 +73,19 @@ class LinearRegressionStrategy(ModelBuildingStrategy):
         if not isinstance(y_train, pd.Series):
             raise TypeError("y_train must be a pandas Series.")
 
-        logging.info("Initializing Linear Regression model with scaling.")
+        if self.preprocessor is not None:
+            logging.info("Initializing Linear Regression model with the given preprocessor.")
+            pipeline = Pipeline([("preprocessor", self.preprocessor), ("model", LinearRegression())])
+        else:
+            logging.info("Initializing Linear Regression model with scaling.")
 
-        # Creating a pipeline with standard scaling and linear regression
-        pipeline = Pipeline(
-            [
-                ("scaler", StandardScaler()),  # Feature scaling
-                ("model", LinearRegression()),  # Linear regression model
-            ]
-        )
+            # Creating a pipeline with standard scaling and linear regression
+            pipeline = Pipeline(
+                [
+                    ("scaler", StandardScaler()),  # Feature scaling
+                    ("model", LinearRegression()),  # Linear regression model
+                ]
+            )
 
         logging.info("Training Linear Regression model.")
         pipeline.fit(X_train, y_train)  # Fit the pipeline to the training data
@@ -65,6 +94,592 @@ class LinearRegressionStrategy(ModelBuildingStrategy):
         return pipeline
 
 
+# Concrete Strategy for Histogram Gradient Boosting with native categorical support
+class HistGradientBoostingStrategy(ModelBuildingStrategy):
+    def __init__(
+        self,
+        max_iter=1_000,
+        learning_rate=0.1,
+        max_leaf_nodes=31,
+        validation_fraction=0.1,
+        n_iter_no_change=20,
+        random_state=42,
+    ):
+        """
+        Initializes the HistGradientBoostingStrategy.
+
+        Categorical columns are fed to the trees as one ordinal code column each and split
+        natively on category subsets, instead of being expanded into one-hot columns, in both
+        training and serving. Missing values are routed by the trees, so nothing is imputed.
+        Boosting stops once the score on a held-out `validation_fraction` of the rows has
+        not improved for `n_iter_no_change` iterations; each iteration is multi-threaded over
+        all cores by OpenMP.
+
+        Parameters:
+        max_iter (int): The maximum number of boosting iterations.
+        learning_rate (float): The shrinkage of each tree.
+        max_leaf_nodes (int): The maximum number of leaves per tree.
+        validation_fraction (float): The share of training rows held out for early stopping.
+        n_iter_no_change (int): The patience of early stopping, in iterations.
+        random_state (int): Seed of the validation split.
+        """
+        self.max_iter = max_iter
+        self.learning_rate = learning_rate
+        self.max_leaf_nodes = max_leaf_nodes
+        self.validation_fraction = validation_fraction
+        self.n_iter_no_change = n_iter_no_change
+        self.random_state = random_state
+
+    def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
+        """
+        Builds and trains a histogram gradient boosting model on ordinal-coded categoricals.
+
+        Parameters:
+        X_train (pd.DataFrame): The training data features.
+        y_train (pd.Series): The training data labels/target.
+
+        Returns:
+        Pipeline: A scikit-learn pipeline with the ordinal encoder and the trained model.
+        """
+        if not isinstance(X_train, pd.DataFrame):
+            raise TypeError("X_train must be a pandas DataFrame.")
+        if not isinstance(y_train, pd.Series):
+            raise TypeError("y_train must be a pandas Series.")
+
+        numerical_cols, categorical_cols, sparse_cols = column_groups(X_train)
+        # Native categorical splits support at most 255 categories; larger vocabularies are
+        # kept as their (still informative) ordinal codes
+        cardinalities = X_train[categorical_cols].nunique()
+        native_cols = cardinalities.index[cardinalities <= 255]
+        logging.info(f"Native categorical columns: {native_cols.tolist()}")
+        logging.info(f"Ordinal-coded high-cardinality columns: {cardinalities.index[cardinalities > 255].tolist()}")
+
+        # Categorical columns come first in the transformed block, so they are its leading features
+        preprocessor = ColumnTransformer(
+            transformers=[
+                (
+                    "cat",
+                    OrdinalEncoder(
+                        handle_unknown="use_encoded_value", unknown_value=np.nan, encoded_missing_value=np.nan
+                    ),
+                    categorical_cols,
+                ),
+                ("num", "passthrough", numerical_cols),
+                ("sparse", FunctionTransformer(sparse_frame_to_csr, accept_sparse=True), sparse_cols),
+            ],
+            sparse_threshold=0,  # The trees need a dense block
+        )
+        categorical_features = np.zeros(len(categorical_cols) + len(numerical_cols) + len(sparse_cols), dtype=bool)
+        categorical_features[: len(categorical_cols)] = categorical_cols.isin(native_cols)
+
+        model = HistGradientBoostingRegressor(
+            max_iter=self.max_iter,
+            learning_rate=self.learning_rate,
+            max_leaf_nodes=self.max_leaf_nodes,
+            categorical_features=categorical_features,
+            early_stopping=True,
+            validation_fraction=self.validation_fraction,
+            n_iter_no_change=self.n_iter_no_change,
+            random_state=self.random_state,
+        )
+        pipeline = Pipeline([("preprocessor", preprocessor), ("model", model)])
+
+        logging.info("Training Histogram Gradient Boosting model.")
+        pipeline.fit(X_train, y_train)
+        logging.info(f"Model training completed after {model.n_iter_} of at most {self.max_iter} iterations.")
+        return pipeline
+
+
+# Concrete Strategy for Incremental Training over Chunks
+class IncrementalSGDStrategy(ModelBuildingStrategy):
+    def __init__(
+        self,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_every: int = 10,
+        chunksize: int = 100_000,
+        alpha: float = 1e-4,
+        eta0: float = 0.01,
+        n_hashed_features: int = 1024,
+        random_state: int = 42,
+    ):
+        """
+        Initializes the IncrementalSGDStrategy.
+
+        A linear SGDRegressor is trained with partial_fit one chunk at a time behind a
+        StreamingPreprocessor, so only one chunk of the training data is ever in memory.
+        Every `checkpoint_every` chunks the pipeline is saved to `checkpoint_path`, so an
+        interrupted run can resume where it stopped; a completed checkpoint is the starting
+        point of the next run, e.g. to train nightly on only the newly arrived rows.
+
+        Parameters:
+        checkpoint_path (str): The joblib file checkpoints are written to and resumed from;
+            None disables checkpointing.
+        checkpoint_every (int): The number of chunks between checkpoints.
+        chunksize (int): The number of rows per chunk when training on an in-memory frame.
+        alpha (float): The L2 regularization strength.
+        eta0 (float): The initial learning rate (decaying with inverse scaling).
+        n_hashed_features (int): The number of hashed columns of the categorical features.
+        random_state (int): Seed of the SGD row shuffling.
+        """
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+        self.chunksize = chunksize
+        self.alpha = alpha
+        self.eta0 = eta0
+        self.n_hashed_features = n_hashed_features
+        self.random_state = random_state
+
+    def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
+        """
+        Trains the model on an in-memory frame, `chunksize` rows at a time.
+
+        Parameters:
+        X_train (pd.DataFrame): The training data features.
+        y_train (pd.Series): The training data labels/target.
+
+        Returns:
+        Pipeline: A scikit-learn pipeline with the streaming preprocessor and the SGD model.
+        """
+        if not isinstance(X_train, pd.DataFrame):
+            raise TypeError("X_train must be a pandas DataFrame.")
+        if not isinstance(y_train, pd.Series):
+            raise TypeError("y_train must be a pandas Series.")
+        chunks = (
+            (X_train.iloc[start : start + self.chunksize], y_train.iloc[start : start + self.chunksize])
+            for start in range(0, len(X_train), self.chunksize)
+        )
+        return self.train_chunks(chunks)
+
+    def train_chunks(self, chunks: Iterable[Tuple[pd.DataFrame, pd.Series]], resume: bool = True) -> Pipeline:
+        """
+        Trains the model on a stream of (features, target) chunks, e.g. from DataIngestor.ingest_chunks.
+
+        With `resume` and an existing checkpoint, training continues from it: after an
+        interrupted run, the chunks it already consumed are skipped (the stream must
+        replay them in the same order); after a completed one, every chunk is new data.
+
+        Parameters:
+        chunks (Iterable): (X, y) pairs of feature frames and target series.
+        resume (bool): Whether to continue from the checkpoint at `checkpoint_path`.
+
+        Returns:
+        Pipeline: A scikit-learn pipeline with the streaming preprocessor and the SGD model.
+        """
+        pipeline, skip_chunks = self._initial_pipeline(resume)
+        preprocessor, model = pipeline.named_steps["preprocessor"], pipeline.named_steps["model"]
+
+        n_chunks = n_rows = 0
+        for n_chunks, (X, y) in enumerate(chunks, start=1):
+            if n_chunks <= skip_chunks:
+                continue
+            labelled = y.notna().to_numpy()
+            X, y = X[labelled], y[labelled]
+            if not len(X):
+                continue
+            preprocessor.partial_fit(X)
+            X_transformed, y_values = preprocessor.transform(X), y.to_numpy(dtype=np.float64)
+            if not hasattr(model, "coef_"):
+                # Start from the first chunk's mean target rather than 0, which SGD alone takes
+                # many passes to reach (e.g. a log price of ~12)
+                model.partial_fit(X_transformed[:1], y_values[:1])
+                model.coef_[:] = 0.0
+                model.intercept_[:] = y_values.mean()
+            model.partial_fit(X_transformed, y_values)
+            n_rows += len(X)
+            if n_chunks % self.checkpoint_every == 0:
+                self._save_checkpoint(pipeline, n_chunks, completed=False)
+                logging.info(f"Trained on {n_chunks} chunks ({n_rows} new rows); checkpoint saved.")
+
+        self._save_checkpoint(pipeline, n_chunks, completed=True)
+        logging.info(f"Incremental training completed on {n_rows} new rows from {n_chunks - skip_chunks} chunks.")
+        return pipeline
+
+    def _initial_pipeline(self, resume: bool):
+        """Returns the pipeline to train and the number of leading chunks it has already seen."""
+        if resume and self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            checkpoint = joblib.load(self.checkpoint_path)
+            if checkpoint["completed"]:
+                logging.info(f"Continuing training of the completed model in {self.checkpoint_path}.")
+                return checkpoint["pipeline"], 0
+            logging.info(f"Resuming interrupted training after chunk {checkpoint['chunks']} from {self.checkpoint_path}.")
+            return checkpoint["pipeline"], checkpoint["chunks"]
+
+        logging.info("Initializing SGD regression model with a streaming preprocessor.")
+        model = SGDRegressor(
+            alpha=self.alpha, learning_rate="invscaling", eta0=self.eta0, random_state=self.random_state
+        )
+        return Pipeline(
+            [("preprocessor", StreamingPreprocessor(n_hashed_features=self.n_hashed_features)), ("model", model)]
+        ), 0
+
+    def _save_checkpoint(self, pipeline: Pipeline, chunks: int, completed: bool):
+        """Writes the pipeline to `checkpoint_path` atomically, so a crash never leaves a partial file."""
+        if not self.checkpoint_path:
+            return
+        temporary_path = f"{self.checkpoint_path}.tmp"
+        joblib.dump({"pipeline": pipeline, "chunks": chunks, "completed": completed}, temporary_path)
+        os.replace(temporary_path, self.checkpoint_path)
+
+
+# Streaming Preprocessor for Incremental Training
+class StreamingPreprocessor(TransformerMixin, BaseEstimator):
+    def __init__(self, n_hashed_features=1024):
+        """
+        Preprocessing that can be updated one chunk at a time with partial_fit.
+
+        Numerical columns are standardized with running means and variances (missing values
+        become 0, i.e. the running mean), and categorical columns are hashed into
+        `n_hashed_features` sparse columns (see FeatureHashing), which needs no vocabulary
+        and so accepts categories first seen in a later chunk. The columns are taken from the
+        first chunk.
+
+        Parameters:
+        n_hashed_features (int): The number of hashed columns of the categorical features.
+        """
+        self.n_hashed_features = n_hashed_features
+
+    def fit(self, X: pd.DataFrame, y=None) -> "StreamingPreprocessor":
+        for attribute in ("scaler_", "numerical_columns_", "categorical_columns_"):
+            self.__dict__.pop(attribute, None)
+        return self.partial_fit(X)
+
+    def partial_fit(self, X: pd.DataFrame, y=None) -> "StreamingPreprocessor":
+        if not hasattr(self, "scaler_"):
+            self.categorical_columns_ = X.select_dtypes(include=["object", "category"]).columns.tolist()
+            self.numerical_columns_ = X.columns.difference(self.categorical_columns_, sort=False).tolist()
+            self.scaler_ = StandardScaler()
+        self.scaler_.partial_fit(X[self.numerical_columns_].to_numpy(dtype=np.float64, na_value=np.nan))
+        return self
+
+    def transform(self, X: pd.DataFrame):
+        numerical = self.scaler_.transform(X[self.numerical_columns_].to_numpy(dtype=np.float64, na_value=np.nan))
+        numerical = np.nan_to_num(numerical, nan=0.0, copy=False)
+        if not self.categorical_columns_:
+            return numerical
+        hashed = FeatureHashing(self.categorical_columns_, n_features=self.n_hashed_features).hash_matrix(X)
+        return sp.hstack([sp.csr_matrix(numerical), hashed], format="csr")
+
+
+# Concrete Strategy for Warm-Start Retraining of a previously trained Pipeline
+class WarmStartStrategy(ModelBuildingStrategy):
+    def __init__(
+        self,
+        previous_pipeline: Pipeline,
+        cold_strategy: ModelBuildingStrategy,
+        max_new_iter: int = 200,
+        compare_with_cold: bool = False,
+    ):
+        """
+        Initializes the WarmStartStrategy.
+
+        If the training data has the same numerical, categorical and sparse columns as the
+        data the previous pipeline was fitted on, its fitted preprocessor is
+        reused as is, and its estimator continues from its fitted state where the estimator
+        supports `warm_start` (e.g. gradient boosting adds trees, SGD starts from the previous
+        coefficients); other estimators are refitted from scratch on the reused preprocessor
+        output. If the schema changed, `cold_strategy` trains a new pipeline.
+
+        Parameters:
+        previous_pipeline (Pipeline): The fitted "preprocessor" + "model" pipeline to start from,
+            e.g. the production model; it is not modified.
+        cold_strategy (ModelBuildingStrategy): The strategy used when the schema changed, and
+            for the comparison run.
+        max_new_iter (int): The boosting iterations a warm-started gradient boosting model
+            may add.
+        compare_with_cold (bool): If True, also train with `cold_strategy` and report the wall
+            time saved by warm-starting.
+        """
+        self.previous_pipeline = previous_pipeline
+        self.cold_strategy = cold_strategy
+        self.max_new_iter = max_new_iter
+        self.compare_with_cold = compare_with_cold
+        self.report_ = None
+
+    def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
+        """
+        Retrains the previous pipeline on new training data, warm-starting where possible.
+
+        Parameters:
+        X_train (pd.DataFrame): The training data features.
+        y_train (pd.Series): The training data labels/target.
+
+        Returns:
+        Pipeline: The retrained pipeline. `report_` records whether the preprocessor was
+        reused and the estimator warm-started, and the wall times of the fit (and of the
+        cold comparison fit).
+        """
+        if not isinstance(X_train, pd.DataFrame):
+            raise TypeError("X_train must be a pandas DataFrame.")
+        if not isinstance(y_train, pd.Series):
+            raise TypeError("y_train must be a pandas Series.")
+
+        start = time.perf_counter()
+        preprocessor = self.previous_pipeline.named_steps["preprocessor"]
+        same_schema = _fitted_column_groups(preprocessor) == _column_group_names(X_train)
+        warm_started = False
+        if same_schema:
+            logging.info("Schema unchanged; reusing the fitted preprocessor of the previous pipeline.")
+            model = copy.deepcopy(self.previous_pipeline.named_steps["model"])
+            warm_started = "warm_start" in model.get_params()
+            if warm_started:
+                logging.info(f"Warm-starting {type(model).__name__} from its previous fit.")
+                model.set_params(warm_start=True)
+                if isinstance(model, HistGradientBoostingRegressor):
+                    # Boosting continues up to max_iter in total, so allow new iterations on top
+                    model.set_params(max_iter=model.n_iter_ + self.max_new_iter)
+            else:
+                logging.info(f"{type(model).__name__} does not support warm starts; refitting it from scratch.")
+                model = clone(model)
+            model.fit(preprocessor.transform(X_train), y_train)
+            pipeline = Pipeline([("preprocessor", copy.deepcopy(preprocessor)), ("model", model)])
+        else:
+            logging.info("Schema changed since the previous pipeline; training a new one from scratch.")
+            pipeline = self.cold_strategy.build_and_train_model(X_train, y_train)
+        fit_seconds = time.perf_counter() - start
+        self.report_ = {
+            "preprocessor_reused": same_schema,
+            "warm_started": warm_started,
+            "fit_seconds": fit_seconds,
+        }
+
+        if self.compare_with_cold:
+            start = time.perf_counter()
+            self.cold_strategy.build_and_train_model(X_train, y_train)
+            cold_fit_seconds = time.perf_counter() - start
+            self.report_["cold_fit_seconds"] = cold_fit_seconds
+            self.report_["time_saved_seconds"] = cold_fit_seconds - fit_seconds
+        logging.info(f"Warm-start retraining report: {self.report_}")
+        return pipeline
+
+
+# Concrete Strategy for Cross-Validated Model Search
+class CrossValidatedSearchStrategy(ModelBuildingStrategy):
+    def __init__(
+        self,
+        candidates: Optional[List[Tuple[str, Any, dict]]] = None,
+        cv: Optional[IndexSplittingStrategy] = None,
+        preprocessor: Optional[ColumnTransformer] = None,
+        n_jobs: int = -1,
+    ):
+        """
+        Initializes the CrossValidatedSearchStrategy.
+
+        Every parameter combination of every candidate model is scored by its mean
+        validation MSE over the folds of `cv`, and the best one is refitted on all training
+        rows behind the preprocessor (set to dense output if the model takes no sparse
+        input, as in the fold scoring). The preprocessor is fitted once per fold and its
+        output cached, so it is not recomputed for each of the candidate fits; the fits then
+        run in `n_jobs` joblib worker processes (holding one transformed copy of the
+        training data per fold).
+
+        Parameters:
+        candidates (list): (name, estimator, parameter grid) triples; defaults to ridge and
+            lasso regression on scaled features and histogram gradient-boosted trees.
+        cv (IndexSplittingStrategy): The cross-validation splits; defaults to 5-fold.
+        preprocessor (ColumnTransformer): The unfitted preprocessing; defaults to
+            `build_preprocessor` on the training data.
+        n_jobs (int): The number of worker processes; -1 uses all cores.
+        """
+        self.candidates = candidates if candidates is not None else default_search_candidates()
+        self.cv = cv if cv is not None else KFoldSplitStrategy(n_splits=5)
+        self.preprocessor = preprocessor
+        self.n_jobs = n_jobs
+        self.cv_results_ = None
+
+    def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
+        """
+        Searches the candidates with cross-validation and trains the best one.
+
+        Parameters:
+        X_train (pd.DataFrame): The training data features.
+        y_train (pd.Series): The training data labels/target.
+
+        Returns:
+        Pipeline: The preprocessor and the best model, trained on all of X_train. The scores
+        and wall times of all candidates are kept in `cv_results_`.
+        """
+        if not isinstance(X_train, pd.DataFrame):
+            raise TypeError("X_train must be a pandas DataFrame.")
+        if not isinstance(y_train, pd.Series):
+            raise TypeError("y_train must be a pandas Series.")
+
+        preprocessor = self.preprocessor if self.preprocessor is not None else build_preprocessor(X_train)
+        target_column = y_train.name if y_train.name is not None else "target"
+        folds = self.cv.split_indices(X_train.assign(**{target_column: y_train.to_numpy()}), target_column)
+        y = y_train.to_numpy(dtype=np.float64)
+
+        start = time.perf_counter()
+        with Parallel(n_jobs=self.n_jobs) as parallel:
+            logging.info(f"Preprocessing {len(folds)} cross-validation folds.")
+            cached_folds = parallel(
+                delayed(_preprocess_fold)(clone(preprocessor), X_train, y, train_indices, validation_indices)
+                for train_indices, validation_indices in folds
+            )
+
+            tasks = [
+                (name, params, estimator, fold)
+                for name, estimator, grid in self.candidates
+                for params in ParameterGrid(grid)
+                for fold in cached_folds
+            ]
+            logging.info(f"Fitting {len(tasks) // len(folds)} candidates on {len(folds)} folds each.")
+            scores = parallel(
+                delayed(_fit_and_score)(clone(estimator).set_params(**params), *fold)
+                for _, params, estimator, fold in tasks
+            )
+        logging.info(f"Cross-validated search took {time.perf_counter() - start:.1f}s.")
+
+        results = pd.DataFrame(
+            [
+                {"candidate": name, "params": params, "mse": mse, "fit_seconds": seconds}
+                for (name, params, _, _), (mse, seconds) in zip(tasks, scores)
+            ]
+        )
+        results["params"] = results["params"].map(repr)  # Hashable, to group the folds of a candidate
+        self.cv_results_ = (
+            results.groupby(["candidate", "params"], sort=False)
+            .agg(mean_mse=("mse", "mean"), std_mse=("mse", "std"), fit_seconds=("fit_seconds", "sum"))
+            .reset_index()
+            .sort_values("mean_mse", ignore_index=True)
+        )
+        for row in self.cv_results_.itertuples():
+            logging.info(
+                f"{row.candidate} {row.params}: mean MSE {row.mean_mse:.5g} (+/- {row.std_mse:.2g}), "
+                f"{row.fit_seconds:.2f}s fitting {len(folds)} folds"
+            )
+
+        best_index = int(results.groupby(["candidate", "params"], sort=False)["mse"].mean().argmin())
+        best_name, best_params, best_estimator, _ = tasks[best_index * len(folds)]
+        logging.info(f"Best candidate: {best_name} {best_params}. Training it on all rows.")
+        best_model = clone(best_estimator).set_params(**best_params)
+        final_preprocessor = clone(preprocessor)
+        if not _accepts_sparse(best_model):
+            # Like the fold scoring, give a model without sparse support dense input
+            final_preprocessor.set_params(sparse_threshold=0)
+        pipeline = Pipeline([("preprocessor", final_preprocessor), ("model", best_model)])
+        pipeline.fit(X_train, y_train)
+        logging.info("Model training completed.")
+        return pipeline
+
+
+def default_search_candidates() -> List[Tuple[str, Any, dict]]:
+    """Returns the default (name, estimator, parameter grid) candidates of CrossValidatedSearchStrategy."""
+    return [
+        (
+            "ridge",
+            make_pipeline(StandardScaler(with_mean=False), Ridge()),
+            {"ridge__alpha": [0.1, 1.0, 10.0, 100.0]},
+        ),
+        (
+            "lasso",
+            make_pipeline(StandardScaler(with_mean=False), Lasso(max_iter=10_000)),
+            {"lasso__alpha": [1e-4, 1e-3, 1e-2]},
+        ),
+        (
+            "hist_gradient_boosting",
+            HistGradientBoostingRegressor(random_state=42),
+            {"learning_rate": [0.05, 0.1], "max_leaf_nodes": [15, 31]},
+        ),
+    ]
+
+
+def build_preprocessor(X_train: pd.DataFrame) -> ColumnTransformer:
+    """
+    Builds the unfitted preprocessing of model_building_step for the columns of X_train.
+
+    Numerical columns are mean-imputed, categorical ones imputed with the most frequent value
+    and one-hot encoded, and already encoded pandas sparse columns (sparse one-hot encoding,
+    feature hashing) passed on as one CSR block without densifying them.
+
+    Parameters:
+    X_train (pd.DataFrame): The training data features.
+
+    Returns:
+    ColumnTransformer: The preprocessor, with "num", "cat" and "sparse" transformers in that order.
+    """
+    # Identify categorical, numerical and already encoded sparse columns
+    numerical_cols, categorical_cols, sparse_cols = column_groups(X_train)
+
+    logging.info(f"Categorical columns: {categorical_cols.tolist()}")
+    logging.info(f"Numerical columns: {numerical_cols.tolist()}")
+    logging.info(f"Sparse columns: {len(sparse_cols)}")
+
+    # Define preprocessing for categorical and numerical features
+    numerical_transformer = SimpleImputer(strategy="mean")
+    categorical_transformer = Pipeline(
+        steps=[
+            ("imputer", SimpleImputer(strategy="most_frequent")),
+            ("onehot", OneHotEncoder(handle_unknown="ignore")),
+        ]
+    )
+
+    # Sparse columns are passed to the model as one CSR block, without densifying them
+    sparse_transformer = FunctionTransformer(sparse_frame_to_csr, accept_sparse=True)
+
+    # Bundle preprocessing for numerical, categorical and sparse data
+    return ColumnTransformer(
+        transformers=[
+            ("num", numerical_transformer, numerical_cols),
+            ("cat", categorical_transformer, categorical_cols),
+            ("sparse", sparse_transformer, sparse_cols),
+        ]
+    )
+
+
+def column_groups(X: pd.DataFrame) -> Tuple[pd.Index, pd.Index, pd.Index]:
+    """
+    Splits the columns into the groups the preprocessors treat differently.
+
+    Parameters:
+    X (pd.DataFrame): The features.
+
+    Returns:
+    numerical, categorical, sparse: The numerical, categorical (object or category) and pandas
+    sparse columns, in frame order.
+    """
+    sparse_cols = X.columns[[isinstance(dtype, pd.SparseDtype) for dtype in X.dtypes]]
+    categorical_cols = X.select_dtypes(include=["object", "category"]).columns
+    numerical_cols = X.select_dtypes(exclude=["object", "category"]).columns.difference(sparse_cols, sort=False)
+    return numerical_cols, categorical_cols, sparse_cols
+
+
+def _column_group_names(X: pd.DataFrame) -> dict:
+    """Returns the column groups of `column_groups` as lists, keyed like the preprocessors' transformers."""
+    return {name: list(columns) for name, columns in zip(("num", "cat", "sparse"), column_groups(X))}
+
+
+def _fitted_column_groups(preprocessor) -> Optional[dict]:
+    """Returns the column groups a fitted preprocessor was built for, or None if unknown."""
+    if isinstance(preprocessor, StreamingPreprocessor):
+        return {"num": preprocessor.numerical_columns_, "cat": preprocessor.categorical_columns_, "sparse": []}
+    if isinstance(preprocessor, ColumnTransformer):
+        groups = {name: list(columns) for name, _, columns in preprocessor.transformers}
+        return {name: groups.get(name, []) for name in ("num", "cat", "sparse")}
+    return None
+
+
+def _preprocess_fold(preprocessor, X: pd.DataFrame, y: np.ndarray, train_indices, validation_indices):
+    """Fits the preprocessor on a fold's training rows and returns both sets of rows transformed."""
+    X_fold_train = preprocessor.fit_transform(X.take(train_indices))
+    X_fold_validation = preprocessor.transform(X.take(validation_indices))
+    return X_fold_train, y[train_indices], X_fold_validation, y[validation_indices]
+
+
+def _accepts_sparse(estimator) -> bool:
+    """Returns whether an estimator can be fitted on a sparse matrix."""
+    return get_tags(estimator).input_tags.sparse
+
+
+def _fit_and_score(estimator, X_fold_train, y_fold_train, X_fold_validation, y_fold_validation):
+    """Fits an estimator on cached fold data; returns its validation MSE and fit wall time."""
+    if sp.issparse(X_fold_train) and not _accepts_sparse(estimator):
+        X_fold_train, X_fold_validation = X_fold_train.toarray(), X_fold_validation.toarray()
+    start = time.perf_counter()
+    estimator.fit(X_fold_train, y_fold_train)
+    seconds = time.perf_counter() - start
+    return mean_squared_error(y_fold_validation, estimator.predict(X_fold_validation)), seconds
+
+
 # Context Class for Model Building
 class ModelBuilder:
     def __init__(self, strategy: ModelBuildingStrategy):
@@ -0,0 +1,143 @@
+import logging
+from abc import abstractmethod
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from scipy.stats import chi2
+from sklearn.covariance import MinCovDet
+from sklearn.ensemble import IsolationForest
+from src.outlier_detection import OutlierDetectionStrategy
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+# Abstract Base Class for Outlier Detection on whole rows rather than single columns
+class MultivariateOutlierDetectionStrategy(OutlierDetectionStrategy):
+    """
+    Flags rows that are outliers as a whole, given all numeric columns together, instead of
+    rows where any single column is extreme.
+
+    The model is fitted on a random subsample of rows, and the full frame is then scored in
+    row batches spread over `n_jobs` worker processes. Missing values are replaced by the
+    subsample's column medians.
+    """
+
+    def __init__(self, subsample=10_000, batch_size=50_000, n_jobs=-1, random_state=42):
+        """
+        Parameters:
+        subsample (int): The number of rows the model is fitted on; all rows if there are fewer.
+        batch_size (int): The number of rows scored per batch.
+        n_jobs (int): The number of worker processes scoring batches; -1 uses all cores.
+        random_state (int): Seed of the subsample and of randomized models.
+        """
+        self.subsample = subsample
+        self.batch_size = batch_size
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+        self.model_ = None
+        self.fill_values_ = None
+
+    @abstractmethod
+    def _fit_model(self, sample: np.ndarray):
+        """Returns the model fitted on a float block of sampled rows."""
+        pass
+
+    @abstractmethod
+    def _batch_outlier_rows(self, batch: np.ndarray) -> np.ndarray:
+        """Returns the row mask of outliers of a float block, with the fitted model."""
+        pass
+
+    def detect_outliers(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Flags every numeric column of the outlier rows, since an outlier row cannot be pinned
+        on one column; prefer `detect_outlier_rows`, which returns the row mask directly.
+        """
+        rows = self.detect_outlier_rows(df)
+        columns = df.select_dtypes(include="number").columns
+        return pd.DataFrame(np.repeat(rows[:, None], len(columns), axis=1), index=df.index, columns=columns)
+
+    def detect_outlier_rows(self, df: pd.DataFrame) -> np.ndarray:
+        logging.info(f"Detecting outlier rows using {type(self).__name__}.")
+        block = df.select_dtypes(include="number").to_numpy(dtype=np.float64, na_value=np.nan)
+
+        rng = np.random.default_rng(self.random_state)
+        sample_rows = rng.choice(len(block), size=min(self.subsample, len(block)), replace=False)
+        sample = block[np.sort(sample_rows)]
+        self.fill_values_ = np.nanmedian(sample, axis=0)
+        self.model_ = self._fit_model(self._fill(sample))
+
+        batches = [block[start : start + self.batch_size] for start in range(0, len(block), self.batch_size)]
+        masks = Parallel(n_jobs=self.n_jobs)(
+            delayed(self._batch_outlier_rows)(self._fill(batch)) for batch in batches
+        )
+        rows = np.concatenate(masks) if masks else np.zeros(0, dtype=bool)
+        logging.info(f"Detected {rows.sum()} outlier rows out of {len(rows)}.")
+        return rows
+
+    def _fill(self, block: np.ndarray) -> np.ndarray:
+        """Replaces missing values of a float block with the fitted column medians."""
+        if not np.isnan(block).any():
+            return block
+        return np.where(np.isnan(block), self.fill_values_, block)
+
+
+# Concrete Strategy for Isolation Forest Based Outlier Detection
+class IsolationForestOutlierDetection(MultivariateOutlierDetectionStrategy):
+    def __init__(self, contamination="auto", n_estimators=100, **kwargs):
+        """
+        Initializes the IsolationForestOutlierDetection.
+
+        Rows that random trees isolate in few splits are outliers.
+
+        Parameters:
+        contamination (float or 'auto'): The expected share of outliers, or 'auto' for the
+            threshold of the original Isolation Forest paper.
+        n_estimators (int): The number of trees, fitted on `n_jobs` cores.
+        **kwargs: subsample, batch_size, n_jobs and random_state; see
+            MultivariateOutlierDetectionStrategy.
+        """
+        super().__init__(**kwargs)
+        self.contamination = contamination
+        self.n_estimators = n_estimators
+
+    def _fit_model(self, sample: np.ndarray) -> IsolationForest:
+        return IsolationForest(
+            n_estimators=self.n_estimators,
+            contamination=self.contamination,
+            n_jobs=self.n_jobs,
+            random_state=self.random_state,
+        ).fit(sample)
+
+    def _batch_outlier_rows(self, batch: np.ndarray) -> np.ndarray:
+        return self.model_.predict(batch) == -1
+
+
+# Concrete Strategy for Robust Covariance (Minimum Covariance Determinant) Based Outlier Detection
+class RobustCovarianceOutlierDetection(MultivariateOutlierDetectionStrategy):
+    def __init__(self, alpha=0.001, support_fraction=None, **kwargs):
+        """
+        Initializes the RobustCovarianceOutlierDetection.
+
+        A robust mean and covariance are estimated with MinCovDet; rows whose squared
+        Mahalanobis distance exceeds the chi-squared (1 - alpha) quantile are outliers.
+
+        Parameters:
+        alpha (float): The false positive rate for rows from the fitted Gaussian.
+        support_fraction (float): The share of sample rows the MCD estimate is based on;
+            None uses sklearn's default.
+        **kwargs: subsample, batch_size, n_jobs and random_state; see
+            MultivariateOutlierDetectionStrategy.
+        """
+        super().__init__(**kwargs)
+        self.alpha = alpha
+        self.support_fraction = support_fraction
+        self.threshold_ = None
+
+    def _fit_model(self, sample: np.ndarray) -> MinCovDet:
+        self.threshold_ = chi2.ppf(1 - self.alpha, df=sample.shape[1])
+        return MinCovDet(support_fraction=self.support_fraction, random_state=self.random_state).fit(sample)
+
+    def _batch_outlier_rows(self, batch: np.ndarray) -> np.ndarray:
+        return self.model_.mahalanobis(batch) > self.threshold_
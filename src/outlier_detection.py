@@ -1,10 +1,13 @@
+import json
 import logging
 from abc import ABC, abstractmethod
+from copy import deepcopy
+from typing import Iterable, List
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import seaborn as sns
+from src.quantile_sketch import QuantileSketch
+from src.running_moments import RunningMoments
 
 # Setup logging configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -24,6 +27,21 @@ class OutlierDetectionStrategy(ABC):
         """
         pass
 
+    def detect_outlier_rows(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Flags the rows that contain at least one outlier.
+
+        The default reduces the boolean frame of detect_outliers; strategies override it with a
+        kernel that builds the row mask directly, one column at a time.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features for outlier detection.
+
+        Returns:
+        np.ndarray: A boolean array with one entry per row, True where the row has an outlier.
+        """
+        return self.detect_outliers(df).to_numpy().any(axis=1)
+
 
 # Concrete Strategy for Z-Score Based Outlier Detection
 class ZScoreOutlierDetection(OutlierDetectionStrategy):
@@ -37,6 +55,19 @@ class ZScoreOutlierDetection(OutlierDetectionStrategy):
         logging.info(f"Outliers detected with Z-score threshold: {self.threshold}.")
         return outliers
 
+    def detect_outlier_rows(self, df: pd.DataFrame) -> np.ndarray:
+        logging.info("Detecting outlier rows using the Z-score method.")
+        rows = np.zeros(len(df), dtype=bool)
+        for column in df.columns:
+            values, present = _column_values(df, column)
+            if len(present) < 2:
+                continue  # The standard deviation is undefined, so nothing is an outlier
+            mean, std = present.mean(), present.std(ddof=1)
+            # |x - mean| > threshold * std is the z-score test without dividing every cell
+            rows |= np.abs(values - mean) > self.threshold * std
+        logging.info(f"Outlier rows detected with Z-score threshold: {self.threshold}.")
+        return rows
+
 
 # Concrete Strategy for IQR Based Outlier Detection
 class IQROutlierDetection(OutlierDetectionStrategy):
@@ -49,6 +80,305 @@ class IQROutlierDetection(OutlierDetectionStrategy):
         logging.info("Outliers detected using the IQR method.")
         return outliers
 
+    def detect_outlier_rows(self, df: pd.DataFrame) -> np.ndarray:
+        logging.info("Detecting outlier rows using the IQR method.")
+        rows = np.zeros(len(df), dtype=bool)
+        for column in df.columns:
+            values, present = _column_values(df, column)
+            if not len(present):
+                continue
+            Q1, Q3 = _partition_quantiles(present, [0.25, 0.75])
+            IQR = Q3 - Q1
+            rows |= (values < (Q1 - 1.5 * IQR)) | (values > (Q3 + 1.5 * IQR))
+        logging.info("Outlier rows detected using the IQR method.")
+        return rows
+
+
+# Abstract Base Class for Outlier Detection from per-column statistics learnt over chunks
+class StreamingOutlierDetectionStrategy(OutlierDetectionStrategy):
+    """
+    Learns per-column outlier bounds in one pass over chunks of data, keeping mergeable
+    running statistics instead of the data, so the training set never has to fit in memory.
+
+    Statistics fitted on different chunks or worker processes combine with `merge`, and the
+    fitted state serializes with `to_dict`/`save`, so the same bounds can be applied at serve
+    time without the training data. Only numeric columns are fitted; columns without
+    statistics never contain outliers.
+    """
+
+    def __init__(self):
+        self.statistics_ = None
+
+    @abstractmethod
+    def _new_statistic(self):
+        """Returns an empty running statistic for one column."""
+        pass
+
+    @abstractmethod
+    def _statistic_from_dict(self, state: dict):
+        """Rebuilds a running statistic from its `to_dict` output."""
+        pass
+
+    @abstractmethod
+    def _column_bounds(self, statistic) -> tuple:
+        """Returns the (lower, upper) bounds of a column from its running statistic."""
+        pass
+
+    @abstractmethod
+    def get_params(self) -> dict:
+        """Returns the constructor parameters, so the strategy can be rebuilt from them."""
+        pass
+
+    def fit(self, df: pd.DataFrame) -> "StreamingOutlierDetectionStrategy":
+        """
+        Fits on a single in-memory DataFrame, treated as one chunk.
+
+        Parameters:
+        df (pd.DataFrame): The training DataFrame to learn the bounds from.
+
+        Returns:
+        StreamingOutlierDetectionStrategy: The fitted strategy.
+        """
+        return self.fit_chunks([df])
+
+    def fit_chunks(self, chunks: Iterable[pd.DataFrame]) -> "StreamingOutlierDetectionStrategy":
+        """
+        Learns the statistics of every numeric column in a single pass over DataFrame chunks.
+
+        Parameters:
+        chunks (Iterable[pd.DataFrame]): The training data, chunk by chunk.
+
+        Returns:
+        StreamingOutlierDetectionStrategy: The fitted strategy.
+        """
+        logging.info(f"Fitting outlier statistics over chunks with {type(self).__name__}.")
+        statistics = {}
+        n_rows = 0
+        for chunk in chunks:
+            for column in chunk.select_dtypes(include="number").columns:
+                if column not in statistics:
+                    statistics[column] = self._new_statistic()
+                statistics[column].add(chunk[column].to_numpy(dtype=np.float64, na_value=np.nan))
+            n_rows += len(chunk)
+
+        self.statistics_ = statistics
+        logging.info(f"Fitted outlier statistics of {len(statistics)} columns over {n_rows} rows.")
+        return self
+
+    def merge(self, other: "StreamingOutlierDetectionStrategy") -> "StreamingOutlierDetectionStrategy":
+        """
+        Merges the statistics another worker fitted on different rows into this strategy.
+
+        Parameters:
+        other (StreamingOutlierDetectionStrategy): A fitted strategy of the same type and parameters.
+
+        Returns:
+        StreamingOutlierDetectionStrategy: This strategy, now fitted on the rows of both.
+        """
+        if type(other) is not type(self) or other.get_params() != self.get_params():
+            raise ValueError("Only strategies of the same type and parameters can be merged.")
+        if self.statistics_ is None or other.statistics_ is None:
+            raise ValueError(f"{type(self).__name__} must be fitted before it can be merged.")
+        for column, statistic in other.statistics_.items():
+            if column in self.statistics_:
+                self.statistics_[column].merge(statistic)
+            else:
+                self.statistics_[column] = deepcopy(statistic)
+        return self
+
+    def bounds(self) -> pd.DataFrame:
+        """
+        Returns the fitted outlier bounds; values outside them are outliers.
+
+        Returns:
+        pd.DataFrame: Rows 'lower' and 'upper', one column per fitted column.
+        """
+        if self.statistics_ is None:
+            raise ValueError(f"{type(self).__name__} must be fitted before outliers can be detected.")
+        bounds = {column: self._column_bounds(statistic) for column, statistic in self.statistics_.items()}
+        return pd.DataFrame(bounds, index=["lower", "upper"], dtype=np.float64)
+
+    def detect_outliers(self, df: pd.DataFrame) -> pd.DataFrame:
+        logging.info(f"Detecting outliers using the fitted bounds of {type(self).__name__}.")
+        bounds = self.bounds()
+        outliers = pd.DataFrame(False, index=df.index, columns=df.columns)
+        for column in bounds.columns.intersection(df.columns, sort=False):
+            values, _ = _column_values(df, column)
+            outliers[column] = (values < bounds.at["lower", column]) | (values > bounds.at["upper", column])
+        logging.info("Outliers detected using the fitted bounds.")
+        return outliers
+
+    def detect_outlier_rows(self, df: pd.DataFrame) -> np.ndarray:
+        logging.info(f"Detecting outlier rows using the fitted bounds of {type(self).__name__}.")
+        bounds = self.bounds()
+        rows = np.zeros(len(df), dtype=bool)
+        for column in bounds.columns.intersection(df.columns, sort=False):
+            values, _ = _column_values(df, column)
+            rows |= (values < bounds.at["lower", column]) | (values > bounds.at["upper", column])
+        logging.info("Outlier rows detected using the fitted bounds.")
+        return rows
+
+    def to_dict(self) -> dict:
+        """
+        Returns the fitted state as a JSON-serializable dictionary.
+
+        Returns:
+        dict: The parameters and the running statistic of every fitted column.
+        """
+        if self.statistics_ is None:
+            raise ValueError(f"{type(self).__name__} must be fitted before it can be serialized.")
+        return {
+            "params": self.get_params(),
+            "statistics": {column: statistic.to_dict() for column, statistic in self.statistics_.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "StreamingOutlierDetectionStrategy":
+        """
+        Rebuilds a fitted strategy from the output of `to_dict`.
+
+        Parameters:
+        state (dict): The serialized fitted state.
+
+        Returns:
+        StreamingOutlierDetectionStrategy: A fitted strategy, ready to detect outliers or merge.
+        """
+        strategy = cls(**state["params"])
+        strategy.statistics_ = {
+            column: strategy._statistic_from_dict(statistic) for column, statistic in state["statistics"].items()
+        }
+        return strategy
+
+    def save(self, path: str):
+        """
+        Saves the fitted state as JSON, e.g. next to the model artifact.
+
+        Parameters:
+        path (str): The JSON file to write.
+        """
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        logging.info(f"Saved outlier statistics of {len(self.statistics_)} columns to {path}")
+
+    @classmethod
+    def load(cls, path: str) -> "StreamingOutlierDetectionStrategy":
+        """
+        Loads a fitted state saved with `save`.
+
+        Parameters:
+        path (str): The JSON file to read.
+
+        Returns:
+        StreamingOutlierDetectionStrategy: A fitted strategy, ready to detect outliers or merge.
+        """
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+
+# Concrete Strategy for Z-Score Based Outlier Detection over chunks
+class StreamingZScoreOutlierDetection(StreamingOutlierDetectionStrategy):
+    def __init__(self, threshold=3):
+        """
+        Initializes the StreamingZScoreOutlierDetection.
+
+        Means and standard deviations are exact, from Welford-style RunningMoments.
+
+        Parameters:
+        threshold (float): Values more than `threshold` standard deviations from the mean are outliers.
+        """
+        super().__init__()
+        self.threshold = threshold
+
+    def get_params(self) -> dict:
+        return {"threshold": self.threshold}
+
+    def _new_statistic(self) -> RunningMoments:
+        return RunningMoments()
+
+    def _statistic_from_dict(self, state: dict) -> RunningMoments:
+        return RunningMoments.from_dict(state)
+
+    def _column_bounds(self, statistic: RunningMoments) -> tuple:
+        if statistic.count < 2:
+            return np.nan, np.nan  # The standard deviation is undefined, so nothing is an outlier
+        margin = self.threshold * statistic.std(ddof=1)
+        return statistic.mean - margin, statistic.mean + margin
+
+
+# Concrete Strategy for IQR Based Outlier Detection over chunks
+class StreamingIQROutlierDetection(StreamingOutlierDetectionStrategy):
+    def __init__(self, relative_accuracy=0.01):
+        """
+        Initializes the StreamingIQROutlierDetection.
+
+        Quartiles come from one QuantileSketch per column and are within `relative_accuracy`
+        of the true quartiles.
+
+        Parameters:
+        relative_accuracy (float): The relative error bound of the quartile estimates.
+        """
+        super().__init__()
+        self.relative_accuracy = relative_accuracy
+
+    def get_params(self) -> dict:
+        return {"relative_accuracy": self.relative_accuracy}
+
+    def _new_statistic(self) -> QuantileSketch:
+        return QuantileSketch(self.relative_accuracy)
+
+    def _statistic_from_dict(self, state: dict) -> QuantileSketch:
+        return QuantileSketch.from_dict(state)
+
+    def _column_bounds(self, statistic: QuantileSketch) -> tuple:
+        # Widen the quartiles by their error bound, so that only values that are outliers for
+        # every quartile consistent with the sketch are flagged; otherwise a column with a
+        # zero IQR (e.g. Kitchen AbvGr) gets an empty range that excludes its own values
+        Q1 = statistic.quantile(0.25) - self.relative_accuracy * abs(statistic.quantile(0.25))
+        Q3 = statistic.quantile(0.75) + self.relative_accuracy * abs(statistic.quantile(0.75))
+        IQR = Q3 - Q1
+        return Q1 - 1.5 * IQR, Q3 + 1.5 * IQR
+
+
+def column_quantiles(df: pd.DataFrame, quantiles: list) -> pd.DataFrame:
+    """
+    Computes several quantiles of every column with a single partition per column.
+
+    Missing values are ignored and the interpolation is linear, as in DataFrame.quantile, but
+    no column is fully sorted and no quantile needs a pass of its own.
+
+    Parameters:
+    df (pd.DataFrame): The dataframe with numeric columns.
+    quantiles (list): The quantiles to compute, each in [0, 1].
+
+    Returns:
+    pd.DataFrame: One row per quantile and one column per input column; NaN for columns
+        without values.
+    """
+    result = np.full((len(quantiles), df.shape[1]), np.nan)
+    for i, column in enumerate(df.columns):
+        _, present = _column_values(df, column)
+        if len(present):
+            result[:, i] = _partition_quantiles(present, quantiles)
+    return pd.DataFrame(result, index=quantiles, columns=df.columns)
+
+
+def _column_values(df: pd.DataFrame, column):
+    """Returns a column as float64 values (NaN = missing), and only its non-missing values."""
+    values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+    return values, values[~np.isnan(values)]
+
+
+def _partition_quantiles(values: np.ndarray, quantiles: list) -> np.ndarray:
+    """
+    Returns linearly interpolated quantiles of non-missing values. All order statistics the
+    quantiles interpolate between are selected by one np.partition call.
+    """
+    positions = np.asarray(quantiles, dtype=np.float64) * (len(values) - 1)
+    low = np.floor(positions).astype(np.intp)
+    high = np.ceil(positions).astype(np.intp)
+    partitioned = np.partition(values, np.unique(np.concatenate([low, high])))
+    return partitioned[low] + (positions - low) * (partitioned[high] - partitioned[low])
+
 
 # Context Class for Outlier Detection and Handling
 class OutlierDetector:
@@ -63,14 +393,34 @@ class OutlierDetector:
         logging.info("Executing outlier detection strategy.")
         return self._strategy.detect_outliers(df)
 
-    def handle_outliers(self, df: pd.DataFrame, method="remove", **kwargs) -> pd.DataFrame:
-        outliers = self.detect_outliers(df)
+    def detect_outlier_rows(self, df: pd.DataFrame) -> np.ndarray:
+        logging.info("Executing outlier row detection strategy.")
+        return self._strategy.detect_outlier_rows(df)
+
+    def handle_outliers(self, df: pd.DataFrame, method="remove", copy=True, columns=None, **kwargs) -> pd.DataFrame:
+        # Outliers are detected on `columns` only (all columns if None), but whole rows of
+        # the full frame are removed, so the other columns (e.g. categoricals) are kept
+        detection_df = df if columns is None else df[columns]
         if method == "remove":
             logging.info("Removing outliers from the dataset.")
-            df_cleaned = df[(~outliers).all(axis=1)]
+            # The strategy builds the row mask directly; no per-cell boolean frame is materialized
+            keep = ~self.detect_outlier_rows(detection_df)
+            del detection_df
+            # Rows are selected by position, so duplicated index labels are handled; removing
+            # rows copies the data in place too, so `copy=False` only saves memory when capping
+            df_cleaned = df[keep]
         elif method == "cap":
             logging.info("Capping outliers in the dataset.")
-            df_cleaned = df.clip(lower=df.quantile(0.01), upper=df.quantile(0.99), axis=1)
+            bounds = column_quantiles(detection_df, [0.01, 0.99])
+            lower, upper = bounds.loc[0.01], bounds.loc[0.99]
+            if copy and columns is None:
+                df_cleaned = df.clip(lower=lower, upper=upper, axis=1)
+            else:
+                # One column at a time, so at most one extra column is alive; a shallow copy
+                # shares the untouched columns with the input
+                df_cleaned = df.copy(deep=False) if copy else df
+                for column in bounds.columns:
+                    df_cleaned[column] = df_cleaned[column].clip(lower=lower[column], upper=upper[column])
         else:
             logging.warning(f"Unknown method '{method}'. No outlier handling performed.")
             return df
@@ -78,14 +428,19 @@ class OutlierDetector:
         logging.info("Outlier handling completed.")
         return df_cleaned
 
-    def visualize_outliers(self, df: pd.DataFrame, features: list):
+    def visualize_outliers(
+        self, df: pd.DataFrame, features: list, output_dir: str = "outputs", plots_per_file=None, max_workers=None
+    ) -> List[str]:
+        # Boxplots are rendered headless to PNG files (see render_outlier_boxplots); imported
+        # here, as the renderer itself uses this module's column_quantiles
+        from src.outlier_visualization import render_outlier_boxplots
+
         logging.info(f"Visualizing outliers for features: {features}")
-        for feature in features:
-            plt.figure(figsize=(10, 6))
-            sns.boxplot(x=df[feature])
-            plt.title(f"Boxplot of {feature}")
-            plt.show()
+        paths = render_outlier_boxplots(
+            df, features, output_dir=output_dir, plots_per_file=plots_per_file, max_workers=max_workers
+        )
         logging.info("Outlier visualization completed.")
+        return paths
 
 
 # Example usage
@@ -0,0 +1,131 @@
+import logging
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from src.outlier_detection import column_quantiles
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def boxplot_statistics(df: pd.DataFrame, features: list, max_fliers: int = 1_000) -> List[dict]:
+    """
+    Precomputes the boxplot of every feature, so that rendering never touches the raw columns.
+
+    The quartiles of all features come from one partition per column (see column_quantiles);
+    whiskers reach the most extreme values within 1.5 IQR of the box, like seaborn's boxplot.
+
+    Parameters:
+    df (pd.DataFrame): The dataframe containing the features.
+    features (list): The numeric features to summarize.
+    max_fliers (int): The most outliers kept per feature; larger sets are thinned evenly over
+        their sorted values, which keeps the extremes.
+
+    Returns:
+    list: One dictionary per feature in the format of matplotlib's Axes.bxp.
+    """
+    quartiles = column_quantiles(df[features], [0.25, 0.5, 0.75])
+    statistics = []
+    for feature in features:
+        values = df[feature].to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values[~np.isnan(values)]
+        q1, median, q3 = quartiles[feature]
+        if not len(values):
+            whislo = whishi = q1
+            fliers = values
+        else:
+            iqr = q3 - q1
+            inside = (values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)
+            whislo, whishi = values[inside].min(), values[inside].max()
+            fliers = np.sort(values[~inside])
+            if len(fliers) > max_fliers:
+                fliers = fliers[np.linspace(0, len(fliers) - 1, max_fliers).astype(np.intp)]
+        statistics.append(
+            {
+                "label": feature,
+                "q1": q1,
+                "med": median,
+                "q3": q3,
+                "whislo": whislo,
+                "whishi": whishi,
+                "fliers": fliers,
+            }
+        )
+    return statistics
+
+
+def render_outlier_boxplots(
+    df: pd.DataFrame,
+    features: list,
+    output_dir: str = "outputs",
+    plots_per_file: Optional[int] = None,
+    max_workers: Optional[int] = None,
+) -> List[str]:
+    """
+    Renders boxplots of `features` to PNG files without a display, instead of one blocking
+    plt.show() per feature.
+
+    Summary statistics are computed once up front; worker processes then each draw a grid
+    figure of up to `plots_per_file` boxplots with the Agg canvas, so no pyplot state or
+    interactive backend is involved.
+
+    Parameters:
+    df (pd.DataFrame): The dataframe containing the features.
+    features (list): The numeric features to plot.
+    output_dir (str): The directory the PNG files are written to.
+    plots_per_file (int): Boxplots per file; None draws all of them into one grid figure and
+        1 writes one '<feature>_boxplot.png' per feature.
+    max_workers (int): Processes rendering files; defaults to the CPU count.
+
+    Returns:
+    list: The paths of the written files.
+    """
+    logging.info(f"Rendering outlier boxplots for features: {features}")
+    os.makedirs(output_dir, exist_ok=True)
+    statistics = boxplot_statistics(df, features)
+
+    plots_per_file = plots_per_file or max(len(features), 1)
+    pages = [statistics[start : start + plots_per_file] for start in range(0, len(statistics), plots_per_file)]
+    if plots_per_file == 1:
+        paths = [os.path.join(output_dir, f"{_file_name(page[0]['label'])}_boxplot.png") for page in pages]
+    elif len(pages) == 1:
+        paths = [os.path.join(output_dir, "outlier_boxplots.png")]
+    else:
+        paths = [os.path.join(output_dir, f"outlier_boxplots_{i + 1}.png") for i in range(len(pages))]
+
+    max_workers = min(max_workers or os.cpu_count() or 1, len(pages))
+    if max_workers <= 1:
+        for page, path in zip(pages, paths):
+            _render_page(page, path)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(_render_page, pages, paths))
+
+    logging.info(f"Rendered {len(statistics)} boxplots to {len(paths)} file(s) in {output_dir}.")
+    return paths
+
+
+def _render_page(statistics: List[dict], path: str):
+    """Draws a grid of precomputed boxplots into a PNG file on an Agg canvas."""
+    n_columns = min(len(statistics), 4)
+    n_rows = math.ceil(len(statistics) / n_columns)
+    figure = Figure(figsize=(10 if n_columns == 1 else 4 * n_columns, 6 if n_rows == 1 else 3 * n_rows))
+    FigureCanvasAgg(figure)
+    for i, feature_statistics in enumerate(statistics):
+        axes = figure.add_subplot(n_rows, n_columns, i + 1)
+        axes.bxp([feature_statistics], orientation="horizontal", showfliers=True)
+        axes.set_yticks([])
+        axes.set_title(f"Boxplot of {feature_statistics['label']}")
+    figure.tight_layout()
+    figure.savefig(path)
+
+
+def _file_name(feature: str) -> str:
+    """Makes a feature name safe to use in a file name (e.g. 'Year Remod/Add')."""
+    return feature.replace(os.sep, "_").replace("/", "_")
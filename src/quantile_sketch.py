@@ -0,0 +1,148 @@
+import logging
+import math
+from typing import Dict
+
+import numpy as np
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+class QuantileSketch:
+    """
+    A mergeable quantile sketch with a relative-error guarantee (DDSketch).
+
+    Values are counted in logarithmically sized buckets: bucket i holds the magnitudes in
+    (gamma^(i-1), gamma^i] with gamma = (1 + a) / (1 - a), so every quantile estimate lies
+    within a relative error `a` of the true value. Memory grows with the log of the value
+    range rather than with the number of values, and two sketches with the same accuracy
+    merge exactly by adding their bucket counts, so chunks (or shards) can be sketched
+    independently.
+    """
+
+    # Magnitudes below this are counted as zero
+    MIN_INDEXABLE_VALUE = 1e-9
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """
+        Initializes an empty QuantileSketch.
+
+        Parameters:
+        relative_accuracy (float): The relative error bound of quantile estimates, in (0, 1).
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1.")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, values: np.ndarray):
+        """
+        Adds an array of values to the sketch in one vectorized pass; NaNs are ignored.
+
+        Parameters:
+        values (np.ndarray): The values to add.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        magnitudes = np.abs(values)
+        is_zero = magnitudes < self.MIN_INDEXABLE_VALUE
+        self.zero_count += int(is_zero.sum())
+        self._add_to_store(self.positive, magnitudes[(values > 0) & ~is_zero])
+        self._add_to_store(self.negative, magnitudes[(values < 0) & ~is_zero])
+        self.count += len(values)
+
+    def merge(self, other: "QuantileSketch"):
+        """
+        Merges another sketch into this one; the result is exactly the sketch of both inputs.
+
+        Parameters:
+        other (QuantileSketch): A sketch with the same relative accuracy.
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Only sketches with the same relative accuracy can be merged.")
+        for store, other_store in [(self.positive, other.positive), (self.negative, other.negative)]:
+            for index, count in other_store.items():
+                store[index] = store.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimates the q-quantile of the added values.
+
+        Parameters:
+        q (float): The quantile to estimate, in [0, 1] (0.5 for the median).
+
+        Returns:
+        float: The estimate, within the relative accuracy of the true value; NaN if empty.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1.")
+        if self.count == 0:
+            return np.nan
+
+        rank = q * (self.count - 1)
+        # Walk the buckets in value order: negatives by decreasing magnitude, zero, positives
+        seen = 0
+        for index in sorted(self.negative, reverse=True):
+            seen += self.negative[index]
+            if seen > rank:
+                return -self._bucket_value(index)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for index in sorted(self.positive):
+            seen += self.positive[index]
+            if seen > rank:
+                return self._bucket_value(index)
+        return self._bucket_value(max(self.positive))
+
+    def to_dict(self) -> dict:
+        """
+        Returns the sketch as a JSON-serializable dictionary.
+
+        Returns:
+        dict: The relative accuracy, the bucket counts and the zero and total counts.
+        """
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "positive": {str(index): count for index, count in self.positive.items()},
+            "negative": {str(index): count for index, count in self.negative.items()},
+            "zero_count": self.zero_count,
+            "count": self.count,
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "QuantileSketch":
+        """
+        Rebuilds a sketch from the output of `to_dict`.
+
+        Parameters:
+        state (dict): The serialized sketch.
+
+        Returns:
+        QuantileSketch: The sketch, ready for more values, merges or quantile queries.
+        """
+        sketch = cls(state["relative_accuracy"])
+        sketch.positive = {int(index): count for index, count in state["positive"].items()}
+        sketch.negative = {int(index): count for index, count in state["negative"].items()}
+        sketch.zero_count = state["zero_count"]
+        sketch.count = state["count"]
+        return sketch
+
+    def _add_to_store(self, store: Dict[int, int], magnitudes: np.ndarray):
+        """Counts positive magnitudes into their bucket indices."""
+        if not len(magnitudes):
+            return
+        indices = np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64)
+        for index, count in zip(*np.unique(indices, return_counts=True)):
+            store[int(index)] = store.get(int(index), 0) + int(count)
+
+    def _bucket_value(self, index: int) -> float:
+        """Returns the value representing a bucket, within the relative accuracy of all its members."""
+        return 2 * self.gamma**index / (self.gamma + 1)
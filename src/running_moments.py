@@ -0,0 +1,98 @@
+import logging
+
+import numpy as np
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+class RunningMoments:
+    """
+    The running count, mean and variance of a stream of values (Welford's algorithm).
+
+    Instead of one update per value, each added array is reduced to its own count, mean and
+    sum of squared deviations, which are then combined with the running state by Chan et
+    al.'s pairwise update. The same update merges two RunningMoments exactly, so chunks (or
+    shards on different workers) can be summarized independently, and no sum of squares is
+    ever accumulated directly, which keeps the variance numerically stable.
+    """
+
+    def __init__(self):
+        """Initializes empty RunningMoments."""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # Sum of squared deviations from the mean
+
+    def add(self, values: np.ndarray):
+        """
+        Adds an array of values in one vectorized pass; NaNs are ignored.
+
+        Parameters:
+        values (np.ndarray): The values to add.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values):
+            mean = float(values.mean())
+            self._combine(len(values), mean, float(np.square(values - mean).sum()))
+
+    def merge(self, other: "RunningMoments"):
+        """
+        Merges other moments into these; the result equals the moments of both inputs.
+
+        Parameters:
+        other (RunningMoments): The moments to merge in.
+        """
+        if other.count:
+            self._combine(other.count, other.mean, other.m2)
+
+    def variance(self, ddof: int = 1) -> float:
+        """
+        Returns the variance of the added values.
+
+        Parameters:
+        ddof (int): Delta degrees of freedom; 1 (the default) gives the sample variance, as
+            DataFrame.var does.
+
+        Returns:
+        float: The variance; NaN with ddof or fewer values.
+        """
+        if self.count <= ddof:
+            return np.nan
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof: int = 1) -> float:
+        """Returns the standard deviation of the added values; see `variance`."""
+        return float(np.sqrt(self.variance(ddof)))
+
+    def to_dict(self) -> dict:
+        """
+        Returns the moments as a JSON-serializable dictionary.
+
+        Returns:
+        dict: The count, the mean and the sum of squared deviations.
+        """
+        return {"count": self.count, "mean": self.mean, "m2": self.m2}
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "RunningMoments":
+        """
+        Rebuilds moments from the output of `to_dict`.
+
+        Parameters:
+        state (dict): The serialized moments.
+
+        Returns:
+        RunningMoments: The moments, ready for more values or merges.
+        """
+        moments = cls()
+        moments.count, moments.mean, moments.m2 = state["count"], state["mean"], state["m2"]
+        return moments
+
+    def _combine(self, count: int, mean: float, m2: float):
+        """Combines the moments of another batch of values into the running state."""
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta**2 * self.count * count / total
+        self.count = total
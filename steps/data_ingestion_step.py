@@ -1,21 +1,41 @@
+from typing import Dict, List, Optional
+
 import pandas as pd
 from src.ingest_data import DataIngestorFactory
+from src.ingestion_cache import CachedDataIngestor
 from zenml import step
 
 @step
-def data_ingestion_step(file_path: str) -> pd.DataFrame:
+def data_ingestion_step(
+    file_path: str,
+    columns: Optional[List[str]] = None,
+    filters: Optional[list] = None,
+    schema: Optional[Dict[str, str]] = None,
+    use_cache: bool = True,
+) -> pd.DataFrame:
     """
     ZenML step for data ingestion.
 
-    This step ingests data from a ZIP file containing CSV data using the DataIngestorFactory.
+    This step ingests data from a ZIP/CSV file (or a directory of CSV shards), a Parquet/Feather
+    file or a partitioned Parquet directory, choosing the ingestor from the DataIngestorFactory
+    by path (see `get_data_ingestor_for_path`).
 
     Parameters:
-    file_path (str): Path to the ZIP file to ingest data from.
+    file_path (str): Path to the file (or shard/dataset directory) to ingest data from.
+    columns (list): The columns to load; all columns are loaded if None.
+    filters (list): Row filters pushed down to Parquet/Feather scans, in pyarrow's DNF form;
+        not supported for CSV data (a ValueError is raised).
+    schema (dict): Column name to dtype applied while parsing (e.g. src.ames_schema.AMES_DTYPES).
+    use_cache (bool): Reuse the parsed frame from the on-disk ingestion cache when the input
+        content and options are unchanged.
 
     Returns:
     pd.DataFrame: The ingested dataframe.
     """
-    file_extension = ".zip"
-    data_ingestor = DataIngestorFactory.get_data_ingestor(file_extension)
+    data_ingestor = DataIngestorFactory.get_data_ingestor_for_path(
+        file_path, columns=columns, filters=filters, schema=schema
+    )
+    if use_cache:
+        data_ingestor = CachedDataIngestor(data_ingestor)
     df = data_ingestor.ingest(file_path)
     return df
@@ -1,15 +1,71 @@
-from typing import Tuple
+from typing import Annotated, Tuple
 
+import numpy as np
 import pandas as pd
-from src.data_splitter import DataSplitter, SimpleTrainTestSplitStrategy
+from src.data_splitter import (
+    DataSplitter,
+    KFoldSplitStrategy,
+    SimpleTrainTestSplitStrategy,
+    StratifiedKFoldSplitStrategy,
+    TimeOrderedSplitStrategy,
+)
+from steps.sparse_dataframe_materializer import SparseDataFrameMaterializer
 from zenml import step
 
 
-@step
+@step(output_materializers={"X_train": SparseDataFrameMaterializer, "X_test": SparseDataFrameMaterializer})
 def data_splitter_step(
     df: pd.DataFrame, target_column: str
-) -> Tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series]:
-    """Splits the data into training and testing sets using DataSplitter and a chosen strategy."""
+) -> Tuple[
+    Annotated[pd.DataFrame, "X_train"],
+    Annotated[pd.DataFrame, "X_test"],
+    Annotated[pd.Series, "y_train"],
+    Annotated[pd.Series, "y_test"],
+]:
+    """
+    Splits the data into training and testing sets using DataSplitter and a chosen strategy.
+
+    Sparse feature columns (e.g. from sparse one-hot encoding or feature hashing) are stored
+    sparse, so they reach model_building_step without being densified.
+    """
     splitter = DataSplitter(strategy=SimpleTrainTestSplitStrategy())
     X_train, X_test, y_train, y_test = splitter.split(df, target_column)
     return X_train, X_test, y_train, y_test
+
+
+@step
+def data_index_splitter_step(
+    df: pd.DataFrame, target_column: str, strategy: str = "simple", n_splits: int = 5, fold: int = -1
+) -> Tuple[Annotated[np.ndarray, "train_indices"], Annotated[np.ndarray, "test_indices"]]:
+    """
+    Splits the rows into training and testing sets as positional index vectors into `df`.
+
+    Unlike data_splitter_step, no rows are copied: the artifacts are two integer vectors, and
+    the model building and evaluation steps gather their rows from the one `df` artifact.
+
+    Parameters:
+    df (pd.DataFrame): The input DataFrame to be split.
+    target_column (str): The name of the target column.
+    strategy (str): "simple" (the same rows as data_splitter_step), "kfold", "stratified"
+        (K-fold stratified by the binned target) or "time" (train on earlier sales).
+    n_splits (int): The number of folds of the K-fold and time-ordered strategies.
+    fold (int): The fold used as the holdout split; -1 is the last one, i.e. the most recent
+        sales for the time-ordered strategy.
+
+    Returns:
+    train_indices, test_indices: The positions of the training and testing rows.
+    """
+    if strategy == "simple":
+        splitting_strategy = SimpleTrainTestSplitStrategy()
+    elif strategy == "kfold":
+        splitting_strategy = KFoldSplitStrategy(n_splits=n_splits)
+    elif strategy == "stratified":
+        splitting_strategy = StratifiedKFoldSplitStrategy(n_splits=n_splits)
+    elif strategy == "time":
+        splitting_strategy = TimeOrderedSplitStrategy(n_splits=n_splits)
+    else:
+        raise ValueError(f"Unsupported data splitting strategy: {strategy}")
+
+    splitter = DataSplitter(strategy=splitting_strategy)
+    train_indices, test_indices = splitter.split_indices(df, target_column)[fold]
+    return train_indices, test_indices
@@ -1,34 +1,103 @@
+from typing import Annotated, List, Optional, Tuple
+
 import pandas as pd
 from src.feature_engineering import (
+    CompositeFeatureEngineering,
     FeatureEngineer,
+    FeatureEngineeringStrategy,
+    FeatureHashing,
+    FrequencyEncoding,
     LogTransformation,
     MinMaxScaling,
     OneHotEncoding,
     StandardScaling,
+    TargetEncoding,
 )
-from zenml import step
+from steps.sparse_dataframe_materializer import SparseDataFrameMaterializer
+from zenml import ArtifactConfig, step
 
 
-@step
+@step(output_materializers={"featured_data": SparseDataFrameMaterializer})
 def feature_engineering_step(
-    df: pd.DataFrame, strategy: str = "log", features: list = None
-) -> pd.DataFrame:
-    """Performs feature engineering using FeatureEngineer and selected strategy."""
+    df: pd.DataFrame,
+    strategy: str = "log",
+    features: list = None,
+    copy: bool = True,
+    strategies: Optional[List[dict]] = None,
+    sparse: bool = False,
+    target_column: str = "SalePrice",
+) -> Tuple[
+    Annotated[pd.DataFrame, "featured_data"],
+    Annotated[dict, ArtifactConfig(name="feature_engineering_state")],
+]:
+    """
+    Performs feature engineering using FeatureEngineer and selected strategy.
+
+    The strategy is fitted once on `df`; its fitted state (e.g. scaler statistics or encoder
+    categories) is returned as a separate artifact, so the serving path can rebuild it with
+    FeatureEngineeringStrategy.from_dict and run transform only. With copy=False the input
+    frame is transformed in place rather than copied.
+
+    To chain several strategies in this one step, pass `strategies` as an ordered list of
+    {"strategy": ..., "features": [...]} dictionaries; `strategy` and `features` are then
+    ignored. They are applied in one pass by CompositeFeatureEngineering, so no intermediate
+    frame is written as an artifact.
+
+    With sparse=True, one-hot encoding emits pandas sparse columns; the "hashing" strategy
+    always does. Such frames are stored by SparseDataFrameMaterializer instead of Parquet.
+
+    "target_encoding" and "frequency_encoding" replace each categorical feature by a single
+    float column; target encoding is cross-fitted on `target_column` (see TargetEncoding).
+    """
+    if strategies:
+        engineer = FeatureEngineer(
+            CompositeFeatureEngineering(
+                [
+                    _build_strategy(
+                        spec["strategy"],
+                        spec.get("features"),
+                        sparse=spec.get("sparse", sparse),
+                        target_column=target_column,
+                    )
+                    for spec in strategies
+                ],
+                copy=copy,
+            )
+        )
+    else:
+        engineer = FeatureEngineer(
+            _build_strategy(strategy, features, copy=copy, sparse=sparse, target_column=target_column)
+        )
 
+    transformed_df = engineer.apply_feature_engineering(df)
+    return transformed_df, engineer.get_strategy().to_dict()
+
+
+def _build_strategy(
+    strategy: str,
+    features: list = None,
+    copy: bool = True,
+    sparse: bool = False,
+    target_column: str = "SalePrice",
+) -> FeatureEngineeringStrategy:
+    """Returns the feature engineering strategy named `strategy` over `features`."""
     # Ensure features is a list, even if not provided
     if features is None:
         features = []  # or raise an error if features are required
 
     if strategy == "log":
-        engineer = FeatureEngineer(LogTransformation(features))
+        return LogTransformation(features, copy=copy)
     elif strategy == "standard_scaling":
-        engineer = FeatureEngineer(StandardScaling(features))
+        return StandardScaling(features, copy=copy)
     elif strategy == "minmax_scaling":
-        engineer = FeatureEngineer(MinMaxScaling(features))
+        return MinMaxScaling(features, copy=copy)
     elif strategy == "onehot_encoding":
-        engineer = FeatureEngineer(OneHotEncoding(features))
+        return OneHotEncoding(features, copy=copy, sparse=sparse)
+    elif strategy == "hashing":
+        return FeatureHashing(features, copy=copy)
+    elif strategy == "target_encoding":
+        return TargetEncoding(features, target=target_column, copy=copy)
+    elif strategy == "frequency_encoding":
+        return FrequencyEncoding(features, copy=copy)
     else:
         raise ValueError(f"Unsupported feature engineering strategy: {strategy}")
-
-    transformed_df = engineer.apply_feature_engineering(df)
-    return transformed_df
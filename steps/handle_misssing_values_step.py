@@ -1,22 +1,37 @@
+from typing import Annotated, Tuple
+
 import pandas as pd
 from src.handle_missing_values import (
     DropMissingValuesStrategy,
     FillMissingValuesStrategy,
     MissingValueHandler,
 )
-from zenml import step
+from zenml import ArtifactConfig, step
 
 
 @step
-def handle_missing_values_step(df: pd.DataFrame, strategy: str = "mean") -> pd.DataFrame:
-    """Handles missing values using MissingValueHandler and the specified strategy."""
+def handle_missing_values_step(
+    df: pd.DataFrame, strategy: str = "mean", copy: bool = True
+) -> Tuple[
+    Annotated[pd.DataFrame, "cleaned_data"],
+    Annotated[dict, ArtifactConfig(name="imputer_fill_values")],
+]:
+    """
+    Handles missing values using MissingValueHandler and the specified strategy.
+
+    Fill strategies are fitted once on `df`; their fill values are returned as a separate
+    artifact so the serving path can apply the same transform without recomputing them.
+    The artifact is empty for the 'drop' strategy. With copy=False, gaps are filled in the
+    input frame itself rather than in a copy.
+    """
 
     if strategy == "drop":
         handler = MissingValueHandler(DropMissingValuesStrategy(axis=0))
+        return handler.handle_missing_values(df), {}
     elif strategy in ["mean", "median", "mode", "constant"]:
-        handler = MissingValueHandler(FillMissingValuesStrategy(method=strategy))
+        imputer = FillMissingValuesStrategy(method=strategy, copy=copy).fit(df)
     else:
         raise ValueError(f"Unsupported missing value handling strategy: {strategy}")
 
-    cleaned_df = handler.handle_missing_values(df)
-    return cleaned_df
+    cleaned_df = imputer.transform(df)
+    return cleaned_df, imputer.to_dict()
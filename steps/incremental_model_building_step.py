@@ -0,0 +1,55 @@
+from typing import Annotated, Dict, List, Optional
+
+from sklearn.pipeline import Pipeline
+from src.ingest_data import DataIngestorFactory
+from src.model_building import IncrementalSGDStrategy
+from zenml import ArtifactConfig, Model, step
+
+model = Model(
+    name="price_predictor",
+    version=None,
+    license="Apache 2.0",
+    description="Price prediction model for houses.",
+)
+
+
+@step(enable_cache=False, model=model)
+def incremental_model_building_step(
+    file_path: str,
+    checkpoint_path: str,
+    target_column: str = "SalePrice",
+    columns: Optional[List[str]] = None,
+    schema: Optional[Dict[str, str]] = None,
+    chunksize: int = 100_000,
+    checkpoint_every: int = 10,
+    resume: bool = True,
+) -> Annotated[Pipeline, ArtifactConfig(name="sklearn_pipeline", is_model_artifact=True)]:
+    """
+    Trains an SGD regression model on a dataset larger than memory, one chunk at a time.
+
+    Chunks are streamed from disk and fed to IncrementalSGDStrategy, which checkpoints the
+    pipeline every `checkpoint_every` chunks. With `resume`, an interrupted run continues
+    after its last checkpoint, and a completed one is trained further on the rows of
+    `file_path`, so a nightly run only needs the newly arrived listings.
+
+    Parameters:
+    file_path (str): Path to the ZIP/CSV file, CSV shard directory or Parquet/Feather data.
+    checkpoint_path (str): The joblib file checkpoints are written to and resumed from.
+    target_column (str): The name of the target column.
+    columns (list): The columns to load, including the target; all columns are loaded if None.
+    schema (dict): Column name to dtype applied while parsing.
+    chunksize (int): The number of rows per chunk.
+    checkpoint_every (int): The number of chunks between checkpoints.
+    resume (bool): Whether to continue from the checkpoint at `checkpoint_path`.
+
+    Returns:
+    Pipeline: The trained pipeline, as the same "sklearn_pipeline" artifact as model_building_step.
+    """
+    data_ingestor = DataIngestorFactory.get_data_ingestor_for_path(file_path, columns=columns, schema=schema)
+
+    strategy = IncrementalSGDStrategy(checkpoint_path=checkpoint_path, checkpoint_every=checkpoint_every)
+    chunks = (
+        (chunk.drop(columns=[target_column]), chunk[target_column])
+        for chunk in data_ingestor.ingest_chunks(file_path, chunksize=chunksize)
+    )
+    return strategy.train_chunks(chunks, resume=resume)
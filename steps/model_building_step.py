@@ -1,14 +1,19 @@
 import logging
-from typing import Annotated
+from typing import Annotated, Optional
 
 import mlflow
+import numpy as np
 import pandas as pd
 from sklearn.base import RegressorMixin
-from sklearn.compose import ColumnTransformer
-from sklearn.impute import SimpleImputer
-from sklearn.linear_model import LinearRegression
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import OneHotEncoder
+from src.data_splitter import select_rows
+from src.model_building import (
+    CrossValidatedSearchStrategy,
+    HistGradientBoostingStrategy,
+    LinearRegressionStrategy,
+    WarmStartStrategy,
+    build_preprocessor,
+)
 from zenml import ArtifactConfig, step
 from zenml.client import Client
 
@@ -35,50 +40,65 @@ if tracker_name:
 
 @step(**step_kwargs)
 def model_building_step(
-    X_train: pd.DataFrame, y_train: pd.Series
+    X_train: Optional[pd.DataFrame] = None,
+    y_train: Optional[pd.Series] = None,
+    df: Optional[pd.DataFrame] = None,
+    train_indices: Optional[np.ndarray] = None,
+    target_column: str = "SalePrice",
+    strategy: str = "linear_regression",
+    n_jobs: int = -1,
+    warm_start: bool = False,
+    compare_with_cold: bool = False,
 ) -> Annotated[Pipeline, ArtifactConfig(name="sklearn_pipeline", is_model_artifact=True)]:
     """
-    Builds and trains a Linear Regression model using scikit-learn wrapped in a pipeline.
+    Builds and trains a price regression model using scikit-learn wrapped in a pipeline.
+
+    By default (strategy="linear_regression") this is a Linear Regression behind the
+    preprocessor. With strategy="cv_search", ridge, lasso and gradient-boosted tree candidates are
+    compared by 5-fold cross-validation in `n_jobs` processes (see CrossValidatedSearchStrategy)
+    and the best one is trained behind the same preprocessor. With
+    strategy="hist_gradient_boosting", a HistGradientBoostingRegressor with early stopping is
+    trained on ordinal-coded categoricals instead of one-hot columns (see
+    HistGradientBoostingStrategy).
+
+    With warm_start=True, the production version of the model is retrained instead: its fitted
+    preprocessor is reused if the columns are unchanged and its estimator continues from its
+    previous fit where supported (see WarmStartStrategy); otherwise, or without a production
+    version, `strategy` trains from scratch.
+
+    The training data is either passed as X_train/y_train, or as the full `df` and the
+    `train_indices` from data_index_splitter_step, in which case the rows are gathered here.
 
     Parameters:
     X_train (pd.DataFrame): The training data features.
     y_train (pd.Series): The training data labels/target.
+    df (pd.DataFrame): The full dataset, including the target column.
+    train_indices (np.ndarray): The positions of the training rows in `df`.
+    target_column (str): The name of the target column in `df`.
+    strategy (str): "linear_regression", "cv_search" or "hist_gradient_boosting".
+    n_jobs (int): The number of worker processes of the cross-validated search.
+    warm_start (bool): Whether to retrain the production model rather than start from scratch.
+    compare_with_cold (bool): With warm_start, also train from scratch and log the time saved.
 
     Returns:
-    Pipeline: The trained scikit-learn pipeline including preprocessing and the Linear Regression model.
+    Pipeline: The trained scikit-learn pipeline including preprocessing and the model chosen by
+        `strategy` (or the warm-started production model).
     """
+    if train_indices is not None:
+        X_train, y_train = select_rows(df, train_indices, target_column)
+
     # Ensure the inputs are of the correct type
     if not isinstance(X_train, pd.DataFrame):
         raise TypeError("X_train must be a pandas DataFrame.")
     if not isinstance(y_train, pd.Series):
         raise TypeError("y_train must be a pandas Series.")
 
-    # Identify categorical and numerical columns
-    categorical_cols = X_train.select_dtypes(include=["object", "category"]).columns
-    numerical_cols = X_train.select_dtypes(exclude=["object", "category"]).columns
-
-    logging.info(f"Categorical columns: {categorical_cols.tolist()}")
-    logging.info(f"Numerical columns: {numerical_cols.tolist()}")
-
-    # Define preprocessing for categorical and numerical features
-    numerical_transformer = SimpleImputer(strategy="mean")
-    categorical_transformer = Pipeline(
-        steps=[
-            ("imputer", SimpleImputer(strategy="most_frequent")),
-            ("onehot", OneHotEncoder(handle_unknown="ignore")),
-        ]
-    )
-
-    # Bundle preprocessing for numerical and categorical data
-    preprocessor = ColumnTransformer(
-        transformers=[
-            ("num", numerical_transformer, numerical_cols),
-            ("cat", categorical_transformer, categorical_cols),
-        ]
-    )
-
-    # Define the model training pipeline
-    pipeline = Pipeline(steps=[("preprocessor", preprocessor), ("model", LinearRegression())])
+    # Preprocessing of the numerical, categorical and already encoded sparse columns
+    preprocessor = build_preprocessor(X_train)
+    numerical_cols, categorical_cols, sparse_cols = (columns for _, _, columns in preprocessor.transformers)
+
+    if strategy not in ("linear_regression", "cv_search", "hist_gradient_boosting"):
+        raise ValueError(f"Unsupported model building strategy: {strategy}")
 
     # Start an MLflow run to log the model training process
     if not mlflow.active_run():
@@ -88,18 +108,50 @@ def model_building_step(
         # Enable autologging for scikit-learn to automatically capture model metrics, parameters, and artifacts
         mlflow.sklearn.autolog()
 
-        logging.info("Building and training the Linear Regression model.")
-        pipeline.fit(X_train, y_train)
-        logging.info("Model training completed.")
+        if strategy == "cv_search":
+            model_builder = CrossValidatedSearchStrategy(preprocessor=preprocessor, n_jobs=n_jobs)
+        elif strategy == "hist_gradient_boosting":
+            model_builder = HistGradientBoostingStrategy()
+        else:
+            model_builder = LinearRegressionStrategy(preprocessor=preprocessor)
+
+        previous_pipeline = _production_pipeline() if warm_start else None
+        if previous_pipeline is not None:
+            warm_start_strategy = WarmStartStrategy(
+                previous_pipeline, cold_strategy=model_builder, compare_with_cold=compare_with_cold
+            )
+            pipeline = warm_start_strategy.build_and_train_model(X_train, y_train)
+            mlflow.log_params(
+                {name: value for name, value in warm_start_strategy.report_.items() if isinstance(value, bool)}
+            )
+            mlflow.log_metrics(
+                {name: value for name, value in warm_start_strategy.report_.items() if isinstance(value, float)}
+            )
+        else:
+            logging.info(f"Building and training the model with the {strategy} strategy.")
+            pipeline = model_builder.build_and_train_model(X_train, y_train)
+
+        if isinstance(model_builder, CrossValidatedSearchStrategy) and model_builder.cv_results_ is not None:
+            best = model_builder.cv_results_.iloc[0]
+            mlflow.log_params({"best_candidate": best["candidate"], "best_params": best["params"]})
+            mlflow.log_metric("cv_mean_mse", float(best["mean_mse"]))
+        if strategy == "hist_gradient_boosting":
+            mlflow.log_metric("boosting_iterations", pipeline.named_steps["model"].n_iter_)
 
         # Log the columns that the model expects
-        onehot_encoder = (
-            pipeline.named_steps["preprocessor"].transformers_[1][1].named_steps["onehot"]
-        )
-        onehot_encoder.fit(X_train[categorical_cols])
-        expected_columns = numerical_cols.tolist() + list(
-            onehot_encoder.get_feature_names_out(categorical_cols)
-        )
+        fitted_preprocessor = pipeline.named_steps["preprocessor"]
+        categorical_transformer = getattr(fitted_preprocessor, "named_transformers_", {}).get("cat")
+        if isinstance(categorical_transformer, Pipeline) and len(categorical_cols):
+            # Read from the fitted encoder without refitting it, as it may be reused from production
+            onehot_encoder = categorical_transformer.named_steps["onehot"]
+            expected_columns = (
+                numerical_cols.tolist()
+                + list(onehot_encoder.get_feature_names_out(categorical_cols))
+                + sparse_cols.tolist()
+            )
+        else:
+            # No one-hot expansion: one ordinal code (or hashed) input per categorical feature
+            expected_columns = categorical_cols.tolist() + numerical_cols.tolist() + sparse_cols.tolist()
         logging.info(f"Model expects the following columns: {expected_columns}")
 
     except Exception as e:
@@ -111,3 +163,12 @@ def model_building_step(
         mlflow.end_run()
 
     return pipeline
+
+
+def _production_pipeline() -> Optional[Pipeline]:
+    """Returns the production version's trained pipeline, or None if there is none yet."""
+    try:
+        return Model(name="price_predictor", version="production").load_artifact("sklearn_pipeline")
+    except Exception as e:
+        logging.warning(f"No production model to warm-start from ({e}); training from scratch.")
+        return None
@@ -1,28 +1,44 @@
 import logging
-from typing import Tuple
+from typing import Optional, Tuple
 
 import mlflow
+import numpy as np
 import pandas as pd
 from sklearn.pipeline import Pipeline
+from src.data_splitter import select_rows
 from src.model_evaluator import ModelEvaluator, RegressionModelEvaluationStrategy
 from zenml import step
 
 
 @step(enable_cache=False)
 def model_evaluator_step(
-    trained_model: Pipeline, X_test: pd.DataFrame, y_test: pd.Series
+    trained_model: Pipeline,
+    X_test: Optional[pd.DataFrame] = None,
+    y_test: Optional[pd.Series] = None,
+    df: Optional[pd.DataFrame] = None,
+    test_indices: Optional[np.ndarray] = None,
+    target_column: str = "SalePrice",
 ) -> Tuple[dict, float]:
     """
     Evaluates the trained model using ModelEvaluator and RegressionModelEvaluationStrategy.
 
+    The test data is either passed as X_test/y_test, or as the full `df` and the
+    `test_indices` from data_index_splitter_step, in which case the rows are gathered here.
+
     Parameters:
     trained_model (Pipeline): The trained pipeline containing the model and preprocessing steps.
     X_test (pd.DataFrame): The test data features.
     y_test (pd.Series): The test data labels/target.
+    df (pd.DataFrame): The full dataset, including the target column.
+    test_indices (np.ndarray): The positions of the test rows in `df`.
+    target_column (str): The name of the target column in `df`.
 
     Returns:
     dict: A dictionary containing evaluation metrics.
     """
+    if test_indices is not None:
+        X_test, y_test = select_rows(df, test_indices, target_column)
+
     # Ensure the inputs are of the correct type
     if not isinstance(X_test, pd.DataFrame):
         raise TypeError("X_test must be a pandas DataFrame.")
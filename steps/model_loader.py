@@ -1,3 +1,5 @@
+from typing import Any
+
 from sklearn.pipeline import Pipeline
 from zenml import Model, step
 
@@ -20,3 +22,20 @@ def model_loader(model_name: str) -> Pipeline:
     model_pipeline: Pipeline = model.load_artifact("sklearn_pipeline")
 
     return model_pipeline
+
+
+@step(enable_cache=False)
+def model_artifact_loader(model_name: str, artifact_name: str) -> Any:
+    """
+    Loads another artifact linked to the current production model, e.g. the fitted
+    imputer fill values ("imputer_fill_values") that the serving path applies.
+
+    Args:
+        model_name: Name of the Model the artifact belongs to.
+        artifact_name: Name of the artifact to load.
+
+    Returns:
+        Any: The loaded artifact.
+    """
+    model = Model(name=model_name, version="production")
+    return model.load_artifact(artifact_name)
@@ -1,13 +1,29 @@
 import logging
 
 import pandas as pd
-from src.outlier_detection import OutlierDetector, ZScoreOutlierDetection
+from src.multivariate_outlier_detection import (
+    IsolationForestOutlierDetection,
+    RobustCovarianceOutlierDetection,
+)
+from src.outlier_detection import IQROutlierDetection, OutlierDetector, ZScoreOutlierDetection
 from zenml import step
 
 
 @step
-def outlier_detection_step(df: pd.DataFrame, column_name: str) -> pd.DataFrame:
-    """Detects and removes outliers using OutlierDetector."""
+def outlier_detection_step(
+    df: pd.DataFrame, column_name: str, strategy: str = "zscore", n_jobs: int = -1
+) -> pd.DataFrame:
+    """
+    Detects and removes outliers using OutlierDetector and the selected strategy.
+
+    Outlier rows are found on the numeric columns and removed from the full frame, so any
+    non-numeric columns the caller passes in are returned as well (e.g. the categorical
+    columns ml_pipeline loads with categorical_features=True).
+
+    'zscore' and 'iqr' remove a row if any single column is extreme; 'isolation_forest' and
+    'robust_covariance' judge each row on all numeric columns together, scoring row batches
+    on `n_jobs` cores.
+    """
     logging.info(f"Starting outlier detection step with DataFrame of shape: {df.shape}")
 
     if df is None:
@@ -21,10 +37,20 @@ def outlier_detection_step(df: pd.DataFrame, column_name: str) -> pd.DataFrame:
     if column_name not in df.columns:
         logging.error(f"Column '{column_name}' does not exist in the DataFrame.")
         raise ValueError(f"Column '{column_name}' does not exist in the DataFrame.")
-        # Ensure only numeric columns are passed
-    df_numeric = df.select_dtypes(include=[int, float])
+    # Outliers are detected on the numeric columns only
+    numeric_columns = df.select_dtypes(include="number").columns
+
+    if strategy == "zscore":
+        outlier_detector = OutlierDetector(ZScoreOutlierDetection(threshold=3))
+    elif strategy == "iqr":
+        outlier_detector = OutlierDetector(IQROutlierDetection())
+    elif strategy == "isolation_forest":
+        outlier_detector = OutlierDetector(IsolationForestOutlierDetection(n_jobs=n_jobs))
+    elif strategy == "robust_covariance":
+        outlier_detector = OutlierDetector(RobustCovarianceOutlierDetection(n_jobs=n_jobs))
+    else:
+        raise ValueError(f"Unsupported outlier detection strategy: {strategy}")
 
-    outlier_detector = OutlierDetector(ZScoreOutlierDetection(threshold=3))
-    outliers = outlier_detector.detect_outliers(df_numeric)
-    df_cleaned = outlier_detector.handle_outliers(df_numeric, method="remove")
+    # The row mask is applied to the full frame by position, so non-numeric columns are kept
+    df_cleaned = outlier_detector.handle_outliers(df, method="remove", columns=numeric_columns)
     return df_cleaned
@@ -2,7 +2,9 @@ import json
 
 import numpy as np
 import pandas as pd
-from typing import Any
+from typing import Any, Optional
+from src.feature_engineering import CompositeFeatureEngineering, FeatureEngineeringStrategy
+from src.handle_missing_values import FillMissingValuesStrategy
 from zenml import step
 
 
@@ -10,12 +12,19 @@ from zenml import step
 def predictor(
     service: Any,
     input_data: str,
+    fill_values: Optional[dict] = None,
+    feature_engineering_state: Optional[dict] = None,
 ) -> np.ndarray:
     """Run an inference request against a prediction service.
 
     Args:
         service (MLFlowDeploymentService): The deployed MLFlow service for prediction.
         input_data (str): The input data as a JSON string.
+        fill_values (dict): Optional fitted imputer state from the training pipeline's
+            `imputer_fill_values` artifact; missing inputs are filled with it first.
+        feature_engineering_state (dict): Optional fitted feature engineering strategy from
+            the training pipeline's `feature_engineering_state` artifact; it is applied
+            transform-only, without refitting on the request.
 
     Returns:
         np.ndarray: The model's prediction.
@@ -76,6 +85,19 @@ def predictor(
     # Convert the data into a DataFrame with the correct columns
     df = pd.DataFrame(data["data"], columns=expected_columns)
 
+    # Fill gaps with the training-time fill values instead of recomputing them from the request
+    if fill_values:
+        df = FillMissingValuesStrategy.from_dict(fill_values).transform(df)
+
+    # Apply the training-time feature engineering; transformations of columns the request does
+    # not carry (e.g. the log of the SalePrice target) do not apply to it
+    if feature_engineering_state:
+        strategy = FeatureEngineeringStrategy.from_dict(feature_engineering_state)
+        strategies = strategy.strategies if isinstance(strategy, CompositeFeatureEngineering) else [strategy]
+        applicable = [s for s in strategies if set(s.features) <= set(df.columns)]
+        if applicable:
+            df = CompositeFeatureEngineering(applicable).transform(df)
+
     # Convert DataFrame to JSON list for prediction
     json_list = json.loads(json.dumps(list(df.T.to_dict().values())))
     data_array = np.array(json_list)
@@ -0,0 +1,47 @@
+import json
+import os
+from typing import Any, Type
+
+import pandas as pd
+import scipy.sparse as sp
+from src.feature_engineering import sparse_frame, sparse_frame_to_csr
+from zenml.enums import ArtifactType
+from zenml.materializers.base_materializer import BaseMaterializer
+
+DENSE_FILENAME = "dense.parquet"
+SPARSE_FILENAME = "sparse.npz"
+COLUMNS_FILENAME = "columns.json"
+
+
+class SparseDataFrameMaterializer(BaseMaterializer):
+    """
+    Stores DataFrames that may hold pandas sparse columns (e.g. from OneHotEncoding(sparse=True)
+    or FeatureHashing), which Parquet cannot: the dense columns go to a Parquet file and the
+    sparse ones to a single CSR matrix in scipy's .npz format, so they stay sparse on disk and
+    when the next step loads them.
+    """
+
+    ASSOCIATED_TYPES = (pd.DataFrame,)
+    ASSOCIATED_ARTIFACT_TYPE = ArtifactType.DATA
+
+    def load(self, data_type: Type[Any]) -> pd.DataFrame:
+        with self.artifact_store.open(os.path.join(self.uri, COLUMNS_FILENAME), "r") as f:
+            layout = json.load(f)
+        with self.artifact_store.open(os.path.join(self.uri, DENSE_FILENAME), "rb") as f:
+            df = pd.read_parquet(f)
+        if layout["sparse_columns"]:
+            with self.artifact_store.open(os.path.join(self.uri, SPARSE_FILENAME), "rb") as f:
+                matrix = sp.load_npz(f)
+            sparse_df = sparse_frame(matrix, layout["sparse_columns"], df.index)
+            df = pd.concat([df, sparse_df], axis=1)[layout["columns"]]
+        return df
+
+    def save(self, data: pd.DataFrame) -> None:
+        sparse_columns = [column for column in data.columns if isinstance(data[column].dtype, pd.SparseDtype)]
+        with self.artifact_store.open(os.path.join(self.uri, COLUMNS_FILENAME), "w") as f:
+            json.dump({"columns": list(data.columns), "sparse_columns": sparse_columns}, f)
+        with self.artifact_store.open(os.path.join(self.uri, DENSE_FILENAME), "wb") as f:
+            data.drop(columns=sparse_columns).to_parquet(f)
+        if sparse_columns:
+            with self.artifact_store.open(os.path.join(self.uri, SPARSE_FILENAME), "wb") as f:
+                sp.save_npz(f, sparse_frame_to_csr(data[sparse_columns]))
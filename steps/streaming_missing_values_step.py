@@ -0,0 +1,51 @@
+from typing import Annotated, Dict, List, Optional, Tuple
+
+from src.handle_missing_values import StreamingFillMissingValuesStrategy
+from src.ingest_data import DataIngestorFactory, write_parquet_chunks
+from zenml import ArtifactConfig, step
+
+
+@step
+def streaming_missing_values_step(
+    file_path: str,
+    output_path: str,
+    strategy: str = "mean",
+    columns: Optional[List[str]] = None,
+    schema: Optional[Dict[str, str]] = None,
+    chunksize: int = 100_000,
+    relative_accuracy: float = 0.01,
+) -> Tuple[
+    Annotated[str, "cleaned_data_path"],
+    Annotated[dict, ArtifactConfig(name="imputer_fill_values")],
+]:
+    """
+    Handles missing values of a dataset larger than memory, streaming it from disk twice.
+
+    The first pass fits a StreamingFillMissingValuesStrategy (exact means and modes,
+    sketched medians); the second fills each chunk and appends it to a Parquet file. Only
+    one chunk is held in memory at a time.
+
+    Parameters:
+    file_path (str): Path to the ZIP/CSV file, CSV shard directory or Parquet/Feather data.
+    output_path (str): The Parquet file to write the cleaned data to.
+    strategy (str): 'mean', 'median', 'mode' or 'constant'.
+    columns (list): The columns to load; all columns are loaded if None.
+    schema (dict): Column name to dtype applied while parsing.
+    chunksize (int): The number of rows per chunk.
+    relative_accuracy (float): The relative error bound of median estimates.
+
+    Returns:
+    str: The cleaned Parquet file.
+    dict: The fitted fill values, as from FillMissingValuesStrategy.to_dict.
+    """
+    if strategy not in ["mean", "median", "mode", "constant"]:
+        raise ValueError(f"Unsupported streaming missing value handling strategy: {strategy}")
+
+    data_ingestor = DataIngestorFactory.get_data_ingestor_for_path(file_path, columns=columns, schema=schema)
+
+    imputer = StreamingFillMissingValuesStrategy(method=strategy, relative_accuracy=relative_accuracy)
+    imputer.fit_chunks(data_ingestor.ingest_chunks(file_path, chunksize=chunksize))
+
+    cleaned_chunks = imputer.transform_chunks(data_ingestor.ingest_chunks(file_path, chunksize=chunksize))
+    write_parquet_chunks(cleaned_chunks, output_path)
+    return output_path, imputer.to_dict()
@@ -0,0 +1,61 @@
+from typing import Annotated, Dict, List, Optional, Tuple
+
+from src.ingest_data import DataIngestorFactory, write_parquet_chunks
+from src.outlier_detection import StreamingIQROutlierDetection, StreamingZScoreOutlierDetection
+from zenml import ArtifactConfig, step
+
+
+@step
+def streaming_outlier_detection_step(
+    file_path: str,
+    output_path: str,
+    strategy: str = "zscore",
+    columns: Optional[List[str]] = None,
+    schema: Optional[Dict[str, str]] = None,
+    chunksize: int = 100_000,
+    threshold: float = 3,
+    relative_accuracy: float = 0.01,
+) -> Tuple[
+    Annotated[str, "outlier_free_data_path"],
+    Annotated[dict, ArtifactConfig(name="outlier_statistics")],
+]:
+    """
+    Removes outlier rows from a dataset larger than memory, streaming it from disk twice.
+
+    The first pass fits the per-column statistics of a streaming outlier strategy (exact
+    Welford moments for 'zscore', quartile sketches for 'iqr'); the second drops the rows
+    outside the fitted bounds from each chunk and appends the rest to a Parquet file. Only
+    one chunk is held in memory at a time, and non-numeric columns are kept.
+
+    Parameters:
+    file_path (str): Path to the ZIP/CSV file, CSV shard directory or Parquet/Feather data.
+    output_path (str): The Parquet file to write the outlier-free data to.
+    strategy (str): 'zscore' or 'iqr'.
+    columns (list): The columns to load; all columns are loaded if None.
+    schema (dict): Column name to dtype applied while parsing.
+    chunksize (int): The number of rows per chunk.
+    threshold (float): The z-score threshold of the 'zscore' strategy.
+    relative_accuracy (float): The relative error bound of the 'iqr' quartile estimates.
+
+    Returns:
+    str: The outlier-free Parquet file.
+    dict: The fitted statistics, as from StreamingOutlierDetectionStrategy.to_dict, to apply
+        the same bounds at serve time.
+    """
+    if strategy == "zscore":
+        detector = StreamingZScoreOutlierDetection(threshold=threshold)
+    elif strategy == "iqr":
+        detector = StreamingIQROutlierDetection(relative_accuracy=relative_accuracy)
+    else:
+        raise ValueError(f"Unsupported streaming outlier detection strategy: {strategy}")
+
+    data_ingestor = DataIngestorFactory.get_data_ingestor_for_path(file_path, columns=columns, schema=schema)
+
+    detector.fit_chunks(data_ingestor.ingest_chunks(file_path, chunksize=chunksize))
+
+    outlier_free_chunks = (
+        chunk[~detector.detect_outlier_rows(chunk)]
+        for chunk in data_ingestor.ingest_chunks(file_path, chunksize=chunksize)
+    )
+    write_parquet_chunks(outlier_free_chunks, output_path)
+    return output_path, detector.to_dict()
@@ -0,0 +1,49 @@
+# Import necessary libraries
+import copy
+
+import numpy as np
+import pandas as pd
+from src.model_building import HistGradientBoostingStrategy, WarmStartStrategy
+
+# Load the dataset, with half of the sales as the new data to retrain on
+data_path = "data/AmesHousing.csv"
+df = pd.read_csv(data_path)
+df = df.dropna(subset=["SalePrice"])
+X, y = df.drop(columns=["SalePrice", "Order", "PID"]), np.log(df["SalePrice"])
+X_new, y_new = X.sample(frac=0.5, random_state=0), y.sample(frac=0.5, random_state=0)
+cold_strategy = HistGradientBoostingStrategy(max_iter=50)
+previous = cold_strategy.build_and_train_model(X, y)
+previous_snapshot = copy.deepcopy(previous)
+
+# Step 1: Same schema
+# The fitted preprocessor is reused and boosting continues from the previous trees
+strategy = WarmStartStrategy(previous, cold_strategy, max_new_iter=10)
+retrained = strategy.build_and_train_model(X_new, y_new)
+assert strategy.report_["preprocessor_reused"] and strategy.report_["warm_started"]
+assert retrained.named_steps["preprocessor"] is not previous.named_steps["preprocessor"]
+previous_trees = previous.named_steps["model"].n_iter_
+assert previous_trees < retrained.named_steps["model"].n_iter_ <= previous_trees + 10
+np.testing.assert_array_equal(
+    retrained.named_steps["preprocessor"].transform(X_new), previous.named_steps["preprocessor"].transform(X_new)
+)
+
+# Step 2: The previous pipeline is left as it was, e.g. for serving during the retrain
+assert previous.named_steps["model"].n_iter_ == previous_snapshot.named_steps["model"].n_iter_
+np.testing.assert_array_equal(previous.predict(X), previous_snapshot.predict(X))
+
+# Step 3: Changed schema
+# A dropped or added column falls back to training a new pipeline with the cold strategy
+for X_changed in (X_new.drop(columns=["Gr Liv Area"]), X_new.assign(**{"Total SF": X_new["Gr Liv Area"] * 2})):
+    strategy = WarmStartStrategy(previous, cold_strategy)
+    retrained = strategy.build_and_train_model(X_changed, y_new)
+    assert not strategy.report_["preprocessor_reused"] and not strategy.report_["warm_started"]
+    np.testing.assert_array_equal(
+        retrained.predict(X_changed), cold_strategy.build_and_train_model(X_changed, y_new).predict(X_changed)
+    )
+
+# Step 4: The comparison run reports the time saved against cold training
+strategy = WarmStartStrategy(previous, cold_strategy, compare_with_cold=True)
+strategy.build_and_train_model(X_new, y_new)
+report = strategy.report_
+assert report["time_saved_seconds"] == report["cold_fit_seconds"] - report["fit_seconds"]
+print("Warm-start retraining reuses the previous pipeline only when the schema is unchanged.")